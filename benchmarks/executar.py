@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+from pathlib import Path
+from random import Random
+from timeit import Timer
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+# pylint: disable=wrong-import-position
+from tr0nz0d.security.pswd import Pass
+from tr0nz0d.tools.cnpj import CNPJ
+from tr0nz0d.tools.cpf import CPF
+from tr0nz0d.tools.documento import Documento
+from tr0nz0d.tools.math_tools import DatetimeTools, MathTools, UnitsOfMeasurement
+
+REFERENCIA_PADRAO = Path(__file__).with_name('referencia.json')
+TAMANHOS = (1000, 10000, 100000)
+TAMANHOS_SENHA = (8, 32, 128)
+SEED = 2024
+
+
+class Caso(NamedTuple):
+    """Um caminho medido com um tamanho de entrada
+
+    `preparar` monta a entrada fora da medição e `executar` processa a entrada inteira;
+    `itens` é a quantidade de itens processados por execução.
+    """
+    nome: str
+    itens: int
+    preparar: Callable[[], Any]
+    executar: Callable[[Any], Any]
+
+    @property
+    def chave(self) -> str:
+        """Identificador do caso nos arquivos de resultado"""
+        return f'{self.nome}[{self.itens}]'
+
+
+def _cpfs(quantidade: int) -> List[str]:
+    gerador = Random(SEED)
+    cpfs = CPF().gerar_lote(quantidade, seed=SEED)
+    return [CPF().formatar(cpf) if gerador.random() < 0.5 else cpf for cpf in cpfs]
+
+
+def _cnpjs(quantidade: int) -> List[str]:
+    return list(CNPJ().gerar_unicos(quantidade, seed=SEED, formatado=True))
+
+
+def _conversoes(quantidade: int) -> List[tuple]:
+    gerador = Random(SEED)
+    grupos: Dict[Any, List[UnitsOfMeasurement]] = {}
+    for unidade in UnitsOfMeasurement:
+        grupos.setdefault(unidade.group(), []).append(unidade)
+
+    unidades = list(UnitsOfMeasurement)
+    ferramentas = MathTools()
+    conversoes = []
+    for _ in range(quantidade):
+        origem = gerador.choice(unidades)
+        destino = gerador.choice(grupos[origem.group()])
+        conversoes.append((ferramentas.build_unit(origem, gerador.uniform(0, 1000)), destino))
+    return conversoes
+
+
+def _registros(quantidade: int) -> List[tuple]:
+    gerador = Random(SEED)
+    unidades = list(UnitsOfMeasurement)
+    return [(gerador.choice(unidades), gerador.uniform(0, 1000)) for _ in range(quantidade)]
+
+
+def _medidas(quantidade: int) -> List[str]:
+    gerador = Random(SEED)
+    simbolos = ('km', 'ft', 'mph', 'kg', 'm/s', 'l', 'gal', 'sq ft', 'm²', 'h')
+    return [f'{gerador.uniform(0, 1000):.2f} {gerador.choice(simbolos)}'
+            for _ in range(quantidade)]
+
+
+def _pares_datas(quantidade: int) -> tuple:
+    gerador = Random(SEED)
+    return ([gerador.randrange(0, 2_000_000_000) for _ in range(quantidade)],
+            [gerador.randrange(0, 2_000_000_000) for _ in range(quantidade)])
+
+
+# Laço em Python puro medido antes dos casos; a vazão de cada caso é registrada em
+# relação a ele, para que a referência valha em máquinas de velocidades diferentes
+CALIBRACAO = Caso('calibracao', 10000, lambda: list(range(10000)),
+                  lambda dados: sorted(str(valor) for valor in dados))
+
+
+def casos() -> List[Caso]:
+    """Lista todos os casos medidos pela suíte"""
+    cpf, cnpj, documento, senha = CPF(), CNPJ(), Documento(), Pass()
+    ferramentas = MathTools()
+    lista: List[Caso] = []
+
+    for tamanho in TAMANHOS:
+        lista += [
+            Caso('cpf.validar', tamanho, lambda n=tamanho: _cpfs(n),
+                 lambda dados: [cpf.validar(valor) for valor in dados]),
+            Caso('cpf.validar_lote', tamanho, lambda n=tamanho: _cpfs(n), cpf.validar_lote),
+            Caso('cnpj.validar', tamanho, lambda n=tamanho: _cnpjs(n),
+                 lambda dados: [cnpj.validar(valor) for valor in dados]),
+            Caso('cnpj.validar_lote', tamanho, lambda n=tamanho: _cnpjs(n), cnpj.validar_lote),
+            Caso('documento.validar_lote', tamanho,
+                 lambda n=tamanho: _cpfs(n // 2) + _cnpjs(n - n // 2), documento.validar_lote),
+            Caso('convert_to', tamanho, lambda n=tamanho: _conversoes(n),
+                 lambda dados: [unidade.convert_to(destino) for unidade, destino in dados]),
+            Caso('convert_to.exato', tamanho, lambda n=tamanho: _conversoes(n),
+                 lambda dados: [unidade.convert_to(destino, exact=True)
+                                for unidade, destino in dados]),
+            Caso('convert_stream', tamanho, lambda n=tamanho: _registros(n),
+                 lambda dados: list(ferramentas.convert_stream(dados))),
+            Caso('parse_many', tamanho, lambda n=tamanho: _medidas(n), ferramentas.parse_many),
+            Caso('calc_date_difs', tamanho, lambda n=tamanho: _pares_datas(n),
+                 lambda dados, calcular=DatetimeTools().calc_date_difs: calcular(*dados)),
+        ]
+
+    for comprimento in TAMANHOS_SENHA:
+        lista.append(Caso('pass.gerar', comprimento, lambda n=comprimento: n, senha.gerar))
+
+    return lista
+
+
+def medir(caso: Caso, repeticoes: int, tempo_minimo: float) -> Dict[str, float]:
+    """ Mede o tempo mediano de uma execução do caso
+
+    Cada repetição executa o caso quantas vezes forem necessárias para durar ao menos
+    `tempo_minimo` segundos; a mediana dos tempos médios das repetições é o resultado.
+
+    Args:
+        caso (Caso): Caso a ser medido
+        repeticoes (int): Quantidade de repetições
+        tempo_minimo (float): Duração mínima de cada repetição em segundos
+
+    Returns:
+        Dict[str, float]: Itens, segundos por execução e itens por segundo
+    """
+    dados = caso.preparar()
+    cronometro = Timer(lambda: caso.executar(dados))
+
+    execucoes = 1
+    while (duracao := cronometro.timeit(execucoes)) < tempo_minimo:
+        execucoes *= 2 if duracao <= 0 else max(2, int(tempo_minimo / duracao) + 1)
+
+    segundos = statistics.median(cronometro.repeat(repeticoes, execucoes)) / execucoes
+    return {'itens': caso.itens,
+            'segundos': segundos,
+            'itens_por_segundo': caso.itens / segundos}
+
+
+def comparar(resultados: Dict[str, Dict[str, float]],
+             referencia: Dict[str, Dict[str, float]],
+             limite: float) -> List[str]:
+    """ Compara a vazão relativa à calibração dos resultados com a referência armazenada
+
+    Args:
+        resultados (Dict[str, Dict[str, float]]): Resultados da execução atual
+        referencia (Dict[str, Dict[str, float]]): Resultados de referência
+        limite (float): Queda de vazão tolerada, em fração da referência
+
+    Returns:
+        List[str]: Uma descrição para cada caso com queda acima do limite
+    """
+    regressoes = []
+    for chave, resultado in resultados.items():
+        # Referências gravadas antes da calibração não têm a vazão relativa
+        if 'vazao_relativa' not in referencia.get(chave, {}):
+            continue
+
+        esperado = referencia[chave]['vazao_relativa']
+        variacao = resultado['vazao_relativa'] / esperado - 1
+        if variacao < -limite:
+            regressoes.append(f'{chave}: vazão relativa {resultado["vazao_relativa"]:.4g}, '
+                              f'{variacao:+.1%} em relação a {esperado:.4g}')
+    return regressoes
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Ponto de entrada da linha de comando da suíte de benchmarks"""
+    parser = argparse.ArgumentParser(
+        description='Mede a vazão dos caminhos críticos do tr0nz0d e detecta regressões.')
+    parser.add_argument('--filtro', default='',
+                        help='Executa apenas os casos cujo nome contém o texto')
+    parser.add_argument('--saida', type=Path, help='Arquivo JSON que recebe os resultados')
+    parser.add_argument('--referencia', type=Path, default=REFERENCIA_PADRAO,
+                        help='Arquivo JSON com os resultados de referência')
+    parser.add_argument('--limite', type=float, default=0.5,
+                        help='Queda de vazão tolerada em relação à referência (0.5 = 50%%)')
+    parser.add_argument('--repeticoes', type=int, default=11,
+                        help='Quantidade de repetições de cada caso')
+    parser.add_argument('--tempo-minimo', type=float, default=0.2,
+                        help='Duração mínima de cada repetição em segundos')
+    parser.add_argument('--atualizar-referencia', action='store_true',
+                        help='Grava os resultados como a nova referência')
+    args = parser.parse_args(argv)
+
+    calibracao = medir(CALIBRACAO, args.repeticoes, args.tempo_minimo)
+    print(f'{CALIBRACAO.chave:<32} {calibracao["itens_por_segundo"]:>16,.0f} itens/s')
+
+    resultados = {}
+    for caso in casos():
+        if args.filtro not in caso.chave:
+            continue
+        resultado = medir(caso, args.repeticoes, args.tempo_minimo)
+        resultado['vazao_relativa'] = (resultado['itens_por_segundo']
+                                       / calibracao['itens_por_segundo'])
+        resultados[caso.chave] = resultado
+        print(f'{caso.chave:<32} {resultado["itens_por_segundo"]:>16,.0f} itens/s '
+              f'{resultado["vazao_relativa"]:>10.4g}x')
+
+    relatorio = {'python': platform.python_version(),
+                 'plataforma': platform.platform(),
+                 'calibracao': calibracao,
+                 'resultados': resultados}
+    if args.saida is not None:
+        args.saida.write_text(json.dumps(relatorio, indent=2) + '\n', encoding='utf-8')
+
+    if args.atualizar_referencia:
+        # Casos fora do filtro mantêm a referência anterior
+        if args.referencia.exists():
+            anteriores = json.loads(args.referencia.read_text(encoding='utf-8'))['resultados']
+            relatorio['resultados'] = {**anteriores, **resultados}
+        args.referencia.write_text(json.dumps(relatorio, indent=2) + '\n', encoding='utf-8')
+        return 0
+
+    if not args.referencia.exists():
+        print(f'Referência não encontrada: {args.referencia}')
+        return 0
+
+    referencia = json.loads(args.referencia.read_text(encoding='utf-8'))['resultados']
+    regressoes = comparar(resultados, referencia, args.limite)
+    for regressao in regressoes:
+        print(f'REGRESSÃO {regressao}')
+    return 1 if regressoes else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+
+import argparse
+import json
+import sys
+from fractions import Fraction
+from pathlib import Path
+from random import Random
+from typing import Any, Dict, List, Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+# pylint: disable=wrong-import-position
+from executar import SEED, Caso, medir
+from tr0nz0d.tools.math_tools import MathTools, UnitsOfMeasurement
+
+# Cadeia de conversões aplicada a cada leitura, voltando à unidade de origem
+CADEIA = (UnitsOfMeasurement.liter, UnitsOfMeasurement.gallon,
+          UnitsOfMeasurement.cubic_foot, UnitsOfMeasurement.cubic_inch,
+          UnitsOfMeasurement.liter)
+
+
+def _leituras(quantidade: int) -> List[str]:
+    """Leituras de volume em litros com três casas decimais, como chegam na cobrança"""
+    gerador = Random(SEED)
+    return [f'{gerador.uniform(0, 10000):.3f}' for _ in range(quantidade)]
+
+
+def converter(leituras: Sequence[Any], exato: bool) -> List[Any]:
+    """ Aplica a cadeia de conversões a todas as leituras
+
+    Args:
+        leituras (Sequence[Any]): Leituras em litros
+        exato (bool): Usa os fatores exatos
+
+    Returns:
+        List[Any]: As leituras convertidas de volta para litros
+    """
+    ferramentas = MathTools()
+    valores = list(leituras)
+    for origem, destino in zip(CADEIA, CADEIA[1:]):
+        fator = ferramentas.conversion_factor(origem, destino, exact=exato)
+        valores = [valor * fator for valor in valores]
+    return valores
+
+
+def erros(leituras: Sequence[str]) -> Dict[str, float]:
+    """ Compara o modo float com o exato após a cadeia de conversões
+
+    Args:
+        leituras (Sequence[str]): Leituras em litros
+
+    Returns:
+        Dict[str, float]: Erros relativos máximo e médio por leitura, erro absoluto do
+            total em litros e fração de leituras que não voltaram ao valor original
+    """
+    exatos = [Fraction(leitura) for leitura in leituras]
+    aproximados = converter([float(leitura) for leitura in leituras], exato=False)
+
+    relativos = [abs(Fraction(aproximado) - exato) / exato
+                 for aproximado, exato in zip(aproximados, exatos) if exato]
+    return {'erro_relativo_maximo': float(max(relativos, default=0)),
+            'erro_relativo_medio': float(sum(relativos) / len(relativos)) if relativos else 0.0,
+            'erro_absoluto_total': float(abs(sum(map(Fraction, aproximados)) - sum(exatos))),
+            'leituras_divergentes': sum(map(bool, relativos)) / len(relativos)
+                                    if relativos else 0.0}
+
+
+def divergencias_exatas(leituras: Sequence[str]) -> List[str]:
+    """ Verifica que o modo exato devolve cada leitura ao seu valor original
+
+    Args:
+        leituras (Sequence[str]): Leituras em litros
+
+    Returns:
+        List[str]: Uma descrição para cada leitura que não voltou ao valor original
+    """
+    exatos = [Fraction(leitura) for leitura in leituras]
+    return [f'exato[{indice}]: {leitura} l voltou como {float(convertido)!r} l'
+            for indice, (leitura, exato, convertido)
+            in enumerate(zip(leituras, exatos, converter(exatos, exato=True)))
+            if convertido != exato]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Ponto de entrada da comparação entre os modos float e exato"""
+    parser = argparse.ArgumentParser(
+        description='Compara vazão e erro das conversões em modo float e em modo exato.')
+    parser.add_argument('--quantidade', type=int, default=10000,
+                        help='Quantidade de leituras convertidas')
+    parser.add_argument('--saida', type=Path, help='Arquivo JSON que recebe os resultados')
+    parser.add_argument('--repeticoes', type=int, default=5,
+                        help='Quantidade de repetições de cada modo')
+    parser.add_argument('--tempo-minimo', type=float, default=0.2,
+                        help='Duração mínima de cada repetição em segundos')
+    args = parser.parse_args(argv)
+
+    leituras = _leituras(args.quantidade)
+    conversoes = args.quantidade * (len(CADEIA) - 1)
+    casos = [
+        Caso('float', conversoes, lambda: [float(leitura) for leitura in leituras],
+             lambda dados: converter(dados, exato=False)),
+        Caso('exato', conversoes, lambda: [Fraction(leitura) for leitura in leituras],
+             lambda dados: converter(dados, exato=True)),
+    ]
+
+    resultados: Dict[str, Any] = {}
+    for caso in casos:
+        resultados[caso.nome] = medir(caso, args.repeticoes, args.tempo_minimo)
+        print(f'{caso.nome:<8} {resultados[caso.nome]["itens_por_segundo"]:>16,.0f} conversões/s')
+
+    resultados['erro_float'] = erros(leituras)
+    for nome, valor in resultados['erro_float'].items():
+        print(f'{nome:<24} {valor:.3e}')
+
+    if args.saida is not None:
+        args.saida.write_text(json.dumps(resultados, indent=2) + '\n', encoding='utf-8')
+
+    divergencias = divergencias_exatas(leituras)
+    for divergencia in divergencias:
+        print(f'DIVERGÊNCIA {divergencia}')
+    return 1 if divergencias else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
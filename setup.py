@@ -66,6 +66,14 @@ setup(
     package_dir={"": "src"},
     setup_requires=requirements,
     install_requires=requirements,
+    extras_require={
+        'numpy': ['numpy']
+    },
+    entry_points={
+        'console_scripts': [
+            'tr0nz0d-validar=tr0nz0d.tools.validacao_arquivo:main'
+        ]
+    },
     tests_require=["unittest"],
     python_requires='>=3.10',
     license="MIT",
@@ -26,8 +26,17 @@ DEALINGS IN THE SOFTWARE.
 Created by: Gabriel Menezes de Antonio (TR0NZ0D)
 """
 import unittest
+from array import array
+from datetime import datetime, timedelta
+from decimal import Decimal
+from fractions import Fraction
+from unittest import mock
 
-from tr0nz0d.tools.math_tools import (DatetimeTools, MathTools,
+from dateutil.relativedelta import relativedelta
+
+from tr0nz0d.tools import math_tools
+from tr0nz0d.tools.math_tools import (ConversionError, DateDifference, DatetimeTools, DerivedUnit,
+                                      Dimension, MathTools, StreamConverter, UnitOf,
                                       UnitsOfMeasurement)
 
 
@@ -376,7 +385,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion kilometer - inch"""
         result = self.tools.convert_measure_units(unit=self.kilometer_unit,
                                                   new_unit=UnitsOfMeasurement.inch)
-        expected_conversion_result = 1066139.5999999999
+        expected_conversion_result = 1066141.732283
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -384,7 +393,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion kilometer - foot"""
         result = self.tools.convert_measure_units(unit=self.kilometer_unit,
                                                   new_unit=UnitsOfMeasurement.foot)
-        expected_conversion_result = 88849.48
+        expected_conversion_result = 88845.14436
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=2)
 
@@ -392,7 +401,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion kilometer - yard"""
         result = self.tools.convert_measure_units(unit=self.kilometer_unit,
                                                   new_unit=UnitsOfMeasurement.yard)
-        expected_conversion_result = 29625.519999999997
+        expected_conversion_result = 29615.048119
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -600,7 +609,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion mile - meter"""
         result = self.tools.convert_measure_units(unit=self.mile_unit,
                                                   new_unit=UnitsOfMeasurement.meter)
-        expected_conversion_result = 43571.719999999994
+        expected_conversion_result = 43581.03552
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -608,7 +617,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion mile - millimeter"""
         result = self.tools.convert_measure_units(unit=self.mile_unit,
                                                   new_unit=UnitsOfMeasurement.millimeter)
-        expected_conversion_result = 43571720.0
+        expected_conversion_result = 43581035.52
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -616,7 +625,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion mile - centimeter"""
         result = self.tools.convert_measure_units(unit=self.mile_unit,
                                                   new_unit=UnitsOfMeasurement.centimeter)
-        expected_conversion_result = 4357172.0
+        expected_conversion_result = 4358103.552
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -624,7 +633,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion mile - decimeter"""
         result = self.tools.convert_measure_units(unit=self.mile_unit,
                                                   new_unit=UnitsOfMeasurement.decimeter)
-        expected_conversion_result = 435717.19999999995
+        expected_conversion_result = 435810.3552
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -664,7 +673,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion square meter - square inch"""
         result = self.tools.convert_measure_units(unit=self.square_meter_unit,
                                                   new_unit=UnitsOfMeasurement.square_inch)
-        expected_conversion_result = 41974.0
+        expected_conversion_result = 41974.083948
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -792,7 +801,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion square mile - square meter"""
         result = self.tools.convert_measure_units(unit=self.square_mile_unit,
                                                   new_unit=UnitsOfMeasurement.square_meter)
-        expected_conversion_result = 70137200.0
+        expected_conversion_result = 70136878.027899
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -800,7 +809,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion square mile - square inch"""
         result = self.tools.convert_measure_units(unit=self.square_mile_unit,
                                                   new_unit=UnitsOfMeasurement.square_inch)
-        expected_conversion_result = 108699120000.0
+        expected_conversion_result = 108712378368
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -808,7 +817,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion square mile - square feet"""
         result = self.tools.convert_measure_units(unit=self.square_mile_unit,
                                                   new_unit=UnitsOfMeasurement.square_feet)
-        expected_conversion_result = 754990400.0
+        expected_conversion_result = 754947072
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -816,7 +825,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion square mile - square yard"""
         result = self.tools.convert_measure_units(unit=self.square_mile_unit,
                                                   new_unit=UnitsOfMeasurement.square_yard)
-        expected_conversion_result = 83893840.0
+        expected_conversion_result = 83883008
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -824,7 +833,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic meter - cubic inch"""
         result = self.tools.convert_measure_units(unit=self.cubic_meter_unit,
                                                   new_unit=UnitsOfMeasurement.cubic_inch)
-        expected_conversion_result = 1652421.5999999999
+        expected_conversion_result = 1652522.990085
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -888,7 +897,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic meter - gallon"""
         result = self.tools.convert_measure_units(unit=self.cubic_meter_unit,
                                                   new_unit=UnitsOfMeasurement.gallon)
-        expected_conversion_result = 7154.535999999999
+        expected_conversion_result = 7153.779178
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1000,7 +1009,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic foot - milliliter"""
         result = self.tools.convert_measure_units(unit=self.cubic_foot_unit,
                                                   new_unit=UnitsOfMeasurement.milliliter)
-        expected_conversion_result = 766905.6
+        expected_conversion_result = 766820.205711
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1008,7 +1017,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic foot - centiliter"""
         result = self.tools.convert_measure_units(unit=self.cubic_foot_unit,
                                                   new_unit=UnitsOfMeasurement.centiliter)
-        expected_conversion_result = 76690.56
+        expected_conversion_result = 76682.020571
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1016,7 +1025,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic foot - deciliter"""
         result = self.tools.convert_measure_units(unit=self.cubic_foot_unit,
                                                   new_unit=UnitsOfMeasurement.deciliter)
-        expected_conversion_result = 7669.056
+        expected_conversion_result = 7668.202057
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1048,7 +1057,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic yard - cubic inch"""
         result = self.tools.convert_measure_units(unit=self.cubic_yard_unit,
                                                   new_unit=UnitsOfMeasurement.cubic_inch)
-        expected_conversion_result = 1263552.7999999998
+        expected_conversion_result = 1263444.48
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1064,7 +1073,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic yard - liter"""
         result = self.tools.convert_measure_units(unit=self.cubic_yard_unit,
                                                   new_unit=UnitsOfMeasurement.liter)
-        expected_conversion_result = 20705.368
+        expected_conversion_result = 20704.145554
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1072,7 +1081,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic yard - milliliter"""
         result = self.tools.convert_measure_units(unit=self.cubic_yard_unit,
                                                   new_unit=UnitsOfMeasurement.milliliter)
-        expected_conversion_result = 20705368.0
+        expected_conversion_result = 20704145.554207
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1080,7 +1089,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic yard - centiliter"""
         result = self.tools.convert_measure_units(unit=self.cubic_yard_unit,
                                                   new_unit=UnitsOfMeasurement.centiliter)
-        expected_conversion_result = 2070536.7999999998
+        expected_conversion_result = 2070414.555421
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1088,7 +1097,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic yard - deciliter"""
         result = self.tools.convert_measure_units(unit=self.cubic_yard_unit,
                                                   new_unit=UnitsOfMeasurement.deciliter)
-        expected_conversion_result = 207053.68
+        expected_conversion_result = 207041.455542
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1104,7 +1113,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion cubic yard - gallon"""
         result = self.tools.convert_measure_units(unit=self.cubic_yard_unit,
                                                   new_unit=UnitsOfMeasurement.gallon)
-        expected_conversion_result = 5470.16
+        expected_conversion_result = 5469.456623
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1408,7 +1417,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion hectoliter - cubic inch"""
         result = self.tools.convert_measure_units(unit=self.hectoliter_unit,
                                                   new_unit=UnitsOfMeasurement.cubic_inch)
-        expected_conversion_result = 165242.16
+        expected_conversion_result = 165252.299009
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1512,7 +1521,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion gallon - milliliter"""
         result = self.tools.convert_measure_units(unit=self.gallon_unit,
                                                   new_unit=UnitsOfMeasurement.milliliter)
-        expected_conversion_result = 102497.79999999999
+        expected_conversion_result = 102508.951111
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1520,7 +1529,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion gallon - centiliter"""
         result = self.tools.convert_measure_units(unit=self.gallon_unit,
                                                   new_unit=UnitsOfMeasurement.centiliter)
-        expected_conversion_result = 10249.779999999999
+        expected_conversion_result = 10250.895111
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1672,7 +1681,7 @@ class TestMathTools(unittest.TestCase):
         """Test conversion year - second"""
         result = self.tools.convert_measure_units(unit=self.year_unit,
                                                   new_unit=UnitsOfMeasurement.second)
-        expected_conversion_result = 854103200.0
+        expected_conversion_result = 853994880
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
@@ -1764,6 +1773,370 @@ class TestMathTools(unittest.TestCase):
         self.assertAlmostEqual(
             result.value, expected_conversion_result, places=3)
 
+    def test_same_unit_conversion(self):
+        """Test conversion to the same unit keeps the value"""
+        result = self.tools.convert_measure_units(unit=self.liter_unit,
+                                                  new_unit=UnitsOfMeasurement.liter)
+        self.assertEqual(result.measure_unit, UnitsOfMeasurement.liter)
+        self.assertEqual(result.value, 27.08)
+
+    def test_conversion_round_trip(self):
+        """Test conversion between every pair of the same group and back"""
+        for unit in UnitsOfMeasurement:
+            for new_unit in UnitsOfMeasurement:
+                if unit.group() is not new_unit.group():
+                    continue
+                result = self.tools.build_unit(unit, 27.08).convert_to(new_unit)
+                self.assertEqual(result.measure_unit, new_unit)
+                self.assertAlmostEqual(result.convert_to(unit).value, 27.08, places=6)
+
+    def test_invalid_group_conversion(self):
+        """Test conversion between units of different groups"""
+        with self.assertRaises(ConversionError):
+            self.meter_unit.convert_to(UnitsOfMeasurement.liter)
+
+    def test_unit_groups(self):
+        """Test unit group lookup"""
+        self.assertIs(UnitsOfMeasurement.mile.group(), UnitOf.length)
+        self.assertIs(UnitsOfMeasurement.gallon.group(), UnitOf.volume)
+        self.assertIs(UnitsOfMeasurement.kilometer_per_hour.group(), UnitOf.speed)
+        self.assertTrue(all(unit.group() is not UnitOf.unknown for unit in UnitsOfMeasurement))
+
+    def test_compatibility_matrix(self):
+        """Test conversion compatibility matrix"""
+        matrix = self.tools.compatibility_matrix()
+        self.assertEqual(len(matrix), len(UnitsOfMeasurement))
+        for unit in UnitsOfMeasurement:
+            for new_unit in UnitsOfMeasurement:
+                expected = unit.group() is new_unit.group()
+                self.assertEqual(matrix[unit.value][new_unit.value], expected)
+                self.assertEqual(self.tools.can_convert(unit, new_unit), expected)
+                self.assertEqual(self.tools.build_unit(unit, 1).check_if_convertible(new_unit),
+                                 expected)
+
+    def test_convertible_units(self):
+        """Test listing of convertible units"""
+        self.assertEqual(self.tools.convertible_units(UnitsOfMeasurement.gram),
+                         (UnitsOfMeasurement.gram, UnitsOfMeasurement.kilogram))
+
+    def test_unit_is_immutable(self):
+        """Test measure units cannot be changed or receive new attributes"""
+        unit = self.tools.build_unit(UnitsOfMeasurement.meter, 1)
+        with self.assertRaises(AttributeError):
+            unit.value = 2
+        with self.assertRaises(AttributeError):
+            setattr(unit, "extra", 2)
+        self.assertFalse(hasattr(unit, "__dict__"))
+
+    def test_unit_equality_and_hash(self):
+        """Test measure units as value types"""
+        unit = self.tools.build_unit(UnitsOfMeasurement.meter, 1)
+        self.assertEqual(unit, self.tools.build_unit("meter", 1.0))
+        self.assertNotEqual(unit, self.tools.build_unit(UnitsOfMeasurement.meter, 2))
+        self.assertNotEqual(unit, self.tools.build_unit(UnitsOfMeasurement.millimeter, 1))
+        self.assertEqual(len({unit, self.tools.build_unit(UnitsOfMeasurement.meter.value, 1)}), 1)
+
+    def test_build_unit_resolves_unit(self):
+        """Test unit resolution from names and values"""
+        self.assertIs(self.tools.build_unit("liter", 1).measure_unit, UnitsOfMeasurement.liter)
+        self.assertIs(self.tools.build_unit(UnitsOfMeasurement.liter.value, 1).measure_unit,
+                      UnitsOfMeasurement.liter)
+        with self.assertRaises(ValueError):
+            self.tools.build_unit("parsec", 1)
+
+    def test_build_units(self):
+        """Test bulk measure unit creation"""
+        units = self.tools.build_units("gram", range(3))
+        self.assertEqual(units, [self.tools.build_unit(UnitsOfMeasurement.gram, value)
+                                 for value in range(3)])
+
+    def test_convert_array_list(self):
+        """Test bulk conversion of lists and tuples"""
+        result = self.tools.convert_array([1, 2.5, 27.08], UnitsOfMeasurement.kilometer,
+                                          UnitsOfMeasurement.meter)
+        self.assertIsInstance(result, list)
+        for value, expected in zip(result, [1000, 2500, 27080]):
+            self.assertAlmostEqual(value, expected, places=6)
+        self.assertEqual(self.tools.convert_array((60,), UnitsOfMeasurement.second,
+                                                  UnitsOfMeasurement.minute), (1.0,))
+
+    def test_convert_array_matches_convert_to(self):
+        """Test bulk conversion against single conversion"""
+        values = array("d", [0.5, 27.08, 1000])
+        result = self.tools.convert_array(values, UnitsOfMeasurement.foot,
+                                          UnitsOfMeasurement.mile)
+        self.assertEqual(result.typecode, "d")
+        for value, converted in zip(values, result):
+            single = self.tools.build_unit(UnitsOfMeasurement.foot, value)
+            self.assertAlmostEqual(single.convert_to(UnitsOfMeasurement.mile).value, converted)
+
+    def test_convert_array_integer_typecode(self):
+        """Test bulk conversion of integer array.array values"""
+        for numpy_module in (math_tools.np, None):
+            with mock.patch.object(math_tools, "np", numpy_module):
+                result = self.tools.convert_array(array("i", [1, 2]), UnitsOfMeasurement.kilogram,
+                                                  UnitsOfMeasurement.gram)
+                self.assertEqual(result, array("d", [1000, 2000]))
+                self.assertEqual(self.tools.convert_array(array("f"), UnitsOfMeasurement.gram,
+                                                          UnitsOfMeasurement.kilogram),
+                                 array("f"))
+
+    @unittest.skipIf(math_tools.np is None, "numpy is not installed")
+    def test_convert_array_numpy(self):
+        """Test bulk conversion of numpy arrays"""
+        values = math_tools.np.array([36.0, 72.0])
+        result = self.tools.convert_array(values, UnitsOfMeasurement.kilometer_per_hour,
+                                          UnitsOfMeasurement.meters_per_second)
+        self.assertEqual(result.tolist(), [10.0, 20.0])
+
+    def test_convert_array_invalid_group(self):
+        """Test bulk conversion between units of different groups"""
+        with self.assertRaises(ConversionError):
+            self.tools.convert_array([1], UnitsOfMeasurement.meter, UnitsOfMeasurement.second)
+
+    def test_unit_arithmetic(self):
+        """Test arithmetic between measure units keeps the left operand unit"""
+        kilometer = self.tools.build_unit(UnitsOfMeasurement.kilometer, 1)
+        meter = self.tools.build_unit(UnitsOfMeasurement.meter, 500)
+        self.assertEqual(kilometer + meter,
+                         self.tools.build_unit(UnitsOfMeasurement.kilometer, 1.5))
+        self.assertEqual(meter + kilometer, self.tools.build_unit(UnitsOfMeasurement.meter, 1500))
+        self.assertEqual(kilometer - meter,
+                         self.tools.build_unit(UnitsOfMeasurement.kilometer, 0.5))
+        self.assertEqual(meter + meter, self.tools.build_unit(UnitsOfMeasurement.meter, 1000))
+        self.assertEqual(meter * 2, 2 * meter)
+        self.assertEqual((meter / 4).value, 125)
+        self.assertEqual(kilometer / meter, 2)
+        self.assertEqual(-meter, self.tools.build_unit(UnitsOfMeasurement.meter, -500))
+        self.assertEqual(abs(-meter), meter)
+        self.assertEqual(sum([meter, meter, kilometer]).value, 2000)
+        with self.assertRaises(ConversionError):
+            _ = meter + self.tools.build_unit(UnitsOfMeasurement.second, 1)
+        with self.assertRaises(TypeError):
+            _ = meter + 1
+        with self.assertRaises(TypeError):
+            _ = meter * meter
+
+    def test_unit_ordering(self):
+        """Test ordering between measure units of different unit types"""
+        inch = self.tools.build_unit(UnitsOfMeasurement.inch, 12)
+        foot = self.tools.build_unit(UnitsOfMeasurement.foot, 1.1)
+        self.assertLess(inch, foot)
+        self.assertGreater(foot, inch)
+        self.assertLessEqual(inch, inch)
+        self.assertGreaterEqual(foot, inch)
+        self.assertEqual(sorted([foot, inch]), [inch, foot])
+        with self.assertRaises(ConversionError):
+            _ = inch < self.tools.build_unit(UnitsOfMeasurement.gram, 1)
+
+    def test_aggregate_units(self):
+        """Test aggregates over measure units of mixed unit types"""
+        measures = [self.tools.build_unit(UnitsOfMeasurement.hour, 1),
+                    self.tools.build_unit(UnitsOfMeasurement.minute, 30),
+                    self.tools.build_unit(UnitsOfMeasurement.second, 5400)]
+        self.assertEqual(self.tools.sum_units(measures),
+                         self.tools.build_unit(UnitsOfMeasurement.hour, 3))
+        self.assertEqual(self.tools.sum_units(iter(measures), UnitsOfMeasurement.minute),
+                         self.tools.build_unit(UnitsOfMeasurement.minute, 180))
+        self.assertEqual(self.tools.mean_units(measures),
+                         self.tools.build_unit(UnitsOfMeasurement.hour, 1))
+        self.assertIs(self.tools.min_unit(measures), measures[1])
+        self.assertIs(self.tools.max_unit(measures), measures[2])
+
+    def test_aggregate_units_empty(self):
+        """Test aggregates over no measure units"""
+        self.assertEqual(self.tools.sum_units([], UnitsOfMeasurement.gram),
+                         self.tools.build_unit(UnitsOfMeasurement.gram, 0))
+        for aggregate in (self.tools.sum_units, self.tools.mean_units,
+                          self.tools.min_unit, self.tools.max_unit):
+            with self.assertRaises(ValueError):
+                aggregate([])
+
+    def test_aggregate_units_invalid_group(self):
+        """Test aggregates over measure units of different groups"""
+        measures = [self.tools.build_unit(UnitsOfMeasurement.gram, 1),
+                    self.tools.build_unit(UnitsOfMeasurement.liter, 1)]
+        for aggregate in (self.tools.sum_units, self.tools.mean_units,
+                          self.tools.min_unit, self.tools.max_unit):
+            with self.assertRaises(ConversionError):
+                aggregate(measures)
+        with self.assertRaises(ConversionError):
+            self.tools.sum_units(measures[:1], UnitsOfMeasurement.liter)
+
+    def test_unit_dimensions(self):
+        """Test base dimensions of units of measurement"""
+        self.assertEqual(UnitsOfMeasurement.mile.dimension(), Dimension(length=1))
+        self.assertEqual(UnitsOfMeasurement.gallon.dimension(), Dimension(length=3))
+        self.assertEqual(UnitsOfMeasurement.miles_per_hour.dimension(),
+                         Dimension(length=1, time=-1))
+        self.assertEqual(UnitsOfMeasurement.gram.dimension(), Dimension(mass=1))
+
+    def test_derived_units(self):
+        """Test composition of derived units"""
+        speed = UnitsOfMeasurement.kilometer / UnitsOfMeasurement.hour
+        self.assertEqual(speed.name, "kilometer/hour")
+        self.assertEqual(speed.dimension, Dimension(length=1, time=-1))
+        self.assertAlmostEqual(speed.factor, 1 / 3.6)
+        area = UnitsOfMeasurement.meter ** 2
+        self.assertEqual(area, UnitsOfMeasurement.meter * UnitsOfMeasurement.meter)
+        self.assertEqual(len({area, UnitsOfMeasurement.meter ** 2}), 1)
+        density = UnitsOfMeasurement.kilogram / UnitsOfMeasurement.meter ** 3
+        self.assertEqual(density.dimension, Dimension(length=-3, mass=1))
+        with self.assertRaises(TypeError):
+            _ = UnitsOfMeasurement.meter * 2
+
+    def test_derived_unit_conversion(self):
+        """Test conversions involving derived units"""
+        kilometer_per_hour = UnitsOfMeasurement.kilometer / UnitsOfMeasurement.hour
+        self.assertAlmostEqual(self.tools.convert_value(36, kilometer_per_hour,
+                                                        UnitsOfMeasurement.meters_per_second), 10)
+        self.assertAlmostEqual(self.tools.convert_value(1, UnitsOfMeasurement.cubic_meter,
+                                                        UnitsOfMeasurement.foot ** 3),
+                               35.3146667, places=6)
+        self.assertAlmostEqual(self.tools.convert_value(2, UnitsOfMeasurement.square_meter,
+                                                        UnitsOfMeasurement.centimeter ** 2),
+                               20000)
+        gram_per_liter = UnitsOfMeasurement.gram / UnitsOfMeasurement.liter
+        self.assertAlmostEqual(
+            self.tools.convert_value(1, gram_per_liter,
+                                     UnitsOfMeasurement.kilogram / UnitsOfMeasurement.meter ** 3),
+            1)
+        self.assertEqual(self.tools.convert_array([72.0], kilometer_per_hour,
+                                                  UnitsOfMeasurement.meters_per_second), [20.0])
+        knot = DerivedUnit("knot", 1852 / 3600, Dimension(length=1, time=-1))
+        self.assertAlmostEqual(self.tools.conversion_factor(knot, kilometer_per_hour), 1.852)
+        with self.assertRaises(ConversionError):
+            self.tools.convert_value(1, kilometer_per_hour, UnitsOfMeasurement.meter)
+        with self.assertRaises(ConversionError):
+            self.tools.convert_value(1, UnitsOfMeasurement.meter, UnitsOfMeasurement.second)
+
+    def test_measure_unit_rejects_derived_target(self):
+        """Test measure units only convert to units of measurement"""
+        speed = self.tools.build_unit(UnitsOfMeasurement.kilometer_per_hour, 36)
+        derived = UnitsOfMeasurement.kilometer / UnitsOfMeasurement.hour
+        with self.assertRaises(ConversionError):
+            speed.convert_to(derived)
+        with self.assertRaises(ConversionError):
+            speed.convert_to(derived, exact=True)
+        with self.assertRaises(ConversionError):
+            speed.convert_to("meters_per_second")
+
+    def test_exact_conversion(self):
+        """Test conversions with exact factors"""
+        gallons = self.tools.build_unit(UnitsOfMeasurement.gallon, 10)
+        liters = gallons.convert_to(UnitsOfMeasurement.liter, exact=True)
+        self.assertEqual(liters.value, Fraction("37.85411784"))
+        self.assertEqual(liters.convert_to(UnitsOfMeasurement.gallon, exact=True), gallons)
+        decimal = self.tools.build_unit(UnitsOfMeasurement.cubic_foot, Decimal("0.1"))
+        self.assertEqual(decimal.convert_to(UnitsOfMeasurement.cubic_meter, exact=True).value,
+                         Fraction("0.0028316846592"))
+        self.assertEqual(self.tools.convert_value("1.5", UnitsOfMeasurement.hour,
+                                                  UnitsOfMeasurement.minute, exact=True), 90)
+        with self.assertRaises(ConversionError):
+            gallons.convert_to(UnitsOfMeasurement.kilogram, exact=True)
+
+    def test_exact_conversion_round_trip(self):
+        """Test exact round trips do not drift"""
+        value = Fraction(1, 3)
+        for _ in range(100):
+            value = self.tools.convert_value(value, UnitsOfMeasurement.meter,
+                                             UnitsOfMeasurement.foot, exact=True)
+            value = self.tools.convert_value(value, UnitsOfMeasurement.foot,
+                                             UnitsOfMeasurement.meter, exact=True)
+        self.assertEqual(value, Fraction(1, 3))
+
+    def test_exact_and_float_factors(self):
+        """Test float factors are the exact factors rounded once"""
+        for from_unit in UnitsOfMeasurement:
+            for to_unit in self.tools.convertible_units(from_unit):
+                exact = self.tools.conversion_factor(from_unit, to_unit, exact=True)
+                self.assertIsInstance(exact, Fraction)
+                self.assertEqual(self.tools.conversion_factor(from_unit, to_unit), float(exact))
+        knot = DerivedUnit("knot", Fraction(1852, 3600), Dimension(length=1, time=-1))
+        self.assertEqual(self.tools.conversion_factor(
+            knot, UnitsOfMeasurement.kilometer / UnitsOfMeasurement.hour, exact=True),
+            Fraction("1.852"))
+
+    def test_exact_arithmetic(self):
+        """Test arithmetic between exact measure units stays exact"""
+        liters = self.tools.build_unit(UnitsOfMeasurement.liter, Fraction(1))
+        gallons = self.tools.build_unit(UnitsOfMeasurement.gallon, Fraction(1))
+        self.assertEqual((liters + gallons).value, Fraction("4.785411784"))
+
+    def test_convert_stream(self):
+        """Test stream conversion to the base unit of each group, in order"""
+        records = [(UnitsOfMeasurement.kilometer, 2), (UnitsOfMeasurement.hour, 1),
+                   (UnitsOfMeasurement.gram, 500), (UnitsOfMeasurement.kilometer, 0.5),
+                   ("minute", 2)]
+        self.assertEqual(list(self.tools.convert_stream(iter(records), batch_size=2)),
+                         [(UnitsOfMeasurement.meter, 2000), (UnitsOfMeasurement.second, 3600),
+                          (UnitsOfMeasurement.kilogram, 0.5), (UnitsOfMeasurement.meter, 500),
+                          (UnitsOfMeasurement.second, 120)])
+
+    def test_convert_stream_targets(self):
+        """Test stream conversion to chosen target units"""
+        converter = StreamConverter(UnitsOfMeasurement.foot)
+        self.assertEqual(list(converter.convert([(UnitsOfMeasurement.yard, 1)])),
+                         [(UnitsOfMeasurement.foot, 3)])
+        with self.assertRaises(ConversionError):
+            list(converter.convert([(UnitsOfMeasurement.second, 1)]))
+
+        converter = StreamConverter([UnitsOfMeasurement.liter, UnitsOfMeasurement.minute])
+        self.assertEqual(converter.convert_batch([(UnitsOfMeasurement.second, 30),
+                                                  (UnitsOfMeasurement.milliliter, 250)]),
+                         [(UnitsOfMeasurement.minute, 0.5), (UnitsOfMeasurement.liter, 0.25)])
+
+        with self.assertRaises(ValueError):
+            StreamConverter([UnitsOfMeasurement.liter, UnitsOfMeasurement.gallon])
+        with self.assertRaises(ValueError):
+            StreamConverter(batch_size=0)
+
+    def test_convert_stream_batches_and_metrics(self):
+        """Test stream micro-batches and throughput metrics"""
+        converter = StreamConverter(batch_size=3)
+        records = [(UnitsOfMeasurement.centimeter, value) for value in range(7)]
+        self.assertEqual([len(batch) for batch in converter.convert_batches(records)], [3, 3, 1])
+        metrics = converter.metrics()
+        self.assertEqual((metrics["records"], metrics["batches"]), (7, 3))
+        self.assertGreaterEqual(metrics["records_per_second"], 0)
+        converter.reset_metrics()
+        self.assertEqual(converter.metrics(),
+                         {"records": 0, "batches": 0, "seconds": 0.0, "records_per_second": 0.0})
+
+    def test_parse_unit(self):
+        """Test parsing measures from text"""
+        self.assertEqual(self.tools.parse_unit("12.5 km"),
+                         self.tools.build_unit(UnitsOfMeasurement.kilometer, 12.5))
+        self.assertEqual(self.tools.parse_unit("3ft"),
+                         self.tools.build_unit(UnitsOfMeasurement.foot, 3))
+        self.assertEqual(self.tools.parse_unit(" -40 MPH "),
+                         self.tools.build_unit(UnitsOfMeasurement.miles_per_hour, -40))
+        self.assertEqual(self.tools.parse_unit("1e3 m²").measure_unit,
+                         UnitsOfMeasurement.square_meter)
+        self.assertEqual(self.tools.parse_unit("2 Sq  Ft").measure_unit,
+                         UnitsOfMeasurement.square_feet)
+        self.assertEqual(self.tools.parse_unit("7 cubic_yard").measure_unit,
+                         UnitsOfMeasurement.cubic_yard)
+        self.assertIs(self.tools.build_unit("km/h", 1).measure_unit,
+                      UnitsOfMeasurement.kilometer_per_hour)
+        for text in ("12 parsecs", "12", "km", "1.2.3 km"):
+            with self.assertRaises(ValueError):
+                self.tools.parse_unit(text)
+
+    def test_parse_many(self):
+        """Test bulk parsing of measures into arrays"""
+        units, values = self.tools.parse_many(iter(["12.5 km", "3ft", "40 mph", "1 L"]))
+        self.assertEqual(units, array("B", [UnitsOfMeasurement.kilometer.value,
+                                            UnitsOfMeasurement.foot.value,
+                                            UnitsOfMeasurement.miles_per_hour.value,
+                                            UnitsOfMeasurement.liter.value]))
+        self.assertEqual(values, array("d", [12.5, 3, 40, 1]))
+        self.assertEqual(self.tools.parse_many([]), (array("B"), array("d")))
+        with self.assertRaisesRegex(ValueError, "'x km'"):
+            self.tools.parse_many(["1 km", "x km"])
+        with self.assertRaises(ValueError):
+            self.tools.parse_many(["1 km", "2 furlongs"])
+
 
 class TestDatetimeTools(unittest.TestCase):
     """Test case for datetime tools"""
@@ -1861,6 +2234,92 @@ class TestDatetimeTools(unittest.TestCase):
                                                self.dif_invalid_date_times["final"])
         self.assertEqual(result, self.dif_invalid_date_times["result"])
 
+    def test_date_is_slotted(self):
+        """Test calculable dates hold no __dict__"""
+        date = self.tools.build_date(year=2022)
+        self.assertFalse(hasattr(date, "__dict__"))
+        with self.assertRaises(AttributeError):
+            setattr(date, "extra", 1)
+
+    def test_date_normalization(self):
+        """Test date fields are normalized when set"""
+        date = self.tools.build_date(year=22, month=123, day=0, hour=-5, minute=70, second=999)
+        self.assertEqual((date.year, date.month, date.day, date.hour, date.minute, date.second),
+                         (2200, 12, 1, 0, 59, 59))
+        date.year = 202212
+        date.day = 45
+        self.assertEqual((date.year, date.day), (2022, 31))
+
+    def test_date_conversion_cache(self):
+        """Test datetime and timedelta are cached until a field changes"""
+        date = self.tools.build_date(year=2022, month=11, day=10, hour=8)
+        self.assertIs(date.as_datetime(), date.as_datetime())
+        self.assertIs(date.as_timedelta(), date.as_timedelta())
+        date.hour = 9
+        self.assertEqual(date.as_datetime(), datetime(2022, 11, 10, 9))
+        self.assertEqual(date.as_timedelta(), timedelta(days=10, hours=9))
+        added = self.tools.add_to_date(date, self.tools.build_date(day=1))
+        self.assertEqual(added.as_datetime(), datetime(2022, 11, 11, 9))
+        self.assertEqual(added.day, 11)
+
+    batch_initial = [datetime(2022, 11, 10, 18, 30, 30), datetime(2020, 3, 31),
+                     datetime(2021, 2, 28, 12), datetime(1969, 12, 31, 23, 59, 59),
+                     datetime(2024, 2, 29), datetime(2023, 1, 31, 8)]
+    batch_final = [datetime(2022, 11, 5, 14, 15, 15), datetime(2020, 2, 29, 23),
+                   datetime(2020, 1, 31), datetime(1970, 1, 1),
+                   datetime(2021, 2, 28, 6), datetime(2023, 3, 1)]
+
+    def assert_matches_relativedelta(self, differences):
+        """Check batch differences against relativedelta, pair by pair"""
+        self.assertEqual(len(differences), len(self.batch_initial))
+        for difference, initial, final in zip(differences, self.batch_initial, self.batch_final):
+            rdelta = relativedelta(initial, final)
+            self.assertEqual(tuple(map(int, difference)),
+                             (rdelta.years, rdelta.months, rdelta.days,
+                              rdelta.hours, rdelta.minutes, rdelta.seconds))
+
+    def test_batch_date_dif(self):
+        """Test batch differences from lists of dates"""
+        differences = self.tools.calc_date_difs(self.batch_initial, self.batch_final)
+        self.assert_matches_relativedelta(differences)
+
+        calculable = [self.tools.build_date(2022, 11, 10, 18, 30, 30)]
+        self.assertEqual(tuple(map(int, self.tools.calc_date_difs(calculable, [1667657715])[0])),
+                         (0, 0, 5, 4, 15, 15))
+        with self.assertRaises(ValueError):
+            self.tools.calc_date_difs(self.batch_initial, self.batch_final[1:])
+
+    def test_batch_date_dif_without_numpy(self):
+        """Test batch differences without numpy"""
+        with mock.patch.object(math_tools, "np", None):
+            differences = self.tools.calc_date_difs(self.batch_initial, self.batch_final)
+        self.assertIsInstance(differences[0], DateDifference)
+        self.assert_matches_relativedelta(differences)
+
+    @unittest.skipIf(math_tools.np is None, "numpy is not installed")
+    def test_batch_date_dif_arrays(self):
+        """Test batch differences from datetime64 and epoch seconds arrays"""
+        initial = math_tools.np.array(self.batch_initial, dtype="datetime64[ms]")
+        final = math_tools.np.array(self.batch_final, dtype="datetime64[s]")
+        differences = self.tools.calc_date_difs(initial, final)
+        self.assertEqual(differences.dtype.names,
+                         ("years", "months", "days", "hours", "minutes", "seconds"))
+        self.assert_matches_relativedelta(differences)
+        self.assert_matches_relativedelta(
+            self.tools.calc_date_difs(initial.astype("datetime64[s]").astype("int64"),
+                                      final.astype("int64")))
+        self.assertEqual(len(self.tools.calc_date_difs(initial[:0], final[:0])), 0)
+
+    def test_batch_date_dif_texts(self):
+        """Test texts of batch differences match the single pair ones"""
+        initial = [self.dif_valid_dates["initial"], self.dif_invalid_date_times["initial"]]
+        final = [self.dif_valid_dates["final"], self.dif_invalid_date_times["final"]]
+        differences = self.tools.calc_date_difs(initial, final)
+        self.assertEqual(list(self.tools.format_date_difs(differences)),
+                         [self.tools.calc_date_dif(*pair) for pair in zip(initial, final)])
+        self.assertEqual(list(self.tools.format_date_difs(differences, com_horario=True)),
+                         [self.tools.calc_date_hour_dif(*pair) for pair in zip(initial, final)])
+
 
 if __name__ == "__main__":
     unittest.main()
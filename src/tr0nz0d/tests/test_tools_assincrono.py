@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tr0nz0d.tools.assincrono import executar_em_blocos, executor_compartilhado
+from tr0nz0d.tools.cnpj import CNPJ
+from tr0nz0d.tools.cpf import CPF
+
+
+class TestAssincrono(unittest.IsolatedAsyncioTestCase):
+    """Test case for async batch validation"""
+
+    async def test_small_input_inline(self):
+        """Test small inputs run on the event loop thread"""
+        threads = []
+
+        def record(values):
+            threads.append(threading.current_thread())
+            return len(values)
+
+        result = await executar_em_blocos(record, [1, 2, 3], limite_inline=10)
+        self.assertEqual(result, [3])
+        self.assertEqual(threads, [threading.current_thread()])
+
+    async def test_large_input_chunked(self):
+        """Test large inputs run in ordered chunks on the executor"""
+        threads = []
+
+        def record(values):
+            threads.append(threading.current_thread())
+            return list(values)
+
+        result = await executar_em_blocos(record, list(range(10)), tamanho_bloco=3,
+                                          limite_inline=2)
+        self.assertEqual(result, [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]])
+        self.assertNotIn(threading.current_thread(), threads)
+
+    async def test_invalid_chunk_size(self):
+        """Test invalid chunk size"""
+        with self.assertRaises(ValueError):
+            await executar_em_blocos(len, [1], tamanho_bloco=0)
+
+    async def test_cpf_async_batch(self):
+        """Test cpf async batch validation"""
+        tools = CPF()
+        cpfs = tools.gerar_lote(50) + ["99809764099", "111.111.111-11"]
+        result = await tools.avalidar_lote(cpfs, tamanho_bloco=7, limite_inline=5)
+        self.assertEqual(result, tools.validar_lote(cpfs))
+
+    async def test_cnpj_async_batch(self):
+        """Test cnpj async batch validation with custom executor"""
+        tools = CNPJ()
+        cnpjs = list(tools.gerar_unicos(50)) + ["34095155000199", ""]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = await tools.avalidar_lote(cnpjs, tamanho_bloco=7, limite_inline=5,
+                                               executor=executor)
+        self.assertEqual(result, tools.validar_lote(cnpjs))
+
+    def test_shared_executor(self):
+        """Test shared executor is reused"""
+        self.assertIs(executor_compartilhado(), executor_compartilhado())
+
+
+if __name__ == "__main__":
+    unittest.main()
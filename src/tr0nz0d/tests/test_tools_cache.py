@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+import unittest
+
+from tr0nz0d.tools.cache import CacheValidacao, ComCacheValidacao
+from tr0nz0d.tools.cnpj import CNPJ
+from tr0nz0d.tools.cpf import CPF
+
+
+class TestCacheValidacao(unittest.TestCase):
+    """Test case for validation cache"""
+
+    def test_counters(self):
+        """Test cache hit and miss counters"""
+        calls = []
+        cache = CacheValidacao(lambda digits: calls.append(digits) or len(digits), tamanho=2)
+        self.assertEqual(cache("123"), 3)
+        self.assertEqual(cache("123"), 3)
+        self.assertEqual(calls, ["123"])
+        self.assertEqual(cache.estatisticas(),
+                         {"acertos": 1, "falhas": 1, "tamanho_maximo": 2, "tamanho_atual": 1})
+
+    def test_bounded_size(self):
+        """Test cache eviction"""
+        cache = CacheValidacao(len, tamanho=2)
+        for digits in ("1", "12", "123", "1234"):
+            cache(digits)
+        self.assertEqual(cache.estatisticas()["tamanho_atual"], 2)
+
+    def test_clear(self):
+        """Test cache clearing"""
+        cache = CacheValidacao(len, tamanho=2)
+        cache("1")
+        cache.limpar()
+        self.assertEqual(cache.estatisticas()["falhas"], 0)
+        self.assertEqual(cache.estatisticas()["tamanho_atual"], 0)
+
+    def test_invalid_size(self):
+        """Test cache with invalid size"""
+        with self.assertRaises(ValueError):
+            CacheValidacao(len, tamanho=0)
+
+    def test_abstract_base(self):
+        """Test cache base requires the normalized validation function"""
+        with self.assertRaises(TypeError):
+            ComCacheValidacao()  # pylint: disable=abstract-class-instantiated
+
+    def test_cpf_cache(self):
+        """Test cached cpf validation keyed on normalized digits"""
+        tools = CPF(cache=128)
+        self.assertTrue(tools.validar("998.097.640-30"))
+        self.assertTrue(tools.validar("99809764030"))
+        self.assertFalse(tools.validar("111.111.111-11"))
+        self.assertFalse(tools.validar("9809764030"))
+        self.assertEqual(tools.estatisticas_cache()["acertos"], 1)
+        tools.limpar_cache()
+        self.assertEqual(tools.estatisticas_cache()["tamanho_atual"], 0)
+
+    def test_cnpj_cache(self):
+        """Test cached cnpj validation keyed on normalized digits"""
+        tools = CNPJ(cache=128)
+        self.assertTrue(tools.validar("34.095.155/0001-70"))
+        self.assertTrue(tools.validar("34095155000170"))
+        self.assertFalse(tools.validar("34095155000199"))
+        self.assertFalse(tools.validar("154095155000170"))
+        self.assertEqual(tools.estatisticas_cache()["acertos"], 1)
+
+    def test_cache_disabled(self):
+        """Test statistics when cache is disabled"""
+        tools = CPF()
+        tools.validar("99809764030")
+        tools.limpar_cache()
+        self.assertEqual(tools.estatisticas_cache()["falhas"], 0)
+
+    def test_non_ascii_digits_match(self):
+        """Test cached, uncached and batch validation agree on non-ascii digits"""
+        values = ["/5١-81B-137F6/a010", "٩٩٨٠٩٧٦٤٠٣٠", "998.097.640-30"]
+        expected = CPF().validar_lote(values)
+        self.assertEqual(expected, [False, False, True])
+        self.assertEqual([CPF().validar(value) for value in values], expected)
+        self.assertEqual([CPF(cache=10).validar(value) for value in values], expected)
+
+    def test_cached_results_match(self):
+        """Test cached validation results against uncached validation"""
+        cpf_tools, cached_cpf = CPF(), CPF(cache=64)
+        cnpj_tools, cached_cnpj = CNPJ(), CNPJ(cache=64)
+        for value in cpf_tools.gerar_lote(30) + ["99809764099", "", "abc"]:
+            self.assertEqual(cached_cpf.validar(value), cpf_tools.validar(value))
+        for value in list(cnpj_tools.gerar_unicos(30)) + ["34095155000199", "", "abc"]:
+            self.assertEqual(cached_cnpj.validar(value), cnpj_tools.validar(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,9 +25,17 @@ DEALINGS IN THE SOFTWARE.
 
 Created by: Gabriel Menezes de Antonio (TR0NZ0D)
 """
+import io
 import unittest
+from unittest import mock
 
-from tr0nz0d.tools.cnpj import CNPJ
+from tr0nz0d.tools import cnpj as cnpj_module
+from tr0nz0d.tools.cnpj import CNPJ, MotivoInvalido
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 
 class TestCNPJTools(unittest.TestCase):
@@ -110,6 +118,195 @@ class TestCNPJTools(unittest.TestCase):
         invalid_cnpj = self.tools.validar(self.invalid_exceed_numbers_numbers_cnpj)
         self.assertFalse(invalid_cnpj)
 
+    def test_unique_generation(self):
+        """Test unique cnpj generation with branches"""
+        cnpjs = list(self.tools.gerar_unicos(300, filiais=3, tamanho_bloco=64))
+        self.assertEqual(len(cnpjs), 900)
+        self.assertEqual(len(set(cnpjs)), 900)
+        self.assertEqual(len({cnpj[:8] for cnpj in cnpjs}), 300)
+        self.assertEqual([cnpj[8:12] for cnpj in cnpjs[:3]], ["0001", "0002", "0003"])
+        self.assertTrue(all(self.tools.validar_lote(cnpjs)[0]))
+
+    def test_unique_generation_seeded(self):
+        """Test unique cnpj generation reproducibility"""
+        first = list(self.tools.gerar_unicos(20, seed=42, formatado=True))
+        self.assertEqual(first, list(self.tools.gerar_unicos(20, seed=42, formatado=True)))
+        self.assertTrue(all(len(cnpj) == 18 for cnpj in first))
+
+    def test_unique_generation_without_numpy(self):
+        """Test unique cnpj generation pure python fallback"""
+        with mock.patch.object(cnpj_module, "np", None):
+            cnpjs = list(self.tools.gerar_unicos(100, filiais=2, seed=1))
+        self.assertEqual(len(set(cnpjs)), 200)
+        self.assertTrue(all(self.tools.validar_lote(cnpjs)[0]))
+
+    def test_unique_generation_invalid_arguments(self):
+        """Test unique cnpj generation invalid arguments"""
+        with self.assertRaises(ValueError):
+            self.tools.gerar_unicos(-1)
+        with self.assertRaises(ValueError):
+            self.tools.gerar_unicos(1, filiais=10000)
+
+    def test_encoding_round_trip(self):
+        """Test cnpj integer encoding and decoding"""
+        code = self.tools.codificar(self.divided_cnpj)
+        self.assertEqual(self.tools.separar_codigo(code), (34095155, 1, 70))
+        self.assertEqual(self.tools.decodificar(code), self.numbers_cnpj)
+
+    def test_encoding_groups_branches(self):
+        """Test cnpj encoding keeps branches of the same root together"""
+        cnpjs = list(self.tools.gerar_unicos(5, filiais=3))
+        codes = self.tools.codificar_lote(cnpjs)
+        self.assertEqual(sorted(codes), sorted(codes, key=lambda code: (code >> 21, code)))
+        self.assertEqual([self.tools.decodificar(code) for code in codes], cnpjs)
+
+    def test_invalid_encoding(self):
+        """Test cnpj encoding with invalid values"""
+        with self.assertRaises(ValueError):
+            self.tools.codificar(self.invalid_missing_numbers_numbers_cnpj)
+        with self.assertRaises(ValueError):
+            self.tools.decodificar(-1)
+
+    def _batch_cnpjs(self):
+        """Mixed valid and invalid cnpjs for batch validation"""
+        generated = [self.tools.gerar() for _ in range(50)]
+        return generated + [self.divided_cnpj, self.numbers_cnpj, self.invalid_divided_cnpj,
+                            self.invalid_numbers_cnpj, self.invalid_sequential_divided_cnpj,
+                            self.invalid_sequential_numbers_cnpj,
+                            self.invalid_missing_numbers_divided_cnpj,
+                            self.invalid_exceed_numbers_numbers_cnpj, "", "abc"]
+
+    def test_batch_validation_matches_single(self):
+        """Test cnpj batch validation against single validation"""
+        cnpjs = self._batch_cnpjs()
+        expected = [self.tools.validar(cnpj) for cnpj in cnpjs]
+        mask, _ = self.tools.validar_lote(cnpjs)
+        self.assertEqual(mask, expected)
+
+    def test_batch_validation_reasons(self):
+        """Test cnpj batch validation failure reasons"""
+        _, reasons = self.tools.validar_lote([self.numbers_cnpj,
+                                              self.invalid_missing_numbers_numbers_cnpj,
+                                              self.invalid_sequential_numbers_cnpj,
+                                              "34095155000160",
+                                              "34095155000171"])
+        self.assertEqual(reasons, [MotivoInvalido.valido.value,
+                                   MotivoInvalido.formato.value,
+                                   MotivoInvalido.sequencia.value,
+                                   MotivoInvalido.primeiro_digito.value,
+                                   MotivoInvalido.segundo_digito.value])
+
+    def test_batch_validation_empty(self):
+        """Test cnpj batch validation with empty input"""
+        self.assertEqual(self.tools.validar_lote([]), ([], []))
+
+    def test_batch_validation_without_numpy(self):
+        """Test cnpj batch validation pure python fallback"""
+        cnpjs = self._batch_cnpjs()
+        expected = self.tools.validar_lote(cnpjs)
+        with mock.patch.object(cnpj_module, "np", None):
+            self.assertEqual(self.tools.validar_lote(cnpjs), expected)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_array_validation_strings(self):
+        """Test cnpj array validation with string arrays"""
+        cnpjs = self._batch_cnpjs()
+        mask, reasons = self.tools.validar_array(np.array(cnpjs))
+        self.assertEqual(mask.tolist(), self.tools.validar_lote(cnpjs)[0])
+        self.assertEqual(reasons.tolist(), self.tools.validar_lote(cnpjs)[1])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_array_validation_digit_matrix(self):
+        """Test cnpj array validation with digit matrix"""
+        matrix = np.array([[int(c) for c in cnpj] for cnpj in
+                           [self.numbers_cnpj, self.invalid_numbers_cnpj,
+                            self.invalid_sequential_numbers_cnpj]], dtype=np.uint8)
+        mask, _ = self.tools.validar_array(matrix)
+        self.assertEqual(mask.tolist(), [True, False, False])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_array_validation_integers(self):
+        """Test cnpj array validation with integer arrays"""
+        numbers = np.array([int(self.numbers_cnpj), int(self.invalid_numbers_cnpj), -1])
+        mask, _ = self.tools.validar_array(numbers)
+        self.assertEqual(mask.tolist(), [True, False, False])
+
+    def test_batch_formatting(self):
+        """Test cnpj batch formatting"""
+        cnpjs = list(self.tools.gerar_unicos(10, filiais=2))
+        expected = [self.tools.formatar(cnpj) for cnpj in cnpjs]
+        self.assertEqual(self.tools.formatar_lote(cnpjs), expected)
+        self.assertEqual(self.tools.formatar_lote(self.tools.codificar_lote(cnpjs)), expected)
+        self.assertEqual(self.tools.formatar_lote([self.tools.codificar(self.numbers_cnpj)]),
+                         [self.divided_cnpj])
+        self.assertEqual(self.tools.formatar_lote([]), [])
+
+    def test_batch_formatting_without_numpy(self):
+        """Test cnpj batch formatting pure python fallback"""
+        cnpjs = list(self.tools.gerar_unicos(10, filiais=2))
+        expected = self.tools.formatar_lote(cnpjs)
+        with mock.patch.object(cnpj_module, "np", None):
+            self.assertEqual(self.tools.formatar_lote(cnpjs), expected)
+            self.assertEqual(self.tools.formatar_lote(self.tools.codificar_lote(cnpjs)),
+                             expected)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_formatting_integer_array(self):
+        """Test cnpj batch formatting from numpy integer arrays"""
+        codes = np.array([self.tools.codificar(self.numbers_cnpj)], dtype=np.int64)
+        self.assertEqual(self.tools.formatar_lote(codes), [self.divided_cnpj])
+        with self.assertRaises(ValueError):
+            self.tools.formatar_lote(np.array([-1]))
+
+    def test_invalid_batch_formatting(self):
+        """Test cnpj batch formatting with invalid values"""
+        with self.assertRaises(ValueError):
+            self.tools.formatar_lote([self.numbers_cnpj,
+                                      self.invalid_missing_numbers_numbers_cnpj])
+
+    def test_streaming_formatting(self):
+        """Test cnpj streaming formatted writer"""
+        cnpjs = list(self.tools.gerar_unicos(25))
+        output = io.StringIO()
+        written = self.tools.escrever_formatados(iter(cnpjs), output, tamanho_bloco=10)
+        self.assertEqual(written, 25)
+        self.assertEqual(output.getvalue().splitlines(), self.tools.formatar_lote(cnpjs))
+
+    def test_alphanumeric_cnpj(self):
+        """Test alphanumeric cnpj validation"""
+        self.assertTrue(self.tools.validar("12.ABC.345/01DE-35"))
+        self.assertTrue(self.tools.validar("12abc34501de35"))
+        self.assertFalse(self.tools.validar("12ABC34501DE36"))
+        self.assertFalse(self.tools.validar("12ABC34501DEA5"))
+        self.assertEqual(self.tools.formatar("12abc34501de35"), "12.ABC.345/01DE-35")
+        with self.assertRaises(ValueError):
+            self.tools.codificar("12ABC34501DE35")
+
+    def test_alphanumeric_batch_validation(self):
+        """Test alphanumeric cnpj batch validation reasons"""
+        cnpjs = ["12.ABC.345/01DE-35", "12ABC34501DE36", "12ABC34501DF35", "12ABC34501DEA5",
+                 "AAAAAAAAAAAAAA", self.numbers_cnpj]
+        expected = ([True, False, False, False, False, True],
+                    [MotivoInvalido.valido.value, MotivoInvalido.segundo_digito.value,
+                     MotivoInvalido.primeiro_digito.value, MotivoInvalido.formato.value,
+                     MotivoInvalido.formato.value, MotivoInvalido.valido.value])
+        self.assertEqual(self.tools.validar_lote(cnpjs), expected)
+        self.assertEqual([self.tools.validar(cnpj) for cnpj in cnpjs], expected[0])
+        with mock.patch.object(cnpj_module, "np", None):
+            self.assertEqual(self.tools.validar_lote(cnpjs), expected)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_alphanumeric_array_validation(self):
+        """Test alphanumeric cnpj array validation"""
+        mask, _ = self.tools.validar_array(np.array(["12ABC34501DE35", "12ABC34501DE36",
+                                                     "12.ABC.345/01DE-35"]))
+        self.assertEqual(mask.tolist(), [True, False, True])
+        matrix = np.array([[ord(c) - 48 for c in "12ABC34501DE35"],
+                           [ord(c) - 48 for c in "12:BC34501DE35"]])
+        mask, reasons = self.tools.validar_array(matrix)
+        self.assertEqual(mask.tolist(), [True, False])
+        self.assertEqual(reasons[1], MotivoInvalido.formato.value)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+import unittest
+from array import array
+from unittest import mock
+
+from tr0nz0d.tools import conjunto as conjunto_module
+from tr0nz0d.tools.cnpj import CNPJ
+from tr0nz0d.tools.conjunto import ConjuntoDocumentos
+from tr0nz0d.tools.cpf import CPF
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class TestConjuntoDocumentos(unittest.TestCase):
+    """Test case for compact document sets"""
+    cpf_tools = CPF()
+    cpfs = cpf_tools.gerar_lote(100, seed=1)
+
+    def test_membership(self):
+        """Test membership lookups"""
+        documents = ConjuntoDocumentos.de_cpfs(self.cpfs + self.cpfs[:10])
+        self.assertEqual(len(documents), 100)
+        for cpf in self.cpfs:
+            self.assertIn(self.cpf_tools.codificar(cpf), documents)
+        self.assertNotIn(self.cpf_tools.codificar("998.097.640-30"), documents)
+        self.assertNotIn("99809764030", documents)
+        self.assertNotIn(1.5, documents)
+
+    def test_membership_documents(self):
+        """Test membership lookups with formatted and plain documents"""
+        documents = ConjuntoDocumentos.de_cpfs(self.cpfs)
+        self.assertIn(self.cpfs[0], documents)
+        self.assertIn(self.cpf_tools.formatar(self.cpfs[1]), documents)
+        self.assertNotIn("998.097.640-30", documents)
+        self.assertNotIn("123", documents)
+        cnpjs = list(CNPJ().gerar_unicos(5, formatado=True))
+        cnpj_documents = ConjuntoDocumentos.de_cnpjs(cnpjs)
+        self.assertIn(cnpjs[0], cnpj_documents)
+        self.assertNotIn("12.ABC.345/01DE-35", cnpj_documents)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_membership_numpy_integers(self):
+        """Test membership lookups with numpy integers"""
+        codes = np.array([self.cpf_tools.codificar(cpf) for cpf in self.cpfs], dtype=np.int64)
+        documents = ConjuntoDocumentos(codes)
+        self.assertEqual(len(documents), 100)
+        self.assertIn(codes[0], documents)
+        self.assertIn(np.int32(5), ConjuntoDocumentos([5]))
+        self.assertNotIn(np.int64(1), documents)
+
+    def test_sorted_iteration(self):
+        """Test iteration order and memory size"""
+        documents = ConjuntoDocumentos([5, 3, 9, 3])
+        self.assertEqual(list(documents), [3, 5, 9])
+        self.assertEqual(documents.nbytes, 24)
+        self.assertEqual(list(ConjuntoDocumentos(array('q', [7, 1, 7]))), [1, 7])
+        self.assertEqual(list(ConjuntoDocumentos(iter([2, 2, 1]))), [1, 2])
+        with mock.patch.object(conjunto_module, "np", None):
+            self.assertEqual(list(ConjuntoDocumentos([5, 3, 9, 3])), [3, 5, 9])
+
+    def test_intersection(self):
+        """Test intersection between sets"""
+        first = ConjuntoDocumentos.de_cpfs(self.cpfs[:60])
+        second = ConjuntoDocumentos.de_cpfs(self.cpfs[40:])
+        common = first.intersecao(second)
+        self.assertEqual(sorted(self.cpf_tools.decodificar(code) for code in common),
+                         sorted(self.cpfs[40:60]))
+
+    def test_cnpjs(self):
+        """Test set built from cnpjs"""
+        cnpjs = list(CNPJ().gerar_unicos(10, filiais=2))
+        documents = ConjuntoDocumentos.de_cnpjs(cnpjs)
+        self.assertEqual(len(documents), 20)
+        self.assertIn(CNPJ().codificar(cnpjs[0]), documents)
+
+    def test_empty(self):
+        """Test empty set"""
+        documents = ConjuntoDocumentos()
+        self.assertEqual(len(documents), 0)
+        self.assertNotIn(1, documents)
+
+
+if __name__ == "__main__":
+    unittest.main()
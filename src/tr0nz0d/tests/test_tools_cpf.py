@@ -25,10 +25,18 @@ DEALINGS IN THE SOFTWARE.
 
 Created by: Gabriel Menezes de Antonio (TR0NZ0D)
 """
+import io
 import unittest
+from unittest import mock
 
+from tr0nz0d.tools import cpf as cpf_module
 from tr0nz0d.tools.cpf import CPF
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 
 class TestCPFTools(unittest.TestCase):
     """Test case for cpf tools"""
@@ -110,6 +118,168 @@ class TestCPFTools(unittest.TestCase):
         invalid_cpf = self.tools.validar(self.invalid_exceed_numbers_numbers_cpf)
         self.assertFalse(invalid_cpf)
 
+    def test_batch_generation(self):
+        """Test cpf batch generation"""
+        cpfs = self.tools.gerar_lote(200)
+        self.assertEqual(len(cpfs), 200)
+        self.assertTrue(all(len(cpf) == 11 for cpf in cpfs))
+        self.assertTrue(all(self.tools.validar_lote(cpfs)))
+
+    def test_batch_generation_seeded(self):
+        """Test cpf batch generation reproducibility"""
+        self.assertEqual(self.tools.gerar_lote(20, seed=42), self.tools.gerar_lote(20, seed=42))
+
+    def test_batch_generation_formatted(self):
+        """Test cpf formatted batch generation"""
+        cpfs = self.tools.gerar_lote(20, seed=7, formatado=True)
+        self.assertEqual(cpfs, [self.tools.formatar(cpf) for cpf in
+                                self.tools.gerar_lote(20, seed=7)])
+
+    def test_batch_generation_negative(self):
+        """Test cpf batch generation with negative quantity"""
+        with self.assertRaises(ValueError):
+            self.tools.gerar_lote(-1)
+
+    def test_batch_without_numpy(self):
+        """Test cpf batch generation and validation pure python fallback"""
+        with mock.patch.object(cpf_module, "np", None):
+            cpfs = self.tools.gerar_lote(50, seed=1)
+            self.assertEqual(cpfs, self.tools.gerar_lote(50, seed=1))
+            self.assertTrue(all(self.tools.validar_lote(cpfs)))
+            mixed = self._batch_cpfs()
+            self.assertEqual(self.tools.validar_lote(mixed),
+                             [self.tools.validar(cpf) for cpf in mixed])
+            with self.assertRaises(ImportError):
+                self.tools.gerar_lote(1, array=True)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_generation_array(self):
+        """Test cpf batch generation as array"""
+        cpfs = self.tools.gerar_lote(20, seed=3, array=True)
+        self.assertEqual(cpfs.tolist(), self.tools.gerar_lote(20, seed=3))
+        self.assertTrue(self.tools.validar_array(cpfs).all())
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_generation_chunks(self):
+        """Test cpf batch generation across generation chunk boundaries"""
+        with mock.patch.object(cpf_module, "_BLOCO_GERACAO", 7):
+            cpfs = self.tools.gerar_lote(30, seed=11, formatado=True, array=True)
+            self.assertEqual(cpfs.tolist(), self.tools.gerar_lote(30, seed=11, formatado=True))
+        self.assertEqual(len(set(cpfs.tolist())), 30)
+        self.assertTrue(self.tools.validar_array(cpfs).all())
+        self.assertEqual(self.tools.gerar_lote(0, array=True).tolist(), [])
+
+    def test_encoding_round_trip(self):
+        """Test cpf integer encoding and decoding"""
+        code = self.tools.codificar(self.divided_cpf)
+        self.assertEqual(code, 99809764030)
+        self.assertEqual(self.tools.decodificar(code), self.numbers_cpf)
+        self.assertEqual(self.tools.decodificar(self.tools.codificar("012.345.678-90")),
+                         "01234567890")
+
+    def test_batch_encoding(self):
+        """Test cpf batch encoding"""
+        cpfs = self.tools.gerar_lote(20)
+        codes = self.tools.codificar_lote(cpfs)
+        self.assertEqual(codes.itemsize, 8)
+        self.assertEqual([self.tools.decodificar(code) for code in codes], cpfs)
+
+    def test_invalid_encoding(self):
+        """Test cpf encoding with invalid values"""
+        with self.assertRaises(ValueError):
+            self.tools.codificar(self.invalid_missing_numbers_numbers_cpf)
+        with self.assertRaises(ValueError):
+            self.tools.codificar_lote([self.numbers_cpf, ""])
+        with self.assertRaises(ValueError):
+            self.tools.decodificar(10 ** 11)
+
+    def _batch_cpfs(self):
+        """Mixed valid and invalid cpfs for batch validation"""
+        generated = [self.tools.gerar() for _ in range(50)]
+        return generated + [self.divided_cpf, self.numbers_cpf, self.invalid_divided_cpf,
+                            self.invalid_numbers_cpf, self.invalid_sequential_divided_cpf,
+                            self.invalid_sequential_numbers_cpf,
+                            self.invalid_missing_numbers_divided_cpf,
+                            self.invalid_exceed_numbers_numbers_cpf, "", "abc"]
+
+    def test_batch_validation_matches_single(self):
+        """Test cpf batch validation against single validation"""
+        cpfs = self._batch_cpfs()
+        expected = [self.tools.validar(cpf) for cpf in cpfs]
+        self.assertEqual(self.tools.validar_lote(cpfs), expected)
+
+    def test_batch_validation_empty(self):
+        """Test cpf batch validation with empty input"""
+        self.assertEqual(self.tools.validar_lote([]), [])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_array_validation_strings(self):
+        """Test cpf array validation with string arrays"""
+        cpfs = self._batch_cpfs()
+        expected = [self.tools.validar(cpf) for cpf in cpfs]
+        self.assertEqual(self.tools.validar_array(np.array(cpfs)).tolist(), expected)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_array_validation_digit_matrix(self):
+        """Test cpf array validation with digit matrix"""
+        matrix = np.array([[int(c) for c in cpf] for cpf in
+                           [self.numbers_cpf, self.invalid_numbers_cpf,
+                            self.invalid_sequential_numbers_cpf]], dtype=np.uint8)
+        self.assertEqual(self.tools.validar_array(matrix).tolist(), [True, False, False])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_array_validation_integers(self):
+        """Test cpf array validation with integer arrays"""
+        numbers = np.array([int(self.numbers_cpf), int(self.invalid_numbers_cpf), -1])
+        self.assertEqual(self.tools.validar_array(numbers).tolist(), [True, False, False])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_array_validation_invalid_shape(self):
+        """Test cpf array validation with invalid matrix shape"""
+        with self.assertRaises(ValueError):
+            self.tools.validar_array(np.zeros((2, 10), dtype=np.uint8))
+
+    def test_batch_formatting(self):
+        """Test cpf batch formatting"""
+        cpfs = self.tools.gerar_lote(30)
+        expected = [self.tools.formatar(cpf) for cpf in cpfs]
+        self.assertEqual(self.tools.formatar_lote(cpfs), expected)
+        self.assertEqual(self.tools.formatar_lote(self.tools.codificar_lote(cpfs)), expected)
+        self.assertEqual(self.tools.formatar_lote([self.divided_cpf, 1234567890]),
+                         [self.divided_cpf, "012.345.678-90"])
+        self.assertEqual(self.tools.formatar_lote([]), [])
+
+    def test_batch_formatting_without_numpy(self):
+        """Test cpf batch formatting pure python fallback"""
+        cpfs = self.tools.gerar_lote(30)
+        expected = self.tools.formatar_lote(cpfs)
+        with mock.patch.object(cpf_module, "np", None):
+            self.assertEqual(self.tools.formatar_lote(cpfs), expected)
+            self.assertEqual(self.tools.formatar_lote(self.tools.codificar_lote(cpfs)), expected)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_formatting_integer_array(self):
+        """Test cpf batch formatting from numpy integer arrays"""
+        codes = np.array([int(self.numbers_cpf), 1234567890], dtype=np.int64)
+        self.assertEqual(self.tools.formatar_lote(codes), [self.divided_cpf, "012.345.678-90"])
+        with self.assertRaises(ValueError):
+            self.tools.formatar_lote(np.array([-1]))
+
+    def test_invalid_batch_formatting(self):
+        """Test cpf batch formatting with invalid values"""
+        with self.assertRaises(ValueError):
+            self.tools.formatar_lote([self.numbers_cpf, self.invalid_missing_numbers_numbers_cpf])
+        with self.assertRaises(ValueError):
+            self.tools.formatar_lote([10 ** 11])
+
+    def test_streaming_formatting(self):
+        """Test cpf streaming formatted writer"""
+        cpfs = self.tools.gerar_lote(25)
+        output = io.StringIO()
+        written = self.tools.escrever_formatados(iter(cpfs), output, tamanho_bloco=10)
+        self.assertEqual(written, 25)
+        self.assertEqual(output.getvalue().splitlines(), self.tools.formatar_lote(cpfs))
+
 
 if __name__ == "__main__":
     unittest.main()
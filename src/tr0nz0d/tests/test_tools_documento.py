@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+import unittest
+from unittest import mock
+
+from tr0nz0d.tools import documento as documento_module
+from tr0nz0d.tools.cnpj import CNPJ
+from tr0nz0d.tools.cpf import CPF
+from tr0nz0d.tools.documento import Documento, ResultadoDocumento, TipoDocumento
+
+
+class TestDocumento(unittest.TestCase):
+    """Test case for the document type dispatcher"""
+    tools = Documento()
+    valid_cpf = "998.097.640-30"
+    invalid_cpf = "998.097.640-99"
+    valid_cnpj = "34.095.155/0001-70"
+    invalid_cnpj = "34.095.155/0001-99"
+
+    def _mixed(self):
+        """Mixed cpfs, cnpjs and unknown documents"""
+        cpfs = CPF().gerar_lote(20)
+        cnpjs = list(CNPJ().gerar_unicos(20, formatado=True))
+        return [document for pair in zip(cpfs, cnpjs) for document in pair] + \
+            [self.valid_cpf, self.invalid_cpf, self.valid_cnpj, self.invalid_cnpj,
+             "11111111111", "", "123", "abc", "٩٩٨٠٩٧٦٤٠٣٠", "12.ABC.345/01DE-35",
+             "12ABC34501DE36", "998.O97.640-30", f"CPF {self.valid_cpf}",
+             f"{self.valid_cpf}x", f"CNPJ {self.valid_cnpj}", "12ABC345012356"]
+
+    def test_classification(self):
+        """Test document type detection by digit count"""
+        self.assertEqual(self.tools.classificar(self.valid_cpf), TipoDocumento.cpf)
+        self.assertEqual(self.tools.classificar(self.valid_cnpj), TipoDocumento.cnpj)
+        self.assertEqual(self.tools.classificar("123"), TipoDocumento.desconhecido)
+        self.assertEqual(self.tools.classificar("12.ABC.345/01DE-35"), TipoDocumento.cnpj)
+        self.assertEqual(self.tools.classificar("998.O97.640-30"), TipoDocumento.desconhecido)
+
+    def test_single_validation(self):
+        """Test single document validation"""
+        self.assertEqual(self.tools.validar(self.valid_cpf),
+                         ResultadoDocumento("99809764030", TipoDocumento.cpf, True))
+        self.assertEqual(self.tools.validar(self.invalid_cnpj),
+                         ResultadoDocumento("34095155000199", TipoDocumento.cnpj, False))
+        self.assertFalse(self.tools.validar("abc").valido)
+
+    def test_prefixed_documents(self):
+        """Test documents with letters around the digits are classified by digit count"""
+        self.assertEqual(self.tools.validar(f"CPF {self.valid_cpf}"),
+                         ResultadoDocumento("99809764030", TipoDocumento.cpf, True))
+        self.assertEqual(self.tools.validar(f"{self.valid_cpf}x"),
+                         ResultadoDocumento("99809764030", TipoDocumento.cpf, True))
+        self.assertEqual(self.tools.classificar(f"CNPJ {self.valid_cnpj}"), TipoDocumento.cnpj)
+        self.assertEqual(self.tools.validar_lote([f"CPF {self.valid_cpf}", f"{self.valid_cpf}x"]),
+                         ([True, True], [TipoDocumento.cpf, TipoDocumento.cpf]))
+
+    def test_alphanumeric_cnpj_with_eleven_digits(self):
+        """Test alphanumeric cnpjs whose letters leave exactly eleven digits"""
+        self.assertTrue(CNPJ().validar("12ABC345012356"))
+        self.assertEqual(self.tools.validar("12ABC345012356"),
+                         ResultadoDocumento("12ABC345012356", TipoDocumento.cnpj, True))
+        self.assertEqual(self.tools.validar("12.ABC.345/0123-56"),
+                         ResultadoDocumento("12ABC345012356", TipoDocumento.cnpj, True))
+        self.assertEqual(self.tools.validar_lote(["12ABC345012356", f"CPF {self.valid_cpf}"]),
+                         ([True, True], [TipoDocumento.cnpj, TipoDocumento.cpf]))
+
+    def test_batch_validation_matches_single(self):
+        """Test batch validation against single validation"""
+        documents = self._mixed()
+        valid, types = self.tools.validar_lote(documents)
+        expected = [self.tools.validar(document) for document in documents]
+        self.assertEqual(valid, [result.valido for result in expected])
+        self.assertEqual(types, [result.tipo for result in expected])
+        self.assertEqual(valid[:40], [True] * 40)
+
+    def test_batch_validation_without_numpy(self):
+        """Test batch validation pure python fallback"""
+        documents = self._mixed()
+        expected = self.tools.validar_lote(documents)
+        with mock.patch.object(documento_module, "np", None):
+            self.assertEqual(self.tools.validar_lote(documents), expected)
+
+    def test_batch_validation_empty(self):
+        """Test batch validation with empty input"""
+        self.assertEqual(self.tools.validar_lote([]), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
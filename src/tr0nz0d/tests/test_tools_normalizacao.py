@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+import unittest
+from re import sub
+
+from tr0nz0d.tools.normalizacao import (apenas_alfanumericos, apenas_alfanumericos_lote,
+                                        apenas_numeros, apenas_numeros_lote)
+
+
+class TestNormalizacao(unittest.TestCase):
+    """Test case for digit normalization"""
+    values = ["998.097.640-30", "99809764030", "34.095.155/0001-70", "", "abc",
+              " 12 3\t", "١٢٣", 12345, None]
+
+    def test_matches_regex(self):
+        """Test normalization against the regex implementation"""
+        for value in self.values:
+            self.assertEqual(apenas_numeros(value), sub(r'\D', '', str(value)))
+
+    def test_clean_input_is_returned(self):
+        """Test clean input fast path"""
+        value = "99809764030"
+        self.assertIs(apenas_numeros(value), value)
+
+    def test_batch(self):
+        """Test batch normalization"""
+        self.assertEqual(apenas_numeros_lote(self.values),
+                         [sub(r'\D', '', str(value)) for value in self.values])
+
+    def test_batch_generator(self):
+        """Test batch normalization from a generator"""
+        self.assertEqual(apenas_numeros_lote(str(n) + "-" for n in range(3)), ["0", "1", "2"])
+
+    def test_alphanumeric(self):
+        """Test alphanumeric normalization keeps uppercase ascii letters"""
+        self.assertEqual(apenas_alfanumericos("12.abc.345/01DE-35"), "12ABC34501DE35")
+        self.assertEqual(apenas_alfanumericos("ção 1"), "O1")
+        value = "34095155000170"
+        self.assertIs(apenas_alfanumericos(value), value)
+        self.assertEqual(apenas_alfanumericos_lote(["a-1", 5, None]), ["A1", "5", "NONE"])
+
+
+if __name__ == "__main__":
+    unittest.main()
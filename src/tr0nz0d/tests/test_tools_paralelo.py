@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tr0nz0d.tools.cnpj import CNPJ
+from tr0nz0d.tools.cpf import CPF
+from tr0nz0d.tools.paralelo import ValidadorParalelo
+
+
+class TestValidadorParalelo(unittest.TestCase):
+    """Test case for multi-process document validation"""
+    cpfs = CPF().gerar_lote(500, seed=1) + ["99809764099", "111.111.111-11", ""]
+    cnpjs = list(CNPJ().gerar_unicos(100, seed=1)) + ["34095155000199", ""]
+
+    def test_cpf_processes(self):
+        """Test ordered cpf validation across processes"""
+        validator = ValidadorParalelo(processos=2, tamanho_bloco=64)
+        self.assertEqual(validator.validar(self.cpfs), CPF().validar_lote(self.cpfs))
+
+    def test_cnpj_generator_input(self):
+        """Test cnpj validation from a generator with a custom executor"""
+        validator = ValidadorParalelo(tipo="cnpj", processos=2, tamanho_bloco=16)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = validator.validar((cnpj for cnpj in self.cnpjs), executor=executor)
+        self.assertEqual(result, CNPJ().validar_lote(self.cnpjs)[0])
+
+    def test_progress(self):
+        """Test progress callback"""
+        calls = []
+        validator = ValidadorParalelo(processos=1, tamanho_bloco=200)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            validator.validar(self.cpfs, progresso=lambda done, total: calls.append((done, total)),
+                              executor=executor)
+        self.assertEqual(calls, [(200, 503), (400, 503), (503, 503)])
+
+    def test_empty_input(self):
+        """Test validation of empty input"""
+        self.assertEqual(ValidadorParalelo(processos=1).validar([]), [])
+
+    def test_invalid_options(self):
+        """Test validator with invalid options"""
+        with self.assertRaises(ValueError):
+            ValidadorParalelo(tipo="rg")
+        with self.assertRaises(ValueError):
+            ValidadorParalelo(processos=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+from tr0nz0d.tools.validacao_arquivo import ValidadorArquivo, main
+
+
+class TestValidadorArquivo(unittest.TestCase):
+    """Test case for streaming document file validation"""
+    valid_cpf = "998.097.640-30"
+    invalid_cpf = "998.097.640-99"
+    valid_cnpj = "34.095.155/0001-70"
+    invalid_cnpj = "34.095.155/0001-99"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name: str, content: str) -> Path:
+        file_path = self.path / name
+        file_path.write_text(content, encoding="utf-8")
+        return file_path
+
+    def test_csv_split_by_column_name(self):
+        """Test csv validation splitting valid and invalid rows"""
+        source = self._write("input.csv", f'nome;documento\nA;{self.valid_cpf}\n\
+B;{self.invalid_cpf}\nC;{self.valid_cpf}\nD\n')
+        validator = ValidadorArquivo(coluna="documento", delimitador=";", tamanho_lote=2)
+        summary = validator.validar(source, self.path / "valid.csv", self.path / "invalid.csv")
+
+        self.assertEqual((summary.total, summary.validos, summary.invalidos), (4, 2, 2))
+        self.assertEqual((self.path / "valid.csv").read_text(encoding="utf-8").splitlines(),
+                         ["nome;documento", f"A;{self.valid_cpf}", f"C;{self.valid_cpf}"])
+        self.assertEqual((self.path / "invalid.csv").read_text(encoding="utf-8").splitlines(),
+                         ["nome;documento", f"B;{self.invalid_cpf}", "D"])
+
+    def test_lines_cnpj(self):
+        """Test line delimited cnpj validation"""
+        source = self._write("input.txt", f"{self.valid_cnpj}\n{self.invalid_cnpj}\n")
+        validator = ValidadorArquivo(tipo="cnpj", formato="linhas")
+        summary = validator.validar(source, saida_invalidos=self.path / "invalid.txt")
+
+        self.assertEqual((summary.validos, summary.invalidos), (1, 1))
+        self.assertEqual((self.path / "invalid.txt").read_text(encoding="utf-8"),
+                         f"{self.invalid_cnpj}\n")
+
+    def test_lines_mixed_documents(self):
+        """Test line delimited validation with detected document types"""
+        source = self._write("input.txt", f"{self.valid_cpf}\n{self.valid_cnpj}\n\
+{self.invalid_cnpj}\n123\n")
+        summary = ValidadorArquivo(tipo="auto", formato="linhas").validar(source)
+        self.assertEqual((summary.validos, summary.invalidos), (2, 2))
+
+    def test_latin1_file(self):
+        """Test validation keeps the input encoding in the output files"""
+        source = self.path / "input.csv"
+        source.write_text(f"nome;documento\nJoão;{self.valid_cpf}\nJosé;{self.invalid_cpf}\n",
+                          encoding="latin-1")
+        validator = ValidadorArquivo(coluna="documento", delimitador=";", encoding="latin-1")
+        summary = validator.validar(source, self.path / "valid.csv", self.path / "invalid.csv")
+
+        self.assertEqual((summary.validos, summary.invalidos), (1, 1))
+        self.assertEqual((self.path / "valid.csv").read_text(encoding="latin-1").splitlines(),
+                         ["nome;documento", f"João;{self.valid_cpf}"])
+        self.assertEqual((self.path / "invalid.csv").read_text(encoding="latin-1").splitlines(),
+                         ["nome;documento", f"José;{self.invalid_cpf}"])
+
+    def test_empty_file(self):
+        """Test validation of an empty file"""
+        source = self._write("empty.csv", "")
+        summary = ValidadorArquivo().validar(source)
+        self.assertEqual(summary.total, 0)
+
+    def test_missing_column(self):
+        """Test validation with unknown column name"""
+        source = self._write("input.csv", f"documento\n{self.valid_cpf}\n")
+        with self.assertRaises(ValueError):
+            ValidadorArquivo(coluna="cpf").validar(source)
+
+    def test_invalid_options(self):
+        """Test validator with invalid options"""
+        with self.assertRaises(ValueError):
+            ValidadorArquivo(tipo="rg")
+        with self.assertRaises(ValueError):
+            ValidadorArquivo(coluna="documento", cabecalho=False)
+
+    def test_command_line(self):
+        """Test command line entry point"""
+        source = self._write("input.csv", f"{self.valid_cpf}\n{self.invalid_cpf}\n")
+        result = main([str(source), "--sem-cabecalho", "--validos", str(self.path / "ok.csv")])
+        self.assertEqual(result, 0)
+        self.assertEqual((self.path / "ok.csv").read_text(encoding="utf-8").splitlines(),
+                         [self.valid_cpf])
+
+
+if __name__ == "__main__":
+    unittest.main()
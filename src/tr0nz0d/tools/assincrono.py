@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+TAMANHO_BLOCO = 50000
+LIMITE_INLINE = 1000
+
+_executor: Optional[ThreadPoolExecutor] = None
+_trava_executor = Lock()
+
+
+def executor_compartilhado() -> ThreadPoolExecutor:
+    """ Retorna o executor compartilhado pelas validações assíncronas, criando-o se necessário
+
+    Returns:
+        ThreadPoolExecutor: Executor com até 4 threads
+    """
+    global _executor  # pylint: disable=global-statement
+
+    with _trava_executor:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                           thread_name_prefix='tr0nz0d')
+        return _executor
+
+
+async def executar_em_blocos(funcao: Callable[[Sequence[T]], R],
+                             valores: Sequence[T],
+                             tamanho_bloco: int = TAMANHO_BLOCO,
+                             limite_inline: int = LIMITE_INLINE,
+                             executor: Optional[Executor] = None) -> List[R]:
+    """ Executa uma função de lote sem bloquear o event loop
+
+    Entradas pequenas são processadas diretamente no event loop, evitando o custo da
+    troca de thread. Entradas maiores são divididas em blocos executados no executor.
+
+    Args:
+        funcao (Callable[[Sequence[T]], R]): Função que processa um bloco de valores
+        valores (Sequence[T]): Valores a serem processados
+        tamanho_bloco (int, optional): Quantidade de valores por bloco. Defaults to 50000.
+        limite_inline (int, optional): Tamanho máximo processado no próprio event loop.
+            Defaults to 1000.
+        executor (Executor, optional): Executor a ser utilizado. Defaults to
+            executor_compartilhado().
+
+    Raises:
+        ValueError: Se o tamanho do bloco não for maior que zero
+
+    Returns:
+        List[R]: O resultado de cada bloco, na ordem da entrada
+    """
+    if tamanho_bloco < 1:
+        raise ValueError('O tamanho do bloco deve ser maior que zero.')
+
+    if len(valores) <= limite_inline:
+        return [funcao(valores)]
+
+    loop = asyncio.get_running_loop()
+    executor = executor or executor_compartilhado()
+    tarefas = [loop.run_in_executor(executor, funcao, valores[inicio:inicio + tamanho_bloco])
+               for inicio in range(0, len(valores), tamanho_bloco)]
+
+    return list(await asyncio.gather(*tarefas))
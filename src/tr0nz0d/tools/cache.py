@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class CacheValidacao(Generic[T]):
+    """Cache LRU limitado para resultados de validação, indexado pelos dígitos normalizados"""
+
+    def __init__(self, funcao: Callable[[str], T], tamanho: int) -> None:
+        """ Cria um cache para a função de validação informada
+
+        Args:
+            funcao (Callable[[str], T]): Função que valida um documento já normalizado
+            tamanho (int): Quantidade máxima de documentos armazenados
+
+        Raises:
+            ValueError: Se o tamanho não for maior que zero
+        """
+        if tamanho < 1:
+            raise ValueError('O tamanho do cache deve ser maior que zero.')
+
+        self._funcao = lru_cache(maxsize=tamanho)(funcao)
+
+    def __call__(self, digitos: str) -> T:
+        return self._funcao(digitos)
+
+    def estatisticas(self) -> Dict[str, int]:
+        """ Retorna os contadores do cache, prontos para painéis de métricas
+
+        Returns:
+            Dict[str, int]: Acertos (`acertos`), falhas (`falhas`), tamanho máximo
+            (`tamanho_maximo`) e tamanho atual (`tamanho_atual`)
+        """
+        info = self._funcao.cache_info()
+        return {
+            "acertos": info.hits,
+            "falhas": info.misses,
+            "tamanho_maximo": info.maxsize or 0,
+            "tamanho_atual": info.currsize
+        }
+
+    def limpar(self) -> None:
+        """Remove todos os resultados armazenados e zera os contadores"""
+        self._funcao.cache_clear()
+
+
+class ComCacheValidacao(ABC):
+    """Base das ferramentas de documentos com cache opcional para `validar`"""
+    _cache: Optional[CacheValidacao[bool]]
+
+    def __init__(self, cache: int = 0) -> None:
+        """ Cria as ferramentas de documento
+
+        Args:
+            cache (int, optional): Quantidade máxima de resultados de `validar` mantidos
+                em um cache LRU, indexado pelos dígitos normalizados. `0` desativa o cache.
+                Defaults to 0.
+        """
+        self._cache = CacheValidacao(self._valida_normalizado, cache) if cache > 0 else None
+
+    @staticmethod
+    @abstractmethod
+    def _valida_normalizado(digitos: str) -> bool:
+        """Valida um documento já normalizado, sem consultar o cache"""
+
+    def estatisticas_cache(self) -> Dict[str, int]:
+        """ Retorna os contadores do cache de validação
+
+        Returns:
+            Dict[str, int]: Acertos, falhas, tamanho máximo e tamanho atual do cache,
+            todos zerados quando o cache está desativado
+        """
+        if self._cache is None:
+            return {"acertos": 0, "falhas": 0, "tamanho_maximo": 0, "tamanho_atual": 0}
+        return self._cache.estatisticas()
+
+    def limpar_cache(self) -> None:
+        """Remove os resultados armazenados no cache de validação"""
+        if self._cache is not None:
+            self._cache.limpar()
@@ -26,21 +26,236 @@ DEALINGS IN THE SOFTWARE.
 Created by: Gabriel Menezes de Antonio (TR0NZ0D)
 """
 
-from random import randint
-from re import sub
+from array import array
+from concurrent.futures import Executor
+from enum import Enum
+from numbers import Integral
+from operator import mul
+from random import Random, randint
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .assincrono import LIMITE_INLINE, TAMANHO_BLOCO, executar_em_blocos
+from .cache import ComCacheValidacao
+from .formatacao import escrever_em_blocos
+from .normalizacao import apenas_alfanumericos, apenas_alfanumericos_lote
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 REGRESSIVOS = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
 
+TOTAL_RAIZES = 10 ** 8
+MAXIMO_FILIAIS = 9999
 
-def _apenas_numeros(cnpj) -> str:
-    cnpj = str(cnpj)
-    return sub(r'\D', '', cnpj)
+# Layout do código compacto: raiz (27 bits) | filial (14 bits) | dígitos verificadores (7 bits)
+BITS_FILIAL = 14
+BITS_DIGITOS = 7
 
+# Valor de cada caractere no cálculo dos dígitos verificadores: o código ASCII menos 48,
+# de modo que '0'..'9' valem 0..9 e 'A'..'Z' valem 17..42 no CNPJ alfanumérico.
+# Caracteres fora do alfabeto do CNPJ são mapeados para `_CARACTERE_INVALIDO`.
+_CARACTERE_INVALIDO = 255
+_TABELA_VALORES = bytes(codigo - 48 if 48 <= codigo <= 57 or 65 <= codigo <= 90
+                        else _CARACTERE_INVALIDO for codigo in range(256))
+_VALOR_MAXIMO = ord('Z') - 48
 
-def _eh_sequencia(cnpj) -> bool:
-    cnpj = str(cnpj)
-    sequencia = cnpj[0] * len(str(cnpj))
-    return sequencia == cnpj
+_PESOS_DIGITO_1 = tuple(REGRESSIVOS[1:])
+_PESOS_DIGITO_2 = tuple(REGRESSIVOS)
+
+# Colunas com os pesos do primeiro e do segundo dígito, para um único produto matricial
+_MATRIZ_PESOS = np.array([[*REGRESSIVOS[1:], 0], REGRESSIVOS], dtype=np.int64).T \
+    if np is not None else None
+
+_TABELA_VALORES_ARRAY = np.frombuffer(_TABELA_VALORES, dtype=np.uint8) \
+    if np is not None else None
+
+# Maior valor aceito em cada coluna: letras apenas na raiz e na filial
+_LIMITES_COLUNAS = np.array([_VALOR_MAXIMO] * 12 + [9, 9], dtype=np.uint8) \
+    if np is not None else None
+
+
+class MotivoInvalido(Enum):
+    """Códigos de falha retornados pela validação em lote de CNPJs"""
+    valido = 0
+    formato = 1
+    sequencia = 2
+    primeiro_digito = 3
+    segundo_digito = 4
+
+
+def _digito_verificador(digitos, pesos) -> int:
+    resto = sum(map(mul, digitos, pesos)) % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def _motivo_normalizado(cnpj: str) -> int:
+    if len(cnpj) != 14 or not cnpj.isascii():
+        return MotivoInvalido.formato.value
+
+    valores = cnpj.encode('ascii').translate(_TABELA_VALORES)
+    if _CARACTERE_INVALIDO in valores or valores[12] > 9 or valores[13] > 9:
+        return MotivoInvalido.formato.value
+
+    if cnpj == cnpj[0] * 14:
+        return MotivoInvalido.sequencia.value
+
+    if valores[12] != _digito_verificador(valores, _PESOS_DIGITO_1):
+        return MotivoInvalido.primeiro_digito.value
+    if valores[13] != _digito_verificador(valores, _PESOS_DIGITO_2):
+        return MotivoInvalido.segundo_digito.value
+
+    return MotivoInvalido.valido.value
+
+
+def _valida_normalizado(cnpj: str) -> bool:
+    return _motivo_normalizado(cnpj) == MotivoInvalido.valido.value
+
+
+def _requer_numpy():
+    if np is None:
+        raise ImportError('Esta operação vetorizada requer o pacote numpy instalado.')
+
+
+def _motivos_matriz(matriz):
+    """Calcula os códigos de falha de uma matriz N×14 de valores em uma única passada.
+
+    Os valores seguem o mapeamento de `_TABELA_VALORES`, com os caracteres inválidos já
+    convertidos para `_CARACTERE_INVALIDO`: as 12 primeiras colunas aceitam dígitos e
+    letras, as duas últimas apenas dígitos.
+    """
+    restos = (matriz[:, :13].astype(np.int64) @ _MATRIZ_PESOS) % 11
+    digitos = np.where(restos < 2, 0, 11 - restos)
+
+    # Atribuídos do menos para o mais prioritário, espelhando a ordem da validação escalar
+    motivos = np.full(len(matriz), MotivoInvalido.valido.value, dtype=np.uint8)
+    motivos[matriz[:, 13] != digitos[:, 1]] = MotivoInvalido.segundo_digito.value
+    motivos[matriz[:, 12] != digitos[:, 0]] = MotivoInvalido.primeiro_digito.value
+    motivos[(matriz == matriz[:, :1]).all(axis=1)] = MotivoInvalido.sequencia.value
+    motivos[(matriz > _LIMITES_COLUNAS).any(axis=1)] = MotivoInvalido.formato.value
+
+    return motivos
+
+
+def _valores_matriz(matriz):
+    """Converte uma matriz de valores arbitrários para o mapeamento de `_TABELA_VALORES`."""
+    invalidos = (matriz < 0) | (matriz > _VALOR_MAXIMO) | ((matriz > 9) & (matriz < 17))
+    return np.where(invalidos, _CARACTERE_INVALIDO, matriz).astype(np.uint8)
+
+
+def _motivos_normalizados(normalizados: List[str]):
+    """Converte CNPJs normalizados em uma matriz de valores e calcula os códigos de falha."""
+    completos = np.array([len(cnpj) == 14 and cnpj.isascii() for cnpj in normalizados],
+                         dtype=bool)
+    preenchidos = ''.join(cnpj if completo else '0' * 14
+                          for cnpj, completo in zip(normalizados, completos))
+
+    matriz = np.frombuffer(preenchidos.encode('ascii'), dtype=np.uint8).reshape(-1, 14)
+    motivos = _motivos_matriz(_TABELA_VALORES_ARRAY[matriz])
+    motivos[~completos] = MotivoInvalido.formato.value
+
+    return motivos
+
+
+def _raizes_unicas_python(quantidade: int, gerador: Random,
+                          tamanho_bloco: int) -> Iterator[List[int]]:
+    """Sorteia raízes sem repetição, marcando as já utilizadas em um bitmap de 12,5 MB."""
+    utilizadas = bytearray(TOTAL_RAIZES // 8)
+    for repetido in range(10):
+        raiz = repetido * 11111111
+        utilizadas[raiz >> 3] |= 1 << (raiz & 7)
+
+    bloco: List[int] = []
+    while quantidade:
+        raiz = gerador.randrange(TOTAL_RAIZES)
+        if utilizadas[raiz >> 3] & (1 << (raiz & 7)):
+            continue
+
+        utilizadas[raiz >> 3] |= 1 << (raiz & 7)
+        bloco.append(raiz)
+        quantidade -= 1
+
+        if len(bloco) == tamanho_bloco:
+            yield bloco
+            bloco = []
+
+    if bloco:
+        yield bloco
+
+
+def _raizes_unicas_numpy(quantidade: int, seed: Optional[int], tamanho_bloco: int):
+    """Sorteia blocos de raízes sem repetição, marcando as já utilizadas em um bitmap."""
+    gerador = np.random.default_rng(seed)
+    utilizadas = np.zeros(TOTAL_RAIZES // 8, dtype=np.uint8)
+    repetidas = np.arange(10, dtype=np.int64) * 11111111
+    np.bitwise_or.at(utilizadas, repetidas >> 3, (1 << (repetidas & 7)).astype(np.uint8))
+
+    while quantidade:
+        candidatas = gerador.integers(0, TOTAL_RAIZES, size=min(quantidade, tamanho_bloco),
+                                      dtype=np.int64)
+        _, primeiras = np.unique(candidatas, return_index=True)
+        candidatas = candidatas[np.sort(primeiras)]
+
+        bits = (1 << (candidatas & 7)).astype(np.uint8)
+        raizes = candidatas[(utilizadas[candidatas >> 3] & bits) == 0]
+        np.bitwise_or.at(utilizadas, raizes >> 3, (1 << (raizes & 7)).astype(np.uint8))
+
+        quantidade -= raizes.size
+        if raizes.size:
+            yield raizes
+
+
+def _matriz_filiais(raizes, filiais: int):
+    """Monta a matriz N×14 de dígitos com as filiais 0001..`filiais` de cada raiz."""
+    numeros = np.repeat(raizes * 10000, filiais) + np.tile(np.arange(1, filiais + 1), raizes.size)
+    potencias = 10 ** np.arange(11, -1, -1, dtype=np.int64)
+
+    matriz = np.zeros((numeros.size, 14), dtype=np.int64)
+    matriz[:, :12] = (numeros[:, None] // potencias) % 10
+    restos = (matriz[:, :12] @ np.array(REGRESSIVOS[1:], dtype=np.int64)) % 11
+    matriz[:, 12] = np.where(restos < 2, 0, 11 - restos)
+    restos = (matriz[:, :13] @ np.array(REGRESSIVOS, dtype=np.int64)) % 11
+    matriz[:, 13] = np.where(restos < 2, 0, 11 - restos)
+
+    return matriz.astype(np.uint8)
+
+
+def _textos_matriz(matriz, formatado: bool) -> List[str]:
+    matriz = matriz + 48
+    if formatado:
+        separadores = np.array([ord('.'), ord('.'), ord('/'), ord('-')], dtype=np.uint8)
+        matriz = np.insert(matriz, [2, 5, 8, 12], separadores, axis=1)
+
+    tamanho = matriz.shape[1]
+    texto = matriz.tobytes().decode('ascii')
+    return [texto[inicio:inicio + tamanho] for inicio in range(0, len(texto), tamanho)]
+
+
+def _matriz_codigos(codigos):
+    """Converte um array de códigos gerados por `codificar` em uma matriz N×14 de dígitos."""
+    codigos = np.asarray(codigos, dtype=np.int64)
+    raizes = codigos >> (BITS_FILIAL + BITS_DIGITOS)
+    filiais = (codigos >> BITS_DIGITOS) & ((1 << BITS_FILIAL) - 1)
+    digitos = codigos & ((1 << BITS_DIGITOS) - 1)
+
+    if ((codigos < 0) | (raizes >= TOTAL_RAIZES) | (filiais > MAXIMO_FILIAIS)
+            | (digitos > 99)).any():
+        raise ValueError('Código de CNPJ fora do intervalo permitido.')
+
+    numeros = (raizes * 10000 + filiais) * 100 + digitos
+    return ((numeros[:, None] // 10 ** np.arange(13, -1, -1, dtype=np.int64)) % 10) \
+        .astype(np.uint8)
+
+
+def _codificar_normalizado(cnpj: str) -> int:
+    if len(cnpj) != 14 or not cnpj.isascii():
+        raise ValueError('CNPJ deve conter um comprimento de 14 caracteres.')
+    if not cnpj.isdecimal():
+        raise ValueError('Apenas CNPJs numéricos podem ser codificados.')
+
+    return (int(cnpj[:8]) << (BITS_FILIAL + BITS_DIGITOS)) | \
+        (int(cnpj[8:12]) << BITS_DIGITOS) | int(cnpj[12:])
 
 
 def _calcula_digito(cnpj, digito) -> str:
@@ -57,7 +272,7 @@ def _calcula_digito(cnpj, digito) -> str:
 
     total = 0
     for indice, regressivo in enumerate(regressivos):
-        total += int(cnpj[indice]) * regressivo
+        total += _TABELA_VALORES[ord(cnpj[indice])] * regressivo
 
     digito = 11 - (total % 11)
     digito = digito if digito <= 9 else 0
@@ -65,8 +280,10 @@ def _calcula_digito(cnpj, digito) -> str:
     return f'{novo_cnpj}{digito}'
 
 
-class CNPJ:
+class CNPJ(ComCacheValidacao):
     """CNPJ Tools"""
+    _valida_normalizado = staticmethod(_valida_normalizado)
+
     def gerar(self) -> str:
         """Gera um CNPJ aleatório.
 
@@ -89,6 +306,67 @@ class CNPJ:
 
         return novo_cnpj
 
+    def gerar_unicos(self,
+                     quantidade: int,
+                     filiais: int = 1,
+                     seed: Optional[int] = None,
+                     formatado: bool = False,
+                     tamanho_bloco: int = 10000) -> Iterator[str]:
+        """Gera em fluxo CNPJs válidos com raízes que nunca se repetem na mesma chamada.
+
+        As raízes são sorteadas entre todas as 100 milhões de possibilidades e marcadas
+        em um bitmap, garantindo unicidade com memória constante. Para cada raiz são
+        geradas as filiais `0001` até `filiais`, todas com os dígitos corretos.
+
+        Parâmetros
+        -----------
+        quantidade: :class:`int`
+            Quantidade de raízes (empresas) distintas a serem geradas.
+        filiais: :class:`int`
+            Quantidade de filiais geradas por raiz, de 1 a 9999.
+        seed: Optional[:class:`int`]
+            Semente para tornar a geração reproduzível.
+        formatado: :class:`bool`
+            Se os CNPJs devem ser retornados com os caracteres de divisão.
+        tamanho_bloco: :class:`int`
+            Quantidade de raízes processadas por vez.
+
+        Returns
+        -----------
+        cnpjs: :class:`Iterator[str]`
+            Um gerador com `quantidade * filiais` CNPJs.
+
+        Raises
+        -----------
+        ValueError
+            Se a quantidade exceder as raízes disponíveis ou as filiais estiverem
+            fora do intervalo permitido.
+        """
+        if not 0 <= quantidade <= TOTAL_RAIZES - 10:
+            raise ValueError(f'A quantidade de raízes deve estar entre 0 e {TOTAL_RAIZES - 10}.')
+        if not 1 <= filiais <= MAXIMO_FILIAIS:
+            raise ValueError(f'A quantidade de filiais deve estar entre 1 e {MAXIMO_FILIAIS}.')
+        if tamanho_bloco < 1:
+            raise ValueError('O tamanho do bloco deve ser maior que zero.')
+
+        return self._gerar_unicos(quantidade, filiais, seed, formatado, tamanho_bloco)
+
+    def _gerar_unicos(self, quantidade: int, filiais: int, seed: Optional[int],
+                      formatado: bool, tamanho_bloco: int) -> Iterator[str]:
+        if np is not None:
+            for raizes in _raizes_unicas_numpy(quantidade, seed, tamanho_bloco):
+                yield from _textos_matriz(_matriz_filiais(raizes, filiais), formatado)
+            return
+
+        for bloco in _raizes_unicas_python(quantidade, Random(seed), tamanho_bloco):
+            for raiz in bloco:
+                for filial in range(1, filiais + 1):
+                    digitos = [int(c) for c in f'{raiz:08d}{filial:04d}']
+                    digitos.append(_digito_verificador(digitos, _PESOS_DIGITO_1))
+                    digitos.append(_digito_verificador(digitos, _PESOS_DIGITO_2))
+                    cnpj = ''.join(map(str, digitos))
+                    yield self.formatar(cnpj) if formatado else cnpj
+
     def formatar(self, cnpj: str) -> str:
         """Formata um CNPJ para conter os caracteres de divisão.
 
@@ -109,7 +387,7 @@ class CNPJ:
         """
         cnpj = str(cnpj)
 
-        cnpj = _apenas_numeros(cnpj)
+        cnpj = apenas_alfanumericos(cnpj)
 
         if len(str(cnpj)) != 14:
             raise ValueError('CNPJ deve conter um comprimento de 14 caracteres.')
@@ -117,6 +395,172 @@ class CNPJ:
         formatado = f'{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:14]}'
         return formatado
 
+    def codificar(self, cnpj: str) -> int:
+        """Codifica um CNPJ em um inteiro de 48 bits para armazenamento compacto.
+
+        A raiz ocupa os bits mais altos, seguida da filial e dos dígitos verificadores,
+        de modo que `codigo >> (BITS_FILIAL + BITS_DIGITOS)` é a raiz e os códigos
+        de uma mesma empresa ficam contíguos quando ordenados.
+
+        Parâmetros
+        -----------
+        cnpj: :class:`str`
+            CNPJ que deve ser codificado, formatado ou não.
+
+        Returns
+        -----------
+        código: :class:`int`
+            O código do CNPJ.
+
+        Raises
+        -----------
+        ValueError
+            Se o CNPJ passado não tiver um comprimento de 14 caracteres ou for alfanumérico.
+        """
+        return _codificar_normalizado(apenas_alfanumericos(cnpj))
+
+    def codificar_lote(self, cnpjs: Iterable[str]) -> array:
+        """Codifica vários CNPJs em um `array('q')`, com 8 bytes por CNPJ.
+
+        Parâmetros
+        -----------
+        cnpjs: :class:`Iterable[str]`
+            CNPJs que devem ser codificados, formatados ou não.
+
+        Returns
+        -----------
+        códigos: :class:`array.array`
+            Os códigos dos CNPJs, na mesma ordem da entrada.
+
+        Raises
+        -----------
+        ValueError
+            Se algum CNPJ não tiver um comprimento de 14 caracteres.
+        """
+        return array('q', map(_codificar_normalizado, apenas_alfanumericos_lote(cnpjs)))
+
+    def separar_codigo(self, codigo: int) -> Tuple[int, int, int]:
+        """Separa um código gerado por `codificar` em raiz, filial e dígitos verificadores.
+
+        Parâmetros
+        -----------
+        codigo: :class:`int`
+            Código do CNPJ.
+
+        Returns
+        -----------
+        partes: :class:`Tuple[int, int, int]`
+            A raiz, a filial e os dígitos verificadores.
+
+        Raises
+        -----------
+        ValueError
+            Se o código não representar um CNPJ.
+        """
+        codigo = int(codigo)
+        raiz = codigo >> (BITS_FILIAL + BITS_DIGITOS)
+        filial = (codigo >> BITS_DIGITOS) & ((1 << BITS_FILIAL) - 1)
+        digitos = codigo & ((1 << BITS_DIGITOS) - 1)
+
+        if codigo < 0 or raiz >= TOTAL_RAIZES or filial > MAXIMO_FILIAIS or digitos > 99:
+            raise ValueError('Código de CNPJ fora do intervalo permitido.')
+
+        return raiz, filial, digitos
+
+    def decodificar(self, codigo: int) -> str:
+        """Converte um código gerado por `codificar` de volta para o CNPJ.
+
+        Parâmetros
+        -----------
+        codigo: :class:`int`
+            Código do CNPJ.
+
+        Returns
+        -----------
+        cnpj: :class:`str`
+            O CNPJ não formatado.
+
+        Raises
+        -----------
+        ValueError
+            Se o código não representar um CNPJ.
+        """
+        raiz, filial, digitos = self.separar_codigo(codigo)
+        return f'{raiz:08d}{filial:04d}{digitos:02d}'
+
+    def formatar_lote(self, cnpjs: Iterable[str | int]) -> List[str]:
+        """Formata vários CNPJs de uma só vez.
+
+        Aceita textos, formatados ou não, e os códigos inteiros de `codificar`, inclusive
+        arrays `array('q')` e arrays numpy de inteiros, que são decodificados com operações
+        de bits vetorizadas.
+
+        Parâmetros
+        -----------
+        cnpjs: :class:`Iterable[str | int]`
+            CNPJs ou códigos de CNPJs que devem ser formatados.
+
+        Returns
+        -----------
+        cnpjs: :class:`List[str]`
+            Os CNPJs formatados, na mesma ordem da entrada.
+
+        Raises
+        -----------
+        ValueError
+            Se algum CNPJ não tiver um comprimento de 14 caracteres.
+        """
+        if np is not None and isinstance(cnpjs, array) and cnpjs.typecode == 'q':
+            cnpjs = np.frombuffer(cnpjs, dtype=np.int64)
+        if np is not None and isinstance(cnpjs, np.ndarray) and cnpjs.dtype.kind in 'iu':
+            return _textos_matriz(_matriz_codigos(cnpjs), True)
+
+        cnpjs = cnpjs if isinstance(cnpjs, list) else list(cnpjs)
+        if not set(map(type, cnpjs)) <= {str}:
+            cnpjs = [self.decodificar(cnpj) if isinstance(cnpj, Integral) else cnpj
+                     for cnpj in cnpjs]
+        normalizados = apenas_alfanumericos_lote(cnpjs)
+
+        if not all(len(cnpj) == 14 and cnpj.isascii() for cnpj in normalizados):
+            raise ValueError('CNPJ deve conter um comprimento de 14 caracteres.')
+
+        if np is None or not normalizados:
+            return [f'{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}'
+                    for cnpj in normalizados]
+
+        matriz = np.frombuffer(''.join(normalizados).encode('ascii'), dtype=np.uint8) - 48
+        return _textos_matriz(matriz.reshape(-1, 14), True)
+
+    def escrever_formatados(self,
+                            cnpjs: Iterable[str | int],
+                            saida: TextIO,
+                            terminador: str = '\n',
+                            tamanho_bloco: int = 65536) -> int:
+        """Formata os CNPJs em blocos, escrevendo diretamente no buffer de saída.
+
+        Parâmetros
+        -----------
+        cnpjs: :class:`Iterable[str | int]`
+            CNPJs ou códigos de CNPJs que devem ser formatados.
+        saida: :class:`TextIO`
+            Arquivo ou buffer de texto que recebe os CNPJs formatados.
+        terminador: :class:`str`
+            Texto escrito após cada CNPJ.
+        tamanho_bloco: :class:`int`
+            Quantidade de CNPJs formatados por vez.
+
+        Returns
+        -----------
+        quantidade: :class:`int`
+            Quantidade de CNPJs escritos.
+
+        Raises
+        -----------
+        ValueError
+            Se algum CNPJ não tiver um comprimento de 14 caracteres.
+        """
+        return escrever_em_blocos(self.formatar_lote, cnpjs, saida, terminador, tamanho_bloco)
+
     def gerar_formatado(self):
         """Gera um CNPJ aleatório e o retorna já formatado.
 
@@ -133,6 +577,9 @@ class CNPJ:
     def validar(self, cnpj: str) -> bool:
         """Verifica a autenticidade matemática do CNPJ.
 
+        Aceita também o CNPJ alfanumérico, em que as 12 primeiras posições podem conter
+        letras, que valem o seu código ASCII menos 48 no cálculo dos dígitos verificadores.
+
         Parâmetros
         -----------
         cnpj: :class:`str`
@@ -144,17 +591,136 @@ class CNPJ:
             `True` caso o CNPJ for válido, caso contrário, `False`.
         """
         cnpj = str(cnpj)
-        cnpj = _apenas_numeros(cnpj)
+        cnpj = apenas_alfanumericos(cnpj)
+
+        if self._cache is not None:
+            return self._cache(cnpj)
+
+        return _valida_normalizado(cnpj)
+
+    def validar_lote(self, cnpjs: Iterable[str]) -> Tuple[List[bool], List[int]]:
+        """Verifica a autenticidade matemática de vários CNPJs de uma só vez.
+
+        Quando o numpy está instalado, os caracteres são convertidos em uma matriz N×14
+        de valores por uma tabela de consulta e os dois dígitos verificadores são
+        calculados em um único produto matricial.
+
+        Parâmetros
+        -----------
+        cnpjs: :class:`Iterable[str]`
+            CNPJs que devem ser validados, formatados ou não.
+
+        Returns
+        -----------
+        resultado: :class:`Tuple[List[bool], List[int]]`
+            Uma lista com `True` para cada CNPJ válido e uma lista com o código
+            de falha de cada CNPJ (valores de :class:`MotivoInvalido`), na mesma
+            ordem da entrada.
+        """
+        normalizados = apenas_alfanumericos_lote(cnpjs)
+
+        if not normalizados:
+            return [], []
+
+        if np is None:
+            motivos = [_motivo_normalizado(cnpj) for cnpj in normalizados]
+            return [motivo == MotivoInvalido.valido.value for motivo in motivos], motivos
+
+        motivos_array = _motivos_normalizados(normalizados)
+        return (motivos_array == MotivoInvalido.valido.value).tolist(), motivos_array.tolist()
+
+    async def avalidar_lote(self,
+                            cnpjs: Iterable[str],
+                            tamanho_bloco: int = TAMANHO_BLOCO,
+                            limite_inline: int = LIMITE_INLINE,
+                            executor: Optional[Executor] = None) -> Tuple[List[bool], List[int]]:
+        """Versão assíncrona de `validar_lote` que não bloqueia o event loop.
+
+        Entradas com até `limite_inline` CNPJs são validadas diretamente; entradas maiores
+        são divididas em blocos validados no executor compartilhado.
 
-        try:
-            if _eh_sequencia(cnpj):
-                return False
+        Parâmetros
+        -----------
+        cnpjs: :class:`Iterable[str]`
+            CNPJs que devem ser validados, formatados ou não.
+        tamanho_bloco: :class:`int`
+            Quantidade de CNPJs validados por bloco.
+        limite_inline: :class:`int`
+            Quantidade máxima de CNPJs validados no próprio event loop.
+        executor: Optional[:class:`concurrent.futures.Executor`]
+            Executor utilizado no lugar do executor compartilhado.
+
+        Returns
+        -----------
+        resultado: :class:`Tuple[List[bool], List[int]]`
+            A lista de válidos e a lista de códigos de :class:`MotivoInvalido`,
+            na mesma ordem da entrada.
+        """
+        blocos = await executar_em_blocos(self.validar_lote, list(cnpjs), tamanho_bloco,
+                                          limite_inline, executor)
+        validos: List[bool] = []
+        motivos: List[int] = []
+        for validos_bloco, motivos_bloco in blocos:
+            validos.extend(validos_bloco)
+            motivos.extend(motivos_bloco)
 
-            novo_cnpj = _calcula_digito(cnpj=cnpj, digito=1)
-            novo_cnpj = _calcula_digito(cnpj=novo_cnpj, digito=2)
-        except ValueError:
-            return False
-        except IndexError:
-            return False
+        return validos, motivos
 
-        return novo_cnpj == cnpj
+    def validar_array(self, cnpjs):
+        """Verifica a autenticidade matemática de um array numpy de CNPJs.
+
+        Parâmetros
+        -----------
+        cnpjs: :class:`numpy.ndarray`
+            Pode ser uma matriz N×14 de valores (o código ASCII menos 48, ou seja,
+            os próprios dígitos e 17..42 para as letras), um array de textos
+            ou um array de inteiros com o número do CNPJ.
+
+        Returns
+        -----------
+        resultado: :class:`Tuple[numpy.ndarray, numpy.ndarray]`
+            A máscara booleana com `True` para cada CNPJ válido e o array
+            de códigos de falha (valores de :class:`MotivoInvalido`).
+
+        Raises
+        -----------
+        ImportError
+            Se o numpy não estiver instalado.
+        ValueError
+            Se a matriz de dígitos não tiver 14 colunas ou o array tiver mais de duas dimensões.
+        """
+        _requer_numpy()
+        cnpjs = np.asarray(cnpjs)
+
+        if cnpjs.ndim == 2:
+            if cnpjs.shape[1] != 14:
+                raise ValueError('A matriz de dígitos deve conter 14 colunas.')
+            motivos = _motivos_matriz(_valores_matriz(cnpjs))
+        elif cnpjs.ndim != 1:
+            raise ValueError('O array de CNPJs deve ter uma ou duas dimensões.')
+        elif cnpjs.dtype.kind in 'iu':
+            numeros = cnpjs.astype(np.int64)
+            potencias = 10 ** np.arange(13, -1, -1, dtype=np.int64)
+            motivos = _motivos_matriz(((numeros[:, None] // potencias) % 10).astype(np.uint8))
+            motivos[(numeros < 0) | (numeros >= 10 ** 14)] = MotivoInvalido.formato.value
+        else:
+            motivos = self._motivos_array_textos(cnpjs)
+
+        return motivos == MotivoInvalido.valido.value, motivos
+
+    @staticmethod
+    def _motivos_array_textos(cnpjs):
+        if cnpjs.dtype.kind == 'S':
+            cnpjs = cnpjs.astype(str)
+
+        if cnpjs.dtype.kind == 'U' and cnpjs.dtype.itemsize == 56:
+            # Textos de 14 caracteres já limpos dispensam a normalização
+            codigos = cnpjs.astype('<U14').view('<u4').reshape(-1, 14)
+            valores = _TABELA_VALORES_ARRAY[np.minimum(codigos, 255)]
+            if (valores != _CARACTERE_INVALIDO).all():
+                return _motivos_matriz(valores)
+
+        if cnpjs.size == 0:
+            return np.zeros(0, dtype=np.uint8)
+
+        return _motivos_normalizados(apenas_alfanumericos_lote(cnpjs.tolist()))
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+
+from array import array
+from bisect import bisect_left
+from numbers import Integral
+from typing import Iterable, Iterator
+
+from .cnpj import CNPJ
+from .cpf import CPF
+from .normalizacao import apenas_numeros
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _ordenados_unicos(codigos: Iterable[int]) -> array:
+    """Ordena e remove repetições dos códigos sem criar um inteiro Python por código."""
+    if np is None:
+        return array('q', sorted(set(codigos)))
+
+    if isinstance(codigos, (array, np.ndarray)):
+        valores = np.array(codigos, dtype=np.int64)
+    else:
+        valores = np.fromiter(codigos, dtype=np.int64)
+
+    valores.sort()
+    if valores.size:
+        unicos = np.empty(valores.size, dtype=bool)
+        unicos[0] = True
+        np.not_equal(valores[1:], valores[:-1], out=unicos[1:])
+        valores = valores[unicos]
+
+    resultado = array('q')
+    resultado.frombytes(memoryview(valores).cast('B'))
+    return resultado
+
+
+def _codificar(documento: str) -> int:
+    # O tipo do documento é decidido pela quantidade de dígitos
+    if len(apenas_numeros(documento)) == 11:
+        return CPF().codificar(documento)
+    return CNPJ().codificar(documento)
+
+
+class ConjuntoDocumentos:
+    """Conjunto compacto e ordenado de documentos codificados
+
+    Armazena os códigos de `CPF.codificar` ou `CNPJ.codificar` em um `array('q')`
+    ordenado e sem repetições, com 8 bytes por documento e busca binária O(log n).
+    """
+    _codigos: array
+
+    def __init__(self, codigos: Iterable[int] = ()) -> None:
+        """ Cria um conjunto a partir de códigos de documentos
+
+        Os códigos são copiados para um buffer de inteiros de 64 bits e ordenados nele
+        quando o numpy está instalado, sem materializar um `set` de inteiros Python.
+
+        Args:
+            codigos (Iterable[int], optional): Códigos dos documentos. Defaults to ().
+        """
+        self._codigos = _ordenados_unicos(codigos)
+
+    @classmethod
+    def de_cpfs(cls, cpfs: Iterable[str]) -> 'ConjuntoDocumentos':
+        """ Cria um conjunto codificando os CPFs informados
+
+        Args:
+            cpfs (Iterable[str]): CPFs, formatados ou não
+
+        Returns:
+            ConjuntoDocumentos: O conjunto com os CPFs codificados
+        """
+        return cls(CPF().codificar_lote(cpfs))
+
+    @classmethod
+    def de_cnpjs(cls, cnpjs: Iterable[str]) -> 'ConjuntoDocumentos':
+        """ Cria um conjunto codificando os CNPJs informados
+
+        Args:
+            cnpjs (Iterable[str]): CNPJs, formatados ou não
+
+        Returns:
+            ConjuntoDocumentos: O conjunto com os CNPJs codificados
+        """
+        return cls(CNPJ().codificar_lote(cnpjs))
+
+    def __contains__(self, codigo: object) -> bool:
+        # Textos são codificados como CPF (11 dígitos) ou CNPJ antes da busca
+        if isinstance(codigo, str):
+            try:
+                codigo = _codificar(codigo)
+            except ValueError:
+                return False
+        elif isinstance(codigo, Integral):
+            codigo = int(codigo)
+        else:
+            return False
+
+        indice = bisect_left(self._codigos, codigo)
+        return indice < len(self._codigos) and self._codigos[indice] == codigo
+
+    def __len__(self) -> int:
+        return len(self._codigos)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._codigos)
+
+    def __repr__(self) -> str:
+        return f'ConjuntoDocumentos({len(self)} documentos)'
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelos códigos, em bytes"""
+        return self._codigos.itemsize * len(self._codigos)
+
+    def intersecao(self, outro: 'ConjuntoDocumentos') -> 'ConjuntoDocumentos':
+        """ Retorna os códigos presentes nos dois conjuntos
+
+        As duas sequências ordenadas são percorridas uma única vez, em ordem de memória.
+
+        Args:
+            outro (ConjuntoDocumentos): Conjunto a ser comparado
+
+        Returns:
+            ConjuntoDocumentos: Um novo conjunto com os códigos em comum
+        """
+        primeiro, segundo = self._codigos, outro._codigos  # pylint: disable=protected-access
+        comuns = array('q')
+        i = j = 0
+
+        while i < len(primeiro) and j < len(segundo):
+            if primeiro[i] < segundo[j]:
+                i += 1
+            elif primeiro[i] > segundo[j]:
+                j += 1
+            else:
+                comuns.append(primeiro[i])
+                i += 1
+                j += 1
+
+        resultado = ConjuntoDocumentos()
+        resultado._codigos = comuns  # pylint: disable=protected-access
+        return resultado
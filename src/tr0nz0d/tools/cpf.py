@@ -26,17 +26,148 @@ DEALINGS IN THE SOFTWARE.
 Created by: Gabriel Menezes de Antonio (TR0NZ0D)
 """
 
-from random import randint
-from re import sub
+from array import array as Array
+from concurrent.futures import Executor
+from itertools import chain
+from numbers import Integral
+from operator import mul
+from random import Random, randint
+from typing import Iterable, List, Optional, TextIO
 
+from .assincrono import LIMITE_INLINE, TAMANHO_BLOCO, executar_em_blocos
+from .cache import ComCacheValidacao
+from .formatacao import escrever_em_blocos
+from .normalizacao import apenas_numeros, apenas_numeros_lote
 
-def _apenas_numeros(cpf):
-    cpf = str(cpf)
-    return sub(r'\D', '', cpf)
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
+_PESOS_DIGITO_1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_DIGITO_2 = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+# Quantidade de CPFs gerados por bloco; limita a memória temporária da geração em lote
+_BLOCO_GERACAO = 1 << 16
 
-class CPF:
+
+def _calcula_digito(digitos, pesos) -> int:
+    resto = sum(map(mul, digitos, pesos)) % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def _valida_normalizado(cpf: str) -> bool:
+    if len(cpf) != 11 or not cpf.isascii() or cpf == cpf[0] * 11:
+        return False
+
+    digitos = [int(c) for c in cpf]
+    return digitos[9] == _calcula_digito(digitos, _PESOS_DIGITO_1) and \
+        digitos[10] == _calcula_digito(digitos, _PESOS_DIGITO_2)
+
+
+def _requer_numpy():
+    if np is None:
+        raise ImportError('Esta operação vetorizada requer o pacote numpy instalado.')
+
+
+def _digito_matriz(matriz, pesos):
+    """Calcula o dígito verificador de cada linha com um produto escalar vetorizado."""
+    resto = (matriz[:, :len(pesos)] @ np.array(pesos, dtype=np.int32)) % 11
+    return np.where(resto < 2, 0, 11 - resto)
+
+
+def _valida_matriz(matriz):
+    """Valida uma matriz N×11 de dígitos com produtos escalares vetorizados."""
+    matriz = matriz.astype(np.int64, copy=False)
+    fora_do_intervalo = ((matriz < 0) | (matriz > 9)).any(axis=1)
+
+    digito1 = _digito_matriz(matriz, _PESOS_DIGITO_1)
+    digito2 = _digito_matriz(matriz, _PESOS_DIGITO_2)
+
+    sequencia = (matriz == matriz[:, :1]).all(axis=1)
+
+    return (matriz[:, 9] == digito1) & (matriz[:, 10] == digito2) & \
+        ~sequencia & ~fora_do_intervalo
+
+
+def _valida_normalizados(normalizados: List[str]):
+    """Converte CPFs normalizados em uma matriz uint8 e valida todos de uma vez."""
+    completos = [len(cpf) == 11 and cpf.isascii() for cpf in normalizados]
+    preenchidos = ''.join(cpf if completo else '0' * 11
+                          for cpf, completo in zip(normalizados, completos))
+
+    matriz = np.frombuffer(preenchidos.encode('ascii'), dtype=np.uint8).reshape(-1, 11) - 48
+    return _valida_matriz(matriz) & np.array(completos, dtype=bool)
+
+
+def _gerar_bloco(gerador, quantidade: int):
+    """Gera uma matriz uint8 N×11 de dígitos de CPFs válidos com o gerador numpy informado."""
+    potencias = 10 ** np.arange(8, -1, -1, dtype=np.int32)
+    matriz = np.empty((quantidade, 11), dtype=np.uint8)
+    pendentes = np.arange(quantidade)
+
+    # Sorteia novamente as poucas bases que resultariam em sequências de um mesmo dígito
+    while pendentes.size:
+        bases = gerador.integers(100000000, 1000000000, size=pendentes.size, dtype=np.int32)
+        matriz[pendentes, :9] = (bases[:, None] // potencias) % 10
+        matriz[pendentes, 9] = _digito_matriz(matriz[pendentes], _PESOS_DIGITO_1)
+        matriz[pendentes, 10] = _digito_matriz(matriz[pendentes], _PESOS_DIGITO_2)
+        pendentes = pendentes[(matriz[pendentes] == matriz[pendentes, :1]).all(axis=1)]
+
+    return matriz
+
+
+def _gerar_ascii(quantidade: int, seed: Optional[int], formatado: bool):
+    """Gera uma matriz de caracteres ASCII de CPFs válidos, um bloco de cada vez.
+
+    Cada bloco é escrito na matriz de saída, pré-alocada, de modo que a memória
+    temporária depende apenas do tamanho do bloco.
+    """
+    gerador = np.random.default_rng(seed)
+    saida = np.empty((quantidade, 14 if formatado else 11), dtype=np.uint8)
+    for inicio in range(0, quantidade, _BLOCO_GERACAO):
+        fim = min(inicio + _BLOCO_GERACAO, quantidade)
+        saida[inicio:fim] = _matriz_ascii(_gerar_bloco(gerador, fim - inicio), formatado)
+    return saida
+
+
+def _matriz_ascii(matriz, formatado: bool):
+    """Converte uma matriz N×11 de dígitos em caracteres ASCII, com os separadores opcionais."""
+    matriz = matriz.astype(np.uint8) + 48
+    if formatado:
+        separadores = np.array([ord('.'), ord('.'), ord('-')], dtype=np.uint8)
+        matriz = np.insert(matriz, [3, 6, 9], separadores, axis=1)
+    return matriz
+
+
+def _textos_matriz_ascii(matriz) -> List[str]:
+    tamanho = matriz.shape[1]
+    texto = matriz.tobytes().decode('ascii')
+    return [texto[inicio:inicio + tamanho] for inicio in range(0, len(texto), tamanho)]
+
+
+def _matriz_codigos(codigos):
+    """Converte um array de códigos inteiros em uma matriz N×11 de dígitos."""
+    codigos = np.asarray(codigos, dtype=np.int64)
+    if ((codigos < 0) | (codigos >= 10 ** 11)).any():
+        raise ValueError('Código de CPF fora do intervalo permitido.')
+    return (codigos[:, None] // 10 ** np.arange(10, -1, -1, dtype=np.int64)) % 10
+
+
+def _gerar_python(gerador: Random) -> str:
+    while True:
+        digitos = [int(c) for c in str(gerador.randint(100000000, 999999999))]
+        digitos.append(_calcula_digito(digitos, _PESOS_DIGITO_1))
+        digitos.append(_calcula_digito(digitos, _PESOS_DIGITO_2))
+
+        cpf = ''.join(map(str, digitos))
+        if cpf != cpf[0] * 11:
+            return cpf
+
+
+class CPF(ComCacheValidacao):
     """CPF Tools"""
+    _valida_normalizado = staticmethod(_valida_normalizado)
+
     def gerar(self) -> str:
         """Gera um CPF aleatório.
 
@@ -68,6 +199,58 @@ class CPF:
 
         return novo_cpf
 
+    def gerar_lote(self,
+                   quantidade: int,
+                   seed: Optional[int] = None,
+                   formatado: bool = False,
+                   array: bool = False):
+        """Gera vários CPFs aleatórios válidos de uma só vez.
+
+        Cada chamada utiliza o seu próprio gerador (`numpy.random.Generator` quando o
+        numpy está instalado, ou `random.Random`), portanto a mesma `seed` sempre produz
+        os mesmos CPFs no mesmo ambiente e chamadas simultâneas não compartilham estado.
+
+        Parâmetros
+        -----------
+        quantidade: :class:`int`
+            Quantidade de CPFs a serem gerados.
+        seed: Optional[:class:`int`]
+            Semente para tornar a geração reproduzível.
+        formatado: :class:`bool`
+            Se os CPFs devem ser retornados com os caracteres de divisão.
+        array: :class:`bool`
+            Se o resultado deve ser um `numpy.ndarray` de textos ao invés de uma lista.
+
+        Returns
+        -----------
+        cpfs: :class:`List[str]` | :class:`numpy.ndarray`
+            Os CPFs gerados.
+
+        Raises
+        -----------
+        ValueError
+            Se a quantidade for negativa.
+        ImportError
+            Se `array` for `True` e o numpy não estiver instalado.
+        """
+        if quantidade < 0:
+            raise ValueError('A quantidade de CPFs não pode ser negativa.')
+
+        if array:
+            _requer_numpy()
+
+        if np is None:
+            gerador = Random(seed)
+            cpfs = [_gerar_python(gerador) for _ in range(quantidade)]
+            return [self.formatar(cpf) for cpf in cpfs] if formatado else cpfs
+
+        matriz = _gerar_ascii(quantidade, seed, formatado)
+        if array:
+            tamanho = matriz.shape[1]
+            return matriz.view(f'S{tamanho}').reshape(-1).astype(f'U{tamanho}')
+
+        return _textos_matriz_ascii(matriz)
+
     def formatar(self, cpf: str) -> str:
         """Formata um CPF para conter os caracteres de divisão.
 
@@ -88,7 +271,7 @@ class CPF:
         """
         cpf = str(cpf)
 
-        cpf = _apenas_numeros(cpf)
+        cpf = apenas_numeros(cpf)
 
         if len(str(cpf)) != 11:
             raise ValueError('CPF deve conter um comprimento de 11 caracteres.')
@@ -96,6 +279,152 @@ class CPF:
         formatado = f'{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:11]}'
         return formatado
 
+    def codificar(self, cpf: str) -> int:
+        """Codifica um CPF em um inteiro de 64 bits para armazenamento compacto.
+
+        Parâmetros
+        -----------
+        cpf: :class:`str`
+            CPF que deve ser codificado, formatado ou não.
+
+        Returns
+        -----------
+        código: :class:`int`
+            O número do CPF, incluindo os dígitos verificadores.
+
+        Raises
+        -----------
+        ValueError
+            Se o CPF passado não tiver um comprimento de 11 caracteres.
+        """
+        cpf = apenas_numeros(cpf)
+
+        if len(cpf) != 11 or not cpf.isascii():
+            raise ValueError('CPF deve conter um comprimento de 11 caracteres.')
+
+        return int(cpf)
+
+    def codificar_lote(self, cpfs: Iterable[str]) -> Array:
+        """Codifica vários CPFs em um `array('q')`, com 8 bytes por CPF.
+
+        Parâmetros
+        -----------
+        cpfs: :class:`Iterable[str]`
+            CPFs que devem ser codificados, formatados ou não.
+
+        Returns
+        -----------
+        códigos: :class:`array.array`
+            Os códigos dos CPFs, na mesma ordem da entrada.
+
+        Raises
+        -----------
+        ValueError
+            Se algum CPF não tiver um comprimento de 11 caracteres.
+        """
+        normalizados = apenas_numeros_lote(cpfs)
+
+        if not all(len(cpf) == 11 and cpf.isascii() for cpf in normalizados):
+            raise ValueError('CPF deve conter um comprimento de 11 caracteres.')
+
+        return Array('q', map(int, normalizados))
+
+    def decodificar(self, codigo: int) -> str:
+        """Converte um código gerado por `codificar` de volta para o CPF.
+
+        Parâmetros
+        -----------
+        codigo: :class:`int`
+            Código do CPF.
+
+        Returns
+        -----------
+        cpf: :class:`str`
+            O CPF não formatado.
+
+        Raises
+        -----------
+        ValueError
+            Se o código não representar um CPF.
+        """
+        codigo = int(codigo)
+
+        if not 0 <= codigo < 10 ** 11:
+            raise ValueError('Código de CPF fora do intervalo permitido.')
+
+        return f'{codigo:011d}'
+
+    def formatar_lote(self, cpfs: Iterable[str | int]) -> List[str]:
+        """Formata vários CPFs de uma só vez.
+
+        Aceita textos, formatados ou não, e os códigos inteiros de `codificar`, inclusive
+        arrays `array('q')` e arrays numpy de inteiros, que são formatados sem passar por
+        textos intermediários.
+
+        Parâmetros
+        -----------
+        cpfs: :class:`Iterable[str | int]`
+            CPFs ou códigos de CPFs que devem ser formatados.
+
+        Returns
+        -----------
+        cpfs: :class:`List[str]`
+            Os CPFs formatados, na mesma ordem da entrada.
+
+        Raises
+        -----------
+        ValueError
+            Se algum CPF não tiver um comprimento de 11 caracteres.
+        """
+        if np is not None and isinstance(cpfs, Array) and cpfs.typecode == 'q':
+            cpfs = np.frombuffer(cpfs, dtype=np.int64)
+        if np is not None and isinstance(cpfs, np.ndarray) and cpfs.dtype.kind in 'iu':
+            return _textos_matriz_ascii(_matriz_ascii(_matriz_codigos(cpfs), True))
+
+        cpfs = cpfs if isinstance(cpfs, list) else list(cpfs)
+        if not set(map(type, cpfs)) <= {str}:
+            cpfs = [self.decodificar(cpf) if isinstance(cpf, Integral) else cpf for cpf in cpfs]
+        normalizados = apenas_numeros_lote(cpfs)
+
+        if not all(len(cpf) == 11 and cpf.isascii() for cpf in normalizados):
+            raise ValueError('CPF deve conter um comprimento de 11 caracteres.')
+
+        if np is None or not normalizados:
+            return [f'{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}' for cpf in normalizados]
+
+        matriz = np.frombuffer(''.join(normalizados).encode('ascii'), dtype=np.uint8) - 48
+        return _textos_matriz_ascii(_matriz_ascii(matriz.reshape(-1, 11), True))
+
+    def escrever_formatados(self,
+                            cpfs: Iterable[str | int],
+                            saida: TextIO,
+                            terminador: str = '\n',
+                            tamanho_bloco: int = 65536) -> int:
+        """Formata os CPFs em blocos, escrevendo diretamente no buffer de saída.
+
+        Parâmetros
+        -----------
+        cpfs: :class:`Iterable[str | int]`
+            CPFs ou códigos de CPFs que devem ser formatados.
+        saida: :class:`TextIO`
+            Arquivo ou buffer de texto que recebe os CPFs formatados.
+        terminador: :class:`str`
+            Texto escrito após cada CPF.
+        tamanho_bloco: :class:`int`
+            Quantidade de CPFs formatados por vez.
+
+        Returns
+        -----------
+        quantidade: :class:`int`
+            Quantidade de CPFs escritos.
+
+        Raises
+        -----------
+        ValueError
+            Se algum CPF não tiver um comprimento de 11 caracteres.
+        """
+        return escrever_em_blocos(self.formatar_lote, cpfs, saida, terminador, tamanho_bloco)
+
     def gerar_formatado(self):
         """Gera um CPF aleatório e o retorna já formatado.
 
@@ -123,44 +452,118 @@ class CPF:
             `True` caso o CPF for válido, caso contrário, `False`.
         """
         cpf = str(cpf)
-        cpf = sub(r'\D', '', cpf)
-
-        if not cpf.isnumeric() or len(str(cpf)) != 11:
-            return False
-
-        cpf_original = cpf[:-2]
-        novo_cpf = ''
-        digito1 = 0
-        digito2 = 0
-        current = 0
-        valor_soma1 = 0
-        valor_soma2 = 0
-
-        # Dígito 1
-        for c in range(10, 1, -1):
-            for n in cpf_original[current]:
-                valor1 = int(n) * c
-                valor_soma1 += valor1
-                current += 1
-                break
-        calculo1 = 11 - (valor_soma1 % 11)
-        calculo1_2 = calculo1 > 9
-        digito1 = 0 if calculo1_2 else calculo1
-        current = 0
-
-        # Dígito 2
-        for c in range(11, 1, -1):
-            for n in (cpf_original + str(digito1))[current]:
-                valor2 = int(n) * c
-                valor_soma2 += valor2
-                current += 1
-                break
-        calculo2 = 11 - (valor_soma2 % 11)
-        calculo2_2 = calculo2 > 9
-        digito2 = 0 if calculo2_2 else calculo2
-
-        novo_cpf = cpf_original + str(digito1) + str(digito2)
-
-        sequencia = novo_cpf == str(novo_cpf[0]) * len(cpf)
-
-        return cpf == novo_cpf and not sequencia
+        cpf = apenas_numeros(cpf)
+
+        if self._cache is not None:
+            return self._cache(cpf)
+
+        return _valida_normalizado(cpf)
+
+    def validar_lote(self, cpfs: Iterable[str]) -> List[bool]:
+        """Verifica a autenticidade matemática de vários CPFs de uma só vez.
+
+        Quando o numpy está instalado, os dígitos são convertidos em uma matriz
+        e os dígitos verificadores são calculados de forma vetorizada.
+
+        Parâmetros
+        -----------
+        cpfs: :class:`Iterable[str]`
+            CPFs que devem ser validados, formatados ou não.
+
+        Returns
+        -----------
+        válidos: :class:`List[bool]`
+            Uma lista com `True` para cada CPF válido e `False` para os inválidos,
+            na mesma ordem da entrada.
+        """
+        normalizados = apenas_numeros_lote(cpfs)
+
+        if not normalizados:
+            return []
+
+        if np is None:
+            return [_valida_normalizado(cpf) for cpf in normalizados]
+
+        return _valida_normalizados(normalizados).tolist()
+
+    async def avalidar_lote(self,
+                            cpfs: Iterable[str],
+                            tamanho_bloco: int = TAMANHO_BLOCO,
+                            limite_inline: int = LIMITE_INLINE,
+                            executor: Optional[Executor] = None) -> List[bool]:
+        """Versão assíncrona de `validar_lote` que não bloqueia o event loop.
+
+        Entradas com até `limite_inline` CPFs são validadas diretamente; entradas maiores
+        são divididas em blocos validados no executor compartilhado.
+
+        Parâmetros
+        -----------
+        cpfs: :class:`Iterable[str]`
+            CPFs que devem ser validados, formatados ou não.
+        tamanho_bloco: :class:`int`
+            Quantidade de CPFs validados por bloco.
+        limite_inline: :class:`int`
+            Quantidade máxima de CPFs validados no próprio event loop.
+        executor: Optional[:class:`concurrent.futures.Executor`]
+            Executor utilizado no lugar do executor compartilhado.
+
+        Returns
+        -----------
+        válidos: :class:`List[bool]`
+            Uma lista com `True` para cada CPF válido, na mesma ordem da entrada.
+        """
+        blocos = await executar_em_blocos(self.validar_lote, list(cpfs), tamanho_bloco,
+                                          limite_inline, executor)
+        return list(chain.from_iterable(blocos))
+
+    def validar_array(self, cpfs):
+        """Verifica a autenticidade matemática de um array numpy de CPFs.
+
+        Parâmetros
+        -----------
+        cpfs: :class:`numpy.ndarray`
+            Pode ser uma matriz N×11 de dígitos, um array de textos
+            ou um array de inteiros com o número do CPF.
+
+        Returns
+        -----------
+        máscara: :class:`numpy.ndarray`
+            Array booleano com `True` para cada CPF válido.
+
+        Raises
+        -----------
+        ImportError
+            Se o numpy não estiver instalado.
+        ValueError
+            Se a matriz de dígitos não tiver 11 colunas ou o array tiver mais de duas dimensões.
+        """
+        _requer_numpy()
+        cpfs = np.asarray(cpfs)
+
+        if cpfs.ndim == 2:
+            if cpfs.shape[1] != 11:
+                raise ValueError('A matriz de dígitos deve conter 11 colunas.')
+            return _valida_matriz(cpfs)
+
+        if cpfs.ndim != 1:
+            raise ValueError('O array de CPFs deve ter uma ou duas dimensões.')
+
+        if cpfs.dtype.kind in 'iu':
+            numeros = cpfs.astype(np.int64)
+            potencias = 10 ** np.arange(10, -1, -1, dtype=np.int64)
+            matriz = (numeros[:, None] // potencias) % 10
+            return _valida_matriz(matriz) & (numeros >= 0) & (numeros < 10 ** 11)
+
+        if cpfs.dtype.kind == 'S':
+            cpfs = cpfs.astype(str)
+
+        if cpfs.dtype.kind == 'U' and cpfs.dtype.itemsize == 44:
+            # Textos de 11 caracteres já limpos dispensam a normalização
+            codigos = cpfs.astype('<U11').view('<u4').reshape(-1, 11)
+            if ((codigos >= 48) & (codigos <= 57)).all():
+                return _valida_matriz(codigos - 48)
+
+        if cpfs.size == 0:
+            return np.zeros(0, dtype=bool)
+
+        return _valida_normalizados(apenas_numeros_lote(cpfs.tolist()))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+
+from enum import Enum
+from typing import Any, Iterable, List, NamedTuple, Tuple
+
+from .cnpj import MotivoInvalido
+from .cnpj import _motivos_normalizados as _motivos_cnpjs
+from .cnpj import _valida_normalizado as _valida_cnpj
+from .cpf import _valida_normalizado as _valida_cpf
+from .cpf import _valida_normalizados as _valida_cpfs
+from .normalizacao import apenas_alfanumericos, apenas_numeros, apenas_numeros_lote
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class TipoDocumento(Enum):
+    """Tipos de documento reconhecidos pelo comprimento do documento normalizado"""
+    desconhecido = 0
+    cpf = 1
+    cnpj = 2
+
+
+class ResultadoDocumento(NamedTuple):
+    """Resultado da validação de um documento de tipo detectado automaticamente"""
+    documento: str
+    tipo: TipoDocumento
+    valido: bool
+
+
+_TIPOS_NUMERICOS = {11: TipoDocumento.cpf, 14: TipoDocumento.cnpj}
+
+
+def _classificar_normalizado(numeros: str, documento: Any) -> Tuple[str, TipoDocumento]:
+    # 14 caracteres ASCII com letras formam um CNPJ alfanumérico, exceto quando as
+    # letras são um prefixo de um CPF, como em "CPF 529.982.247-25": com 11 dígitos,
+    # o documento só é tratado como CNPJ se os dígitos verificadores do CNPJ conferem
+    alfanumericos = apenas_alfanumericos(documento)
+    if len(alfanumericos) == 14 and alfanumericos.isascii() and not alfanumericos.isdecimal() \
+            and (len(numeros) != 11 or _valida_cnpj(alfanumericos)):
+        return alfanumericos, TipoDocumento.cnpj
+
+    if numeros.isascii() and (tipo := _TIPOS_NUMERICOS.get(len(numeros))) is not None:
+        return numeros, tipo
+    return alfanumericos, TipoDocumento.desconhecido
+
+
+def _validar_cpfs(normalizados: List[str]) -> List[bool]:
+    if np is None:
+        return [_valida_cpf(cpf) for cpf in normalizados]
+    return _valida_cpfs(normalizados).tolist()
+
+
+def _validar_cnpjs(normalizados: List[str]) -> List[bool]:
+    if np is None:
+        return [_valida_cnpj(cnpj) for cnpj in normalizados]
+    return (_motivos_cnpjs(normalizados) == MotivoInvalido.valido.value).tolist()
+
+
+class Documento:
+    """Valida CPFs e CNPJs misturados, detectando o tipo de cada documento"""
+
+    def classificar(self, documento: Any) -> TipoDocumento:
+        """ Detecta o tipo do documento pela quantidade de caracteres
+
+        Args:
+            documento (Any): Documento, formatado ou não
+
+        Returns:
+            TipoDocumento: `cpf` para 11 dígitos, `cnpj` para 14 dígitos ou caracteres
+                alfanuméricos e `desconhecido` nos demais
+        """
+        return _classificar_normalizado(apenas_numeros(documento), documento)[1]
+
+    def validar(self, documento: Any) -> ResultadoDocumento:
+        """ Detecta o tipo do documento e verifica seus dígitos verificadores
+
+        Args:
+            documento (Any): Documento, formatado ou não
+
+        Returns:
+            ResultadoDocumento: O documento normalizado, o tipo detectado e se é válido
+        """
+        normalizado, tipo = _classificar_normalizado(apenas_numeros(documento), documento)
+
+        if tipo is TipoDocumento.cpf:
+            valido = _valida_cpf(normalizado)
+        elif tipo is TipoDocumento.cnpj:
+            valido = _valida_cnpj(normalizado)
+        else:
+            valido = False
+
+        return ResultadoDocumento(normalizado, tipo, valido)
+
+    def validar_lote(self,
+                     documentos: Iterable[Any]) -> Tuple[List[bool], List[TipoDocumento]]:
+        """ Valida vários documentos de tipos misturados de uma só vez
+
+        Os documentos são normalizados e classificados em uma única passada; os CPFs e
+        os CNPJs são então validados separadamente pelos kernels vetorizados de cada tipo,
+        de modo que cada documento é validado apenas uma vez.
+
+        Args:
+            documentos (Iterable[Any]): Documentos, formatados ou não
+
+        Returns:
+            Tuple[List[bool], List[TipoDocumento]]: A validade e o tipo detectado de cada
+                documento, na mesma ordem da entrada
+        """
+        documentos = list(documentos)
+        classificados = [_classificar_normalizado(numeros, documento) for numeros, documento
+                         in zip(apenas_numeros_lote(documentos), documentos)]
+        normalizados = [normalizado for normalizado, _ in classificados]
+        tipos = [tipo for _, tipo in classificados]
+        validos = [False] * len(normalizados)
+
+        for tipo, validar in ((TipoDocumento.cpf, _validar_cpfs),
+                              (TipoDocumento.cnpj, _validar_cnpjs)):
+            indices = [indice for indice, atual in enumerate(tipos) if atual is tipo]
+            if not indices:
+                continue
+
+            resultados = validar([normalizados[indice] for indice in indices])
+            for indice, valido in zip(indices, resultados):
+                validos[indice] = valido
+
+        return validos, tipos
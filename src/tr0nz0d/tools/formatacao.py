@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+
+from itertools import islice
+from typing import Callable, Iterable, List, TextIO, TypeVar
+
+T = TypeVar('T')
+
+
+def escrever_em_blocos(formatar_lote: Callable[[List[T]], List[str]],
+                       valores: Iterable[T],
+                       saida: TextIO,
+                       terminador: str = '\n',
+                       tamanho_bloco: int = 65536) -> int:
+    """ Formata os valores em blocos e escreve o resultado diretamente na saída
+
+    Apenas um bloco é mantido em memória por vez, o que permite formatar arquivos
+    maiores que a memória disponível.
+
+    Args:
+        formatar_lote (Callable[[List[T]], List[str]]): Função que formata um bloco inteiro
+        valores (Iterable[T]): Valores a serem formatados
+        saida (TextIO): Arquivo ou buffer de texto que recebe os valores formatados
+        terminador (str, optional): Texto escrito após cada valor. Defaults to '\\n'.
+        tamanho_bloco (int, optional): Quantidade de valores por bloco. Defaults to 65536.
+
+    Returns:
+        int: Quantidade de valores escritos
+    """
+    if tamanho_bloco < 1:
+        raise ValueError('O tamanho do bloco deve ser positivo.')
+
+    iterador = iter(valores)
+    quantidade = 0
+
+    while bloco := list(islice(iterador, tamanho_bloco)):
+        formatados = formatar_lote(bloco)
+        saida.write(terminador.join(formatados))
+        saida.write(terminador)
+        quantidade += len(formatados)
+
+    return quantidade
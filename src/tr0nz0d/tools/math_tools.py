@@ -28,11 +28,23 @@ Created by: Gabriel Menezes de Antonio (TR0NZ0D)
 
 from __future__ import annotations
 
+from array import array as Array
 from datetime import datetime, timedelta
 from enum import Enum
+from fractions import Fraction
+from functools import lru_cache
+from itertools import islice
+from numbers import Real
+from time import perf_counter
+from typing import Any, Iterable, Iterator, NamedTuple
 
 from dateutil.relativedelta import relativedelta
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 
 class UnitOf(Enum):
     """Math units enum"""
@@ -95,58 +107,533 @@ class UnitsOfMeasurement(Enum):
 
     def group(self) -> UnitOf:
         """Group unit types"""
-        match self:
-            # Length
-            case self.meter |\
-                    self.millimeter |\
-                    self.centimeter |\
-                    self.decimeter |\
-                    self.kilometer |\
-                    self.inch |\
-                    self.foot |\
-                    self.yard |\
-                    self.mile:
-                return UnitOf.length
-            # Area
-            case self.square_meter |\
-                    self.square_inch |\
-                    self.square_feet |\
-                    self.square_yard |\
-                    self.square_mile:
-                return UnitOf.area
-            # Volume
-            case self.cubic_meter |\
-                    self.cubic_inch |\
-                    self.cubic_foot |\
-                    self.cubic_yard |\
-                    self.liter |\
-                    self.milliliter |\
-                    self.centiliter |\
-                    self.deciliter |\
-                    self.hectoliter |\
-                    self.gallon:
-                return UnitOf.volume
-            # Time
-            case self.second | self.minute | self.hour | self.day | self.year:
-                return UnitOf.time
-            # Speed
-            case self.miles_per_hour | self.meters_per_second | self.kilometer_per_hour:
-                return UnitOf.speed
-            # Mass
-            case self.gram | self.kilogram:
-                return UnitOf.mass
-            case _:
-                return UnitOf.unknown
+        return _UNIT_GROUPS[self]
+
+    def dimension(self) -> Dimension:
+        """Exponents of the base dimensions of the unit type"""
+        return _GROUP_DIMENSIONS[_UNIT_GROUPS[self]]
+
+    def __mul__(self, other: UnitsOfMeasurement | DerivedUnit) -> DerivedUnit:
+        return _DERIVED_UNITS[self] * other
+
+    def __truediv__(self, other: UnitsOfMeasurement | DerivedUnit) -> DerivedUnit:
+        return _DERIVED_UNITS[self] / other
+
+    def __pow__(self, exponent: int) -> DerivedUnit:
+        return _DERIVED_UNITS[self] ** exponent
+
+
+# Group of every unit, built once at import
+_UNIT_GROUPS: dict[UnitsOfMeasurement, UnitOf] = {
+    **dict.fromkeys((UnitsOfMeasurement.meter,
+                     UnitsOfMeasurement.millimeter,
+                     UnitsOfMeasurement.centimeter,
+                     UnitsOfMeasurement.decimeter,
+                     UnitsOfMeasurement.kilometer,
+                     UnitsOfMeasurement.inch,
+                     UnitsOfMeasurement.foot,
+                     UnitsOfMeasurement.yard,
+                     UnitsOfMeasurement.mile), UnitOf.length),
+    **dict.fromkeys((UnitsOfMeasurement.square_meter,
+                     UnitsOfMeasurement.square_inch,
+                     UnitsOfMeasurement.square_feet,
+                     UnitsOfMeasurement.square_yard,
+                     UnitsOfMeasurement.square_mile), UnitOf.area),
+    **dict.fromkeys((UnitsOfMeasurement.cubic_meter,
+                     UnitsOfMeasurement.cubic_inch,
+                     UnitsOfMeasurement.cubic_foot,
+                     UnitsOfMeasurement.cubic_yard,
+                     UnitsOfMeasurement.liter,
+                     UnitsOfMeasurement.milliliter,
+                     UnitsOfMeasurement.centiliter,
+                     UnitsOfMeasurement.deciliter,
+                     UnitsOfMeasurement.hectoliter,
+                     UnitsOfMeasurement.gallon), UnitOf.volume),
+    **dict.fromkeys((UnitsOfMeasurement.second,
+                     UnitsOfMeasurement.minute,
+                     UnitsOfMeasurement.hour,
+                     UnitsOfMeasurement.day,
+                     UnitsOfMeasurement.year), UnitOf.time),
+    **dict.fromkeys((UnitsOfMeasurement.miles_per_hour,
+                     UnitsOfMeasurement.meters_per_second,
+                     UnitsOfMeasurement.kilometer_per_hour), UnitOf.speed),
+    **dict.fromkeys((UnitsOfMeasurement.gram,
+                     UnitsOfMeasurement.kilogram), UnitOf.mass),
+}
+
+# Convertibility between every pair of units, indexed by UnitsOfMeasurement.value
+_COMPATIBILITY_MATRIX: tuple[tuple[bool, ...], ...] = tuple(
+    tuple(_UNIT_GROUPS[from_unit] is _UNIT_GROUPS[to_unit] for to_unit in UnitsOfMeasurement)
+    for from_unit in UnitsOfMeasurement
+)
+
+
+# Exact value of one unit in the base unit of its group (meter, square meter, cubic meter,
+# second, meters per second and kilogram), from the definitions of the units
+_EXACT_BASE_FACTORS: dict[UnitsOfMeasurement, Fraction] = {
+    # Length
+    UnitsOfMeasurement.meter: Fraction(1),
+    UnitsOfMeasurement.millimeter: Fraction('0.001'),
+    UnitsOfMeasurement.centimeter: Fraction('0.01'),
+    UnitsOfMeasurement.decimeter: Fraction('0.1'),
+    UnitsOfMeasurement.kilometer: Fraction(1000),
+    UnitsOfMeasurement.inch: Fraction('0.0254'),
+    UnitsOfMeasurement.foot: Fraction('0.3048'),
+    UnitsOfMeasurement.yard: Fraction('0.9144'),
+    UnitsOfMeasurement.mile: Fraction('1609.344'),
+
+    # Area
+    UnitsOfMeasurement.square_meter: Fraction(1),
+    UnitsOfMeasurement.square_inch: Fraction('0.00064516'),
+    UnitsOfMeasurement.square_feet: Fraction('0.09290304'),
+    UnitsOfMeasurement.square_yard: Fraction('0.83612736'),
+    UnitsOfMeasurement.square_mile: Fraction('2589988.110336'),
+
+    # Volume
+    UnitsOfMeasurement.cubic_meter: Fraction(1),
+    UnitsOfMeasurement.cubic_inch: Fraction('0.000016387064'),
+    UnitsOfMeasurement.cubic_foot: Fraction('0.028316846592'),
+    UnitsOfMeasurement.cubic_yard: Fraction('0.764554857984'),
+    UnitsOfMeasurement.liter: Fraction('0.001'),
+    UnitsOfMeasurement.milliliter: Fraction('0.000001'),
+    UnitsOfMeasurement.centiliter: Fraction('0.00001'),
+    UnitsOfMeasurement.deciliter: Fraction('0.0001'),
+    UnitsOfMeasurement.hectoliter: Fraction('0.1'),
+    UnitsOfMeasurement.gallon: Fraction('0.003785411784'),
+
+    # Time
+    UnitsOfMeasurement.second: Fraction(1),
+    UnitsOfMeasurement.minute: Fraction(60),
+    UnitsOfMeasurement.hour: Fraction(3600),
+    UnitsOfMeasurement.day: Fraction(86400),
+    UnitsOfMeasurement.year: Fraction(31536000),
+
+    # Speed
+    UnitsOfMeasurement.miles_per_hour: Fraction('0.44704'),
+    UnitsOfMeasurement.meters_per_second: Fraction(1),
+    UnitsOfMeasurement.kilometer_per_hour: Fraction(1000, 3600),
+
+    # Mass
+    UnitsOfMeasurement.gram: Fraction('0.001'),
+    UnitsOfMeasurement.kilogram: Fraction(1),
+}
+
+# Exact multiplier for every (from, to) pair of units of the same group
+_EXACT_CONVERSION_FACTORS: dict[tuple[UnitsOfMeasurement, UnitsOfMeasurement], Fraction] = {
+    (from_unit, to_unit): from_factor / to_factor
+    for from_unit, from_factor in _EXACT_BASE_FACTORS.items()
+    for to_unit, to_factor in _EXACT_BASE_FACTORS.items()
+    if _UNIT_GROUPS[from_unit] is _UNIT_GROUPS[to_unit]
+}
+
+# Float tables for the fast path, rounded once from the exact ones
+_BASE_UNIT_FACTORS: dict[UnitsOfMeasurement, float] = {
+    unit: float(factor) for unit, factor in _EXACT_BASE_FACTORS.items()
+}
+_CONVERSION_FACTORS: dict[tuple[UnitsOfMeasurement, UnitsOfMeasurement], float] = {
+    pair: float(factor) for pair, factor in _EXACT_CONVERSION_FACTORS.items()
+}
+
+
+class Dimension(NamedTuple):
+    """Exponents of the base dimensions (length, time and mass) of a unit"""
+    length: int = 0
+    time: int = 0
+    mass: int = 0
+
+
+# Dimension of every group of convertible units
+_GROUP_DIMENSIONS: dict[UnitOf, Dimension] = {
+    UnitOf.length: Dimension(length=1),
+    UnitOf.area: Dimension(length=2),
+    UnitOf.volume: Dimension(length=3),
+    UnitOf.time: Dimension(time=1),
+    UnitOf.speed: Dimension(length=1, time=-1),
+    UnitOf.mass: Dimension(mass=1),
+}
+
+
+class DerivedUnit:
+    """Unit composed from the base dimensions, such as `kilometer / hour` or `meter ** 2`
+
+    Derived units are built by multiplying, dividing and raising `UnitsOfMeasurement`
+    members (or other derived units) and carry their value in the base units of their
+    dimensions (meter, second and kilogram). Two derived units are equal when both the
+    factor and the dimension are equal, whatever their names.
+    """
+    __slots__ = ('_name', '_exact_factor', '_factor', '_dimension', '_hash')
+
+    def __init__(self,
+                 name: str,
+                 factor: Fraction | float | int | str,
+                 dimension: Dimension) -> None:
+        self._name = name
+        self._exact_factor = Fraction(factor)
+        self._factor = float(self._exact_factor)
+        self._dimension = dimension
+        # Derived units are looked up on every conversion, so the hash is computed once
+        self._hash = hash((self._exact_factor, dimension))
+
+    @property
+    def name(self) -> str:
+        """Readable name of the unit"""
+        return self._name
+
+    @property
+    def factor(self) -> float:
+        """Value of one unit in the base units of its dimensions"""
+        return self._factor
+
+    @property
+    def exact_factor(self) -> Fraction:
+        """Exact value of one unit in the base units of its dimensions"""
+        return self._exact_factor
+
+    @property
+    def dimension(self) -> Dimension:
+        """Exponents of the base dimensions of the unit"""
+        return self._dimension
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not DerivedUnit:
+            return NotImplemented
+        return self._exact_factor == other._exact_factor and self._dimension == other._dimension
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f'DerivedUnit({self._name!r}, {self._exact_factor!r}, {self._dimension!r})'
+
+    def __mul__(self, other: UnitsOfMeasurement | DerivedUnit) -> DerivedUnit:
+        other = _as_derived(other)
+        return DerivedUnit(f'{self._name}*{other._name}', self._exact_factor * other._exact_factor,
+                           Dimension(*map(int.__add__, self._dimension, other._dimension)))
+
+    def __truediv__(self, other: UnitsOfMeasurement | DerivedUnit) -> DerivedUnit:
+        other = _as_derived(other)
+        return DerivedUnit(f'{self._name}/{other._name}', self._exact_factor / other._exact_factor,
+                           Dimension(*map(int.__sub__, self._dimension, other._dimension)))
+
+    def __pow__(self, exponent: int) -> DerivedUnit:
+        if not isinstance(exponent, int):
+            return NotImplemented
+        return DerivedUnit(f'{self._name}^{exponent}', self._exact_factor ** exponent,
+                           Dimension(*(value * exponent for value in self._dimension)))
+
+
+# Derived unit equivalent to every unit of measurement
+_DERIVED_UNITS: dict[UnitsOfMeasurement, DerivedUnit] = {
+    unit: DerivedUnit(unit.name, factor, unit.dimension())
+    for unit, factor in _EXACT_BASE_FACTORS.items()
+}
+
+
+def _as_derived(unit: UnitsOfMeasurement | DerivedUnit) -> DerivedUnit:
+    if unit.__class__ is DerivedUnit:
+        return unit
+    try:
+        return _DERIVED_UNITS[unit]
+    except (KeyError, TypeError):
+        raise TypeError(f"Not a unit of measurement: {unit!r}") from None
+
+
+@lru_cache(maxsize=1024)
+def _derived_factor(from_unit: DerivedUnit, to_unit: DerivedUnit, exact: bool) -> Fraction | float:
+    if from_unit.dimension != to_unit.dimension:
+        raise ConversionError(f"Impossible to convert {from_unit.name} to {to_unit.name}")
+    factor = from_unit.exact_factor / to_unit.exact_factor
+    return factor if exact else float(factor)
+
+
+def _factor_not_in_table(from_unit: UnitsOfMeasurement | DerivedUnit,
+                         to_unit: UnitsOfMeasurement | DerivedUnit,
+                         exact: bool) -> Fraction | float:
+    if from_unit.__class__ is DerivedUnit or to_unit.__class__ is DerivedUnit:
+        return _derived_factor(_as_derived(from_unit), _as_derived(to_unit), exact)
+    raise ConversionError(f"Impossible to convert {from_unit.name} to {to_unit.name}")
+
+
+def _conversion_factor(from_unit: UnitsOfMeasurement | DerivedUnit,
+                       to_unit: UnitsOfMeasurement | DerivedUnit) -> float:
+    factor = _CONVERSION_FACTORS.get((from_unit, to_unit))
+    if factor is not None:
+        return factor
+    return _factor_not_in_table(from_unit, to_unit, False)
+
+
+def _exact_conversion_factor(from_unit: UnitsOfMeasurement | DerivedUnit,
+                             to_unit: UnitsOfMeasurement | DerivedUnit) -> Fraction:
+    factor = _EXACT_CONVERSION_FACTORS.get((from_unit, to_unit))
+    if factor is not None:
+        return factor
+    return _factor_not_in_table(from_unit, to_unit, True)
+
+
+# Symbols and aliases accepted when parsing units from text, besides the member names
+_UNIT_SYMBOLS: dict[UnitsOfMeasurement, tuple[str, ...]] = {
+    # Length
+    UnitsOfMeasurement.meter: ('m', 'meters', 'metre', 'metres'),
+    UnitsOfMeasurement.millimeter: ('mm', 'millimeters'),
+    UnitsOfMeasurement.centimeter: ('cm', 'centimeters'),
+    UnitsOfMeasurement.decimeter: ('dm', 'decimeters'),
+    UnitsOfMeasurement.kilometer: ('km', 'kilometers'),
+    UnitsOfMeasurement.inch: ('in', 'inches', '"'),
+    UnitsOfMeasurement.foot: ('ft', 'feet', "'"),
+    UnitsOfMeasurement.yard: ('yd', 'yards'),
+    UnitsOfMeasurement.mile: ('mi', 'miles'),
+
+    # Area
+    UnitsOfMeasurement.square_meter: ('m2', 'm²', 'sq m', 'square meters'),
+    UnitsOfMeasurement.square_inch: ('in2', 'in²', 'sq in', 'square inches'),
+    UnitsOfMeasurement.square_feet: ('ft2', 'ft²', 'sq ft', 'square foot'),
+    UnitsOfMeasurement.square_yard: ('yd2', 'yd²', 'sq yd', 'square yards'),
+    UnitsOfMeasurement.square_mile: ('mi2', 'mi²', 'sq mi', 'square miles'),
+
+    # Volume
+    UnitsOfMeasurement.cubic_meter: ('m3', 'm³', 'cu m', 'cubic meters'),
+    UnitsOfMeasurement.cubic_inch: ('in3', 'in³', 'cu in', 'cubic inches'),
+    UnitsOfMeasurement.cubic_foot: ('ft3', 'ft³', 'cu ft', 'cubic feet'),
+    UnitsOfMeasurement.cubic_yard: ('yd3', 'yd³', 'cu yd', 'cubic yards'),
+    UnitsOfMeasurement.liter: ('l', 'liters', 'litre', 'litres'),
+    UnitsOfMeasurement.milliliter: ('ml', 'milliliters'),
+    UnitsOfMeasurement.centiliter: ('cl', 'centiliters'),
+    UnitsOfMeasurement.deciliter: ('dl', 'deciliters'),
+    UnitsOfMeasurement.hectoliter: ('hl', 'hectoliters'),
+    UnitsOfMeasurement.gallon: ('gal', 'gallons'),
+
+    # Time
+    UnitsOfMeasurement.second: ('s', 'sec', 'seconds'),
+    UnitsOfMeasurement.minute: ('min', 'minutes'),
+    UnitsOfMeasurement.hour: ('h', 'hr', 'hours'),
+    UnitsOfMeasurement.day: ('d', 'days'),
+    UnitsOfMeasurement.year: ('y', 'yr', 'years'),
+
+    # Speed
+    UnitsOfMeasurement.miles_per_hour: ('mph', 'mi/h'),
+    UnitsOfMeasurement.meters_per_second: ('m/s', 'mps'),
+    UnitsOfMeasurement.kilometer_per_hour: ('km/h', 'kph', 'kmh'),
+
+    # Mass
+    UnitsOfMeasurement.gram: ('g', 'grams'),
+    UnitsOfMeasurement.kilogram: ('kg', 'kilograms'),
+}
+
+# Unit of every lowercase symbol, alias and member name (with underscores or spaces)
+_UNIT_ALIASES: dict[str, UnitsOfMeasurement] = {
+    alias: unit
+    for unit, symbols in _UNIT_SYMBOLS.items()
+    for alias in (*symbols, unit.name, unit.name.replace('_', ' '))
+}
+
+# Code (`UnitsOfMeasurement.value`) of every alias, for bulk parsing
+_UNIT_CODES: dict[str, int] = {alias: unit.value for alias, unit in _UNIT_ALIASES.items()}
+
+# Characters of the numeric part of a measure; no unit symbol starts with one of them
+_NUMBER_CHARACTERS = '0123456789.+-eE_ \t'
+
+
+def _parse_symbol(symbol: str) -> UnitsOfMeasurement:
+    try:
+        return _UNIT_ALIASES[symbol]
+    except KeyError:
+        pass
+    try:
+        return _UNIT_ALIASES[' '.join(symbol.lower().split())]
+    except KeyError:
+        raise ValueError(f"Unknown unit of measurement: {symbol}") from None
+
+
+def _parse_measure_symbol(text: str, symbol: str) -> UnitsOfMeasurement:
+    try:
+        return _parse_symbol(symbol)
+    except ValueError:
+        raise ValueError(f"Invalid measure: {text!r}") from None
+
+
+def _resolve_unit(unit: UnitsOfMeasurement | str | int) -> UnitsOfMeasurement:
+    if isinstance(unit, UnitsOfMeasurement):
+        return unit
+    if isinstance(unit, str):
+        try:
+            return UnitsOfMeasurement[unit]
+        except KeyError:
+            return _parse_symbol(unit)
+    return UnitsOfMeasurement(unit)
 
 
 class ConvertibleMeasureUnit:
-    """Convertible measure unit object"""
-    measure_unit: UnitsOfMeasurement
-    value: float | int
+    """Convertible measure unit object
+
+    Immutable value type: instances hold no `__dict__`, compare equal when both the unit
+    and the value are equal and can be used as dict keys or set members.
+    """
+    __slots__ = ('_measure_unit', '_value')
+
+    def __init__(self, unit: UnitsOfMeasurement | str | int, value: float | int) -> None:
+        if unit.__class__ is not UnitsOfMeasurement:
+            unit = _resolve_unit(unit)
+        self._measure_unit = unit
+        self._value = value
+
+    @classmethod
+    def _from_trusted(cls, unit: UnitsOfMeasurement, value: float | int) -> ConvertibleMeasureUnit:
+        """Build an instance skipping the unit resolution, for units known to be members"""
+        measure = object.__new__(cls)
+        measure._measure_unit = unit
+        measure._value = value
+        return measure
+
+    @property
+    def measure_unit(self) -> UnitsOfMeasurement:
+        """Unit of measurement of the value"""
+        return self._measure_unit
+
+    @property
+    def value(self) -> float | int:
+        """Measured value"""
+        return self._value
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not ConvertibleMeasureUnit:
+            return NotImplemented
+        return self._measure_unit is other._measure_unit and self._value == other._value
+
+    def __hash__(self) -> int:
+        return hash((self._measure_unit, self._value))
+
+    def __repr__(self) -> str:
+        return f'ConvertibleMeasureUnit({self._measure_unit.name}, {self._value!r})'
+
+    def _value_in_own_unit(self, other: ConvertibleMeasureUnit) -> float | int:
+        """Value of another measure expressed in the unit of this one"""
+        # pylint: disable=protected-access
+        if other._measure_unit is self._measure_unit:
+            return other._value
+        if other._value.__class__ is Fraction:
+            # Exact values stay exact
+            return other._value * _exact_conversion_factor(other._measure_unit, self._measure_unit)
+        return other._value * _conversion_factor(other._measure_unit, self._measure_unit)
+
+    # Arithmetic keeps the unit of the left operand; measures of different groups raise
+    # ConversionError. Ordering compares the measured quantities, while `==` stays
+    # structural (same unit and same value) so that it agrees with `__hash__`.
+
+    def __add__(self, other: object) -> ConvertibleMeasureUnit:
+        if other.__class__ is not ConvertibleMeasureUnit:
+            return NotImplemented
+        return _new_measure(self._measure_unit, self._value + self._value_in_own_unit(other))
+
+    def __radd__(self, other: object) -> ConvertibleMeasureUnit:
+        # Allows the builtin `sum()`, which starts from 0
+        if other == 0 and other.__class__ is not ConvertibleMeasureUnit:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: object) -> ConvertibleMeasureUnit:
+        if other.__class__ is not ConvertibleMeasureUnit:
+            return NotImplemented
+        return _new_measure(self._measure_unit, self._value - self._value_in_own_unit(other))
+
+    def __mul__(self, other: object) -> ConvertibleMeasureUnit:
+        if not isinstance(other, Real):
+            return NotImplemented
+        return _new_measure(self._measure_unit, self._value * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: object) -> ConvertibleMeasureUnit | float:
+        if other.__class__ is ConvertibleMeasureUnit:
+            return self._value / self._value_in_own_unit(other)
+        if not isinstance(other, Real):
+            return NotImplemented
+        return _new_measure(self._measure_unit, self._value / other)
+
+    def __neg__(self) -> ConvertibleMeasureUnit:
+        return _new_measure(self._measure_unit, -self._value)
+
+    def __pos__(self) -> ConvertibleMeasureUnit:
+        return self
+
+    def __abs__(self) -> ConvertibleMeasureUnit:
+        return _new_measure(self._measure_unit, abs(self._value))
+
+    def __lt__(self, other: object) -> bool:
+        if other.__class__ is not ConvertibleMeasureUnit:
+            return NotImplemented
+        return self._value < self._value_in_own_unit(other)
+
+    def __le__(self, other: object) -> bool:
+        if other.__class__ is not ConvertibleMeasureUnit:
+            return NotImplemented
+        return self._value <= self._value_in_own_unit(other)
+
+    def __gt__(self, other: object) -> bool:
+        if other.__class__ is not ConvertibleMeasureUnit:
+            return NotImplemented
+        return self._value > self._value_in_own_unit(other)
+
+    def __ge__(self, other: object) -> bool:
+        if other.__class__ is not ConvertibleMeasureUnit:
+            return NotImplemented
+        return self._value >= self._value_in_own_unit(other)
+
+    @staticmethod
+    def _base_total(measures: Iterable[ConvertibleMeasureUnit]
+                    ) -> tuple[float, int, UnitsOfMeasurement | None]:
+        """Sum of the measures in the base unit of their group, in a single pass
+
+        The group and the base factor are looked up again only when the unit changes
+        between consecutive measures.
 
-    def __init__(self, unit: UnitsOfMeasurement, value: float | int) -> None:
-        self.measure_unit = unit
-        self.value = value
+        Returns:
+            tuple[float, int, UnitsOfMeasurement | None]: The total in the base unit,
+                how many measures were read and the unit of the first one
+        """
+        # pylint: disable=protected-access
+        total = 0.0
+        count = 0
+        first_unit = group = unit = None
+        factor = 1.0
+        for measure in measures:
+            if measure._measure_unit is not unit:
+                unit = measure._measure_unit
+                if group is None:
+                    first_unit, group = unit, _UNIT_GROUPS[unit]
+                elif _UNIT_GROUPS[unit] is not group:
+                    raise ConversionError(f"Impossible to aggregate \
+{first_unit.name} and {unit.name}")
+                factor = _BASE_UNIT_FACTORS[unit]
+            total += measure._value * factor
+            count += 1
+        return total, count, first_unit
+
+    @staticmethod
+    def _largest(measures: Iterable[ConvertibleMeasureUnit], sign: int) -> ConvertibleMeasureUnit:
+        """Largest measure compared in the base unit of their group, after applying `sign`
+
+        A sign of -1 returns the smallest measure instead.
+        """
+        # pylint: disable=protected-access
+        best = None
+        best_value = float('-inf')
+        first_unit = group = unit = None
+        factor = 1.0
+        for measure in measures:
+            if measure._measure_unit is not unit:
+                unit = measure._measure_unit
+                if group is None:
+                    first_unit, group = unit, _UNIT_GROUPS[unit]
+                elif _UNIT_GROUPS[unit] is not group:
+                    raise ConversionError(f"Impossible to compare \
+{first_unit.name} and {unit.name}")
+                factor = sign * _BASE_UNIT_FACTORS[unit]
+            value = measure._value * factor
+            if value > best_value or best is None:
+                best, best_value = measure, value
+        if best is None:
+            raise ValueError("Cannot aggregate an empty sequence of measures")
+        return best
 
     def check_if_convertible(self, new_unit: UnitsOfMeasurement) -> bool:
         """ Cheks if current measure unit is convertible to new unit
@@ -157,1045 +644,64 @@ class ConvertibleMeasureUnit:
         Returns:
             bool: True if convertible, otherwise False
         """
-        return self.measure_unit.group().name == new_unit.group().name
+        return _UNIT_GROUPS[self._measure_unit] is _UNIT_GROUPS[new_unit]
 
-    def convert_to(self, new_unit: UnitsOfMeasurement) -> ConvertibleMeasureUnit:
+    def convert_to(self,
+                   new_unit: UnitsOfMeasurement,
+                   exact: bool = False) -> ConvertibleMeasureUnit:
         """ Convert a measure unit to a new type, updating it's value
-        (value convert is approximated)
 
         Args:
             new_unit (UnitsOfMeasurement): New desired unit type
+            exact (bool, optional): Converts with exact factors, returning a `Fraction`
+                value. Exactness requires an exact value too (int, Fraction, Decimal or
+                a decimal string); floats are taken at their binary value. Defaults to False.
 
         Raises:
-            ConversionError: Conversion error if not possible to convert units
+            ConversionError: Conversion error if not possible to convert units, or if
+                `new_unit` is not a UnitsOfMeasurement; values in derived units are
+                converted with `MathTools.convert_value` or `MathTools.convert_array`
 
         Returns:
             ConvertibleMeasureUnit: A new converted ConvertibleMeasureUnit
         """
-        if not self.check_if_convertible(new_unit):
-            raise ConversionError(f"Impossible to convert \
-{self.measure_unit.name} to {new_unit.name}")
-        current_unit_group = self.measure_unit.group()
-
-        match current_unit_group.name:
-            case UnitOf.length.name:
-                match self.measure_unit.name:
-                    case UnitsOfMeasurement.meter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.millimeter.name:
-                                new_value = self.value * 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.millimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centimeter.name:
-                                new_value = self.value * 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.decimeter.name:
-                                new_value = self.value * 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.decimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.kilometer.name:
-                                new_value = self.value / 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.kilometer,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.inch.name:
-                                new_value = self.value * 39.37
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.foot.name:
-                                new_value = self.value * 3.281
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.yard.name:
-                                new_value = self.value * 1.094
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.mile.name:
-                                new_value = self.value / 1609
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.millimeter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.meter.name:
-                                new_value = self.value / 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centimeter.name:
-                                new_value = self.value / 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.decimeter.name:
-                                new_value = self.value / 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.decimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.kilometer.name:
-                                new_value = self.value / 1e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.kilometer,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.inch.name:
-                                new_value = self.value / 25.4
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.foot.name:
-                                new_value = self.value / 304.8
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.yard.name:
-                                new_value = self.value / 914.4
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.mile.name:
-                                new_value = self.value / 1.609e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.centimeter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.meter.name:
-                                new_value = self.value / 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.millimeter.name:
-                                new_value = self.value * 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.millimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.decimeter.name:
-                                new_value = self.value / 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.decimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.kilometer.name:
-                                new_value = self.value / 100000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.kilometer,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.inch.name:
-                                new_value = self.value / 2.54
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.foot.name:
-                                new_value = self.value / 30.48
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.yard.name:
-                                new_value = self.value / 91.44
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.mile.name:
-                                new_value = self.value / 160900
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.decimeter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.meter.name:
-                                new_value = self.value / 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.millimeter.name:
-                                new_value = self.value * 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.millimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centimeter.name:
-                                new_value = self.value * 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.kilometer.name:
-                                new_value = self.value / 10000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.kilometer,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.inch.name:
-                                new_value = self.value * 3.937
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.foot.name:
-                                new_value = self.value / 3.048
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.yard.name:
-                                new_value = self.value / 9.144
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.mile.name:
-                                new_value = self.value / 16090
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.kilometer.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.meter.name:
-                                new_value = self.value * 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.millimeter.name:
-                                new_value = self.value * 1e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.millimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centimeter.name:
-                                new_value = self.value * 100000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.decimeter.name:
-                                new_value = self.value * 10000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.decimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.inch.name:
-                                new_value = self.value * 39370
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.foot.name:
-                                new_value = self.value * 3281
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.yard.name:
-                                new_value = self.value * 1094
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.mile.name:
-                                new_value = self.value / 1.609
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.inch.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.meter.name:
-                                new_value = self.value / 39.37
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.millimeter.name:
-                                new_value = self.value * 25.4
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.millimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centimeter.name:
-                                new_value = self.value * 2.54
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.decimeter.name:
-                                new_value = self.value / 3.937
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.decimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.kilometer.name:
-                                new_value = self.value / 39370
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.kilometer,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.foot.name:
-                                new_value = self.value / 12
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.yard.name:
-                                new_value = self.value / 36
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.mile.name:
-                                new_value = self.value / 63360
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.foot.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.meter.name:
-                                new_value = self.value / 3.281
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.millimeter.name:
-                                new_value = self.value * 304.8
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.millimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centimeter.name:
-                                new_value = self.value * 30.48
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.decimeter.name:
-                                new_value = self.value * 3.048
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.decimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.kilometer.name:
-                                new_value = self.value / 3281
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.kilometer,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.inch.name:
-                                new_value = self.value * 12
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.yard.name:
-                                new_value = self.value / 3
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.mile.name:
-                                new_value = self.value / 5280
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.yard.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.meter.name:
-                                new_value = self.value / 1.094
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.millimeter.name:
-                                new_value = self.value * 914.4
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.millimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centimeter.name:
-                                new_value = self.value * 91.44
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.decimeter.name:
-                                new_value = self.value * 9.144
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.decimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.kilometer.name:
-                                new_value = self.value / 1094
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.kilometer,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.inch.name:
-                                new_value = self.value * 36
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.foot.name:
-                                new_value = self.value * 3
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.mile.name:
-                                new_value = self.value / 1760
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.mile.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.meter.name:
-                                new_value = self.value * 1609
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.millimeter.name:
-                                new_value = self.value * 1.609e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.millimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centimeter.name:
-                                new_value = self.value * 160900
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.decimeter.name:
-                                new_value = self.value * 16090
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.decimeter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.kilometer.name:
-                                new_value = self.value * 1.609
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.kilometer,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.inch.name:
-                                new_value = self.value * 63360
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.foot.name:
-                                new_value = self.value * 5280
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.yard.name:
-                                new_value = self.value * 1760
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.yard,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case _:
-                        return self
-            case UnitOf.area.name:
-                match self.measure_unit.name:
-                    case UnitsOfMeasurement.square_meter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.square_inch.name:
-                                new_value = self.value * 1550
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_feet.name:
-                                new_value = self.value * 10.764
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_feet,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_yard.name:
-                                new_value = self.value * 1.196
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_mile.name:
-                                new_value = self.value / 2.59e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.square_inch.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.square_meter.name:
-                                new_value = self.value / 1550
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_feet.name:
-                                new_value = self.value / 144
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_feet,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_yard.name:
-                                new_value = self.value / 1296
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_mile.name:
-                                new_value = self.value / 4.014e+9
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.square_feet.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.square_meter.name:
-                                new_value = self.value / 10.764
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_inch.name:
-                                new_value = self.value * 144
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_yard.name:
-                                new_value = self.value / 9
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_mile.name:
-                                new_value = self.value / 2.788e+7
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.square_yard.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.square_meter.name:
-                                new_value = self.value / 1.196
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_inch.name:
-                                new_value = self.value * 1296
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_feet.name:
-                                new_value = self.value * 9
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_feet,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_mile.name:
-                                new_value = self.value / 3.098e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_mile,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.square_mile.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.square_meter.name:
-                                new_value = self.value * 2.59e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_inch.name:
-                                new_value = self.value * 4.014e+9
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_feet.name:
-                                new_value = self.value * 2.788e+7
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_feet,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.square_yard.name:
-                                new_value = self.value * 3.098e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.square_yard,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case _:
-                        return self
-            case UnitOf.volume.name:
-                match self.measure_unit.name:
-                    case UnitsOfMeasurement.cubic_meter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_inch.name:
-                                new_value = self.value * 61020
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_foot.name:
-                                new_value = self.value * 35.315
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_yard.name:
-                                new_value = self.value * 1.308
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.liter.name:
-                                new_value = self.value * 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.liter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.milliliter.name:
-                                new_value = self.value * 1e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.milliliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centiliter.name:
-                                new_value = self.value * 100000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centiliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.deciliter.name:
-                                new_value = self.value * 10000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.deciliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hectoliter.name:
-                                new_value = self.value * 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hectoliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.gallon.name:
-                                new_value = self.value * 264.2
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gallon,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.cubic_inch.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_meter.name:
-                                new_value = self.value / 61020
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_foot.name:
-                                new_value = self.value / 1728
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_yard.name:
-                                new_value = self.value / 46660
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.liter.name:
-                                new_value = self.value / 61.024
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.liter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.milliliter.name:
-                                new_value = self.value * 16.387
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.milliliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centiliter.name:
-                                new_value = self.value * 1.639
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centiliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.deciliter.name:
-                                new_value = self.value / 6.102
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.deciliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hectoliter.name:
-                                new_value = self.value / 6102
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hectoliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.gallon.name:
-                                new_value = self.value / 231
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gallon,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.cubic_foot.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_meter.name:
-                                new_value = self.value / 35.315
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_inch.name:
-                                new_value = self.value * 1728
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_yard.name:
-                                new_value = self.value / 27
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.liter.name:
-                                new_value = self.value * 28.317
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.liter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.milliliter.name:
-                                new_value = self.value * 28320
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.milliliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centiliter.name:
-                                new_value = self.value * 2832
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centiliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.deciliter.name:
-                                new_value = self.value * 283.2
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.deciliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hectoliter.name:
-                                new_value = self.value / 3.532
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hectoliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.gallon.name:
-                                new_value = self.value * 7.481
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gallon,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.cubic_yard.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_meter.name:
-                                new_value = self.value / 1.308
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_inch.name:
-                                new_value = self.value * 46660
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_foot.name:
-                                new_value = self.value * 27
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.liter.name:
-                                new_value = self.value * 764.6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.liter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.milliliter.name:
-                                new_value = self.value * 764600
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.milliliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centiliter.name:
-                                new_value = self.value * 76460
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centiliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.deciliter.name:
-                                new_value = self.value * 7646
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.deciliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hectoliter.name:
-                                new_value = self.value * 7.646
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hectoliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.gallon.name:
-                                new_value = self.value * 202
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gallon,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.liter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_meter.name:
-                                new_value = self.value / 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_inch.name:
-                                new_value = self.value * 61.024
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_foot.name:
-                                new_value = self.value / 28.317
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_yard.name:
-                                new_value = self.value / 764.6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.milliliter.name:
-                                new_value = self.value * 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.milliliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centiliter.name:
-                                new_value = self.value * 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centiliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.deciliter.name:
-                                new_value = self.value * 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.deciliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hectoliter.name:
-                                new_value = self.value / 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hectoliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.gallon.name:
-                                new_value = self.value / 3.785
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gallon,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.milliliter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_meter.name:
-                                new_value = self.value / 1e+6
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_inch.name:
-                                new_value = self.value / 16.387
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_foot.name:
-                                new_value = self.value / 28320
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_yard.name:
-                                new_value = self.value / 764600
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.liter.name:
-                                new_value = self.value / 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.liter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centiliter.name:
-                                new_value = self.value / 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centiliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.deciliter.name:
-                                new_value = self.value / 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.deciliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hectoliter.name:
-                                new_value = self.value / 100000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hectoliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.gallon.name:
-                                new_value = self.value / 3785
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gallon,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.centiliter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_meter.name:
-                                new_value = self.value / 100000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_inch.name:
-                                new_value = self.value / 1.639
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_foot.name:
-                                new_value = self.value / 2832
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_yard.name:
-                                new_value = self.value / 76460
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.liter.name:
-                                new_value = self.value / 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.liter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.milliliter.name:
-                                new_value = self.value * 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.milliliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.deciliter.name:
-                                new_value = self.value / 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.deciliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hectoliter.name:
-                                new_value = self.value / 10000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hectoliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.gallon.name:
-                                new_value = self.value / 378.5
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gallon,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.deciliter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_meter.name:
-                                new_value = self.value / 10000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_inch.name:
-                                new_value = self.value * 6.102
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_foot.name:
-                                new_value = self.value / 283.2
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_yard.name:
-                                new_value = self.value / 7646
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.liter.name:
-                                new_value = self.value / 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.liter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.milliliter.name:
-                                new_value = self.value * 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.milliliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centiliter.name:
-                                new_value = self.value * 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centiliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hectoliter.name:
-                                new_value = self.value / 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hectoliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.gallon.name:
-                                new_value = self.value / 37.854
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gallon,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.hectoliter.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_meter.name:
-                                new_value = self.value / 10
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_inch.name:
-                                new_value = self.value * 6102
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_foot.name:
-                                new_value = self.value * 3.531
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_yard.name:
-                                new_value = self.value / 7.646
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.liter.name:
-                                new_value = self.value * 100
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.liter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.milliliter.name:
-                                new_value = self.value * 100000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.milliliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centiliter.name:
-                                new_value = self.value * 10000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centiliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.deciliter.name:
-                                new_value = self.value * 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.deciliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.gallon.name:
-                                new_value = self.value * 26.417
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gallon,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.gallon.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.cubic_meter.name:
-                                new_value = self.value / 264.2
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_meter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_inch.name:
-                                new_value = self.value * 231
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_inch,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_foot.name:
-                                new_value = self.value / 7.48
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_foot,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.cubic_yard.name:
-                                new_value = self.value / 202
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.cubic_yard,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.liter.name:
-                                new_value = self.value * 3.785
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.liter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.milliliter.name:
-                                new_value = self.value * 3785
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.milliliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.centiliter.name:
-                                new_value = self.value * 378.5
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.centiliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.deciliter.name:
-                                new_value = self.value * 37.854
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.deciliter,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hectoliter.name:
-                                new_value = self.value / 26.417
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hectoliter,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case _:
-                        return self
-            case UnitOf.time.name:
-                match self.measure_unit.name:
-                    case UnitsOfMeasurement.second.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.minute.name:
-                                new_value = self.value / 60
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.minute,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hour.name:
-                                new_value = self.value / 3600
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hour,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.day.name:
-                                new_value = self.value / 86400
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.day,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.year.name:
-                                new_value = self.value / 3.154e+7
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.year,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.minute.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.second.name:
-                                new_value = self.value * 60
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.second,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hour.name:
-                                new_value = self.value / 60
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hour,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.day.name:
-                                new_value = self.value / 1440
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.day,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.year.name:
-                                new_value = self.value / 525600
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.year,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.hour.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.second.name:
-                                new_value = self.value * 3600
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.second,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.minute.name:
-                                new_value = self.value * 60
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.minute,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.day.name:
-                                new_value = self.value / 24
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.day,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.year.name:
-                                new_value = self.value / 8760
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.year,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.day.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.second.name:
-                                new_value = self.value * 86400
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.second,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.minute.name:
-                                new_value = self.value * 1440
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.minute,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hour.name:
-                                new_value = self.value * 24
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hour,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.year.name:
-                                new_value = self.value / 365
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.year,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.year.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.second.name:
-                                new_value = self.value * 3.154e+7
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.second,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.minute.name:
-                                new_value = self.value * 525600
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.minute,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.hour.name:
-                                new_value = self.value * 8760
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.hour,
-                                                              value=new_value)
-                            case UnitsOfMeasurement.day.name:
-                                new_value = self.value * 365
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.day,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case _:
-                        return self
-            case UnitOf.speed.name:
-                match self.measure_unit.name:
-                    case UnitsOfMeasurement.miles_per_hour.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.meters_per_second.name:
-                                new_value = self.value / 2.237
-                                return ConvertibleMeasureUnit(
-                                    unit=UnitsOfMeasurement.meters_per_second,
-                                    value=new_value)
-                            case UnitsOfMeasurement.kilometer_per_hour.name:
-                                new_value = self.value * 1.609
-                                return ConvertibleMeasureUnit(
-                                    unit=UnitsOfMeasurement.kilometer_per_hour,
-                                    value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.meters_per_second.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.miles_per_hour.name:
-                                new_value = self.value * 2.237
-                                return ConvertibleMeasureUnit(
-                                    unit=UnitsOfMeasurement.miles_per_hour,
-                                    value=new_value)
-                            case UnitsOfMeasurement.kilometer_per_hour.name:
-                                new_value = self.value * 3.6
-                                return ConvertibleMeasureUnit(
-                                    unit=UnitsOfMeasurement.kilometer_per_hour,
-                                    value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.kilometer_per_hour.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.miles_per_hour.name:
-                                new_value = self.value / 1.609
-                                return ConvertibleMeasureUnit(
-                                    unit=UnitsOfMeasurement.miles_per_hour,
-                                    value=new_value)
-                            case UnitsOfMeasurement.meters_per_second.name:
-                                new_value = self.value / 3.6
-                                return ConvertibleMeasureUnit(
-                                    unit=UnitsOfMeasurement.meters_per_second,
-                                    value=new_value)
-                            case _:
-                                return self
-                    case _:
-                        return self
-            case UnitOf.mass.name:
-                match self.measure_unit.name:
-                    case UnitsOfMeasurement.gram.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.kilogram.name:
-                                new_value = self.value / 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.kilogram,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case UnitsOfMeasurement.kilogram.name:
-                        match new_unit.name:
-                            case UnitsOfMeasurement.gram.name:
-                                new_value = self.value * 1000
-                                return ConvertibleMeasureUnit(unit=UnitsOfMeasurement.gram,
-                                                              value=new_value)
-                            case _:
-                                return self
-                    case _:
-                        return self
-            case _:
-                return self
+        if new_unit.__class__ is not UnitsOfMeasurement:
+            raise ConversionError(f"Impossible to convert {self._measure_unit.name} to \
+{new_unit!r}: measure units only hold UnitsOfMeasurement, use MathTools.convert_value \
+or MathTools.convert_array for derived units")
+        if exact:
+            factor = _exact_conversion_factor(self._measure_unit, new_unit)
+            return ConvertibleMeasureUnit._from_trusted(new_unit, Fraction(self._value) * factor)
+        factor = _conversion_factor(self._measure_unit, new_unit)
+        return ConvertibleMeasureUnit._from_trusted(new_unit, self._value * factor)
+
+
+_new_measure = ConvertibleMeasureUnit._from_trusted  # pylint: disable=protected-access
+_base_total = ConvertibleMeasureUnit._base_total  # pylint: disable=protected-access
+_largest = ConvertibleMeasureUnit._largest  # pylint: disable=protected-access
+
+
+def _from_base(total: float,
+               first_unit: UnitsOfMeasurement,
+               unit: UnitsOfMeasurement | None) -> ConvertibleMeasureUnit:
+    """Express a total in the base unit of the group of `first_unit` in `unit`"""
+    if unit is None:
+        unit = first_unit
+    elif _UNIT_GROUPS[unit] is not _UNIT_GROUPS[first_unit]:
+        _conversion_factor(first_unit, unit)
+    return _new_measure(unit, total / _BASE_UNIT_FACTORS[unit])
 
 
 class MathTools:
     """Mathematical tools"""
 
-    def build_unit(self, unit: UnitsOfMeasurement, value: float | int) -> ConvertibleMeasureUnit:
+    def build_unit(self,
+                   unit: UnitsOfMeasurement | str | int,
+                   value: float | int) -> ConvertibleMeasureUnit:
         """ Build ConvertibleMeasureUnit
 
         Args:
-            unit (UnitsOfMeasurement): Unit type
+            unit (UnitsOfMeasurement | str | int): Unit type, its name or its value
             value (float | int): Unit value
 
         Returns:
@@ -1203,6 +709,23 @@ class MathTools:
         """
         return ConvertibleMeasureUnit(unit, value)
 
+    def build_units(self,
+                    unit: UnitsOfMeasurement | str | int,
+                    values: Iterable[float | int]) -> list[ConvertibleMeasureUnit]:
+        """ Build many ConvertibleMeasureUnit of the same unit type
+
+        The unit is resolved once for the whole batch.
+
+        Args:
+            unit (UnitsOfMeasurement | str | int): Unit type, its name or its value
+            values (Iterable[float | int]): Unit values
+
+        Returns:
+            list[ConvertibleMeasureUnit]: The new instances, in the same order as the values
+        """
+        unit = _resolve_unit(unit)
+        return [_new_measure(unit, value) for value in values]
+
     def convert_measure_units(self,
                               unit: ConvertibleMeasureUnit,
                               new_unit: UnitsOfMeasurement) -> ConvertibleMeasureUnit:
@@ -1217,151 +740,527 @@ class MathTools:
         """
         return unit.convert_to(new_unit)
 
+    def can_convert(self, from_unit: UnitsOfMeasurement, to_unit: UnitsOfMeasurement) -> bool:
+        """ Checks if values can be converted between two unit types
+
+        Args:
+            from_unit (UnitsOfMeasurement): Current unit type
+            to_unit (UnitsOfMeasurement): New desired unit type
+
+        Returns:
+            bool: True if convertible, otherwise False
+        """
+        return _COMPATIBILITY_MATRIX[from_unit.value][to_unit.value]
 
-class CalculableDate:
-    """Calculable date object"""
-    _stored_year: int
-    _stored_month: int
-    _stored_day: int
-    _stored_hour: int
-    _stored_minute: int
-    _stored_second: int
+    def convertible_units(self, unit: UnitsOfMeasurement) -> tuple[UnitsOfMeasurement, ...]:
+        """ List every unit type that a unit can be converted to, itself included
+
+        Args:
+            unit (UnitsOfMeasurement): Unit type
+
+        Returns:
+            tuple[UnitsOfMeasurement, ...]: The units of the same group, in declaration order
+        """
+        return tuple(other for other in UnitsOfMeasurement
+                     if _COMPATIBILITY_MATRIX[unit.value][other.value])
+
+    def compatibility_matrix(self) -> tuple[tuple[bool, ...], ...]:
+        """ Convertibility between every pair of unit types
+
+        The matrix is built once at import and indexed by `UnitsOfMeasurement.value`:
+        `matrix[from_unit.value][to_unit.value]` is True when the conversion is possible.
+
+        Returns:
+            tuple[tuple[bool, ...], ...]: The immutable compatibility matrix
+        """
+        return _COMPATIBILITY_MATRIX
+
+    def conversion_factor(self,
+                          from_unit: UnitsOfMeasurement | DerivedUnit,
+                          to_unit: UnitsOfMeasurement | DerivedUnit,
+                          exact: bool = False) -> Fraction | float:
+        """ Multiplier that converts values between two unit types of the same dimension
+
+        Factors between units of measurement come from the precomputed tables; factors
+        involving derived units are computed from their dimensions and cached per pair.
+        Float factors are the exact ones rounded once.
+
+        Args:
+            from_unit (UnitsOfMeasurement | DerivedUnit): Current unit type
+            to_unit (UnitsOfMeasurement | DerivedUnit): New desired unit type
+            exact (bool, optional): Returns the exact `Fraction` factor. Defaults to False.
+
+        Raises:
+            ConversionError: Conversion error if not possible to convert units
+
+        Returns:
+            Fraction | float: The conversion factor
+        """
+        if exact:
+            return _exact_conversion_factor(from_unit, to_unit)
+        return _conversion_factor(from_unit, to_unit)
+
+    def convert_value(self,
+                      value: float | int | Fraction,
+                      from_unit: UnitsOfMeasurement | DerivedUnit,
+                      to_unit: UnitsOfMeasurement | DerivedUnit,
+                      exact: bool = False) -> Fraction | float:
+        """ Convert a single value, e.g. from `kilometer / hour` to `meter / second`
+
+        Args:
+            value (float | int | Fraction): Value in the current unit type
+            from_unit (UnitsOfMeasurement | DerivedUnit): Current unit type
+            to_unit (UnitsOfMeasurement | DerivedUnit): New desired unit type
+            exact (bool, optional): Converts with exact factors, returning a `Fraction`.
+                Defaults to False.
+
+        Raises:
+            ConversionError: Conversion error if not possible to convert units
+
+        Returns:
+            Fraction | float: The converted value
+        """
+        if exact:
+            return Fraction(value) * _exact_conversion_factor(from_unit, to_unit)
+        return value * _conversion_factor(from_unit, to_unit)
+
+    def convert_array(self,
+                      values: Iterable[float | int] | Any,
+                      from_unit: UnitsOfMeasurement | DerivedUnit,
+                      to_unit: UnitsOfMeasurement | DerivedUnit) -> Any:
+        """ Convert many values at once, without building a ConvertibleMeasureUnit per value
+
+        The conversion factor is looked up once and applied to the whole container:
+        NumPy arrays are multiplied in a single vectorized operation, `array.array`
+        buffers go through NumPy when it is installed.
+
+        Args:
+            values (Iterable[float | int] | Any): A list, tuple, `array.array` or NumPy array
+            from_unit (UnitsOfMeasurement | DerivedUnit): Unit type of the values
+            to_unit (UnitsOfMeasurement | DerivedUnit): New desired unit type
+
+        Raises:
+            ConversionError: Conversion error if not possible to convert units
+
+        Returns:
+            Any: The converted values in the same container type (a list for other
+                iterables). Integer `array.array` typecodes become `'d'`.
+        """
+        factor = _conversion_factor(from_unit, to_unit)
+
+        if np is not None and isinstance(values, np.ndarray):
+            return values * factor
+
+        if isinstance(values, Array):
+            typecode = values.typecode if values.typecode in 'fd' else 'd'
+            if np is not None and len(values):
+                converted = np.frombuffer(values, dtype=values.typecode) * factor
+                return Array(typecode, converted.astype(typecode).tobytes())
+            return Array(typecode, [value * factor for value in values])
+
+        converted = [value * factor for value in values]
+        return tuple(converted) if isinstance(values, tuple) else converted
+
+    def sum_units(self,
+                  measures: Iterable[ConvertibleMeasureUnit],
+                  unit: UnitsOfMeasurement | None = None) -> ConvertibleMeasureUnit:
+        """ Sum many measures of the same group, whatever their unit types
+
+        Values are accumulated in the base unit of the group in a single pass, and the
+        total is converted once to the result unit.
+
+        Args:
+            measures (Iterable[ConvertibleMeasureUnit]): The measures to be summed
+            unit (UnitsOfMeasurement | None, optional): Unit type of the result.
+                Defaults to the unit of the first measure.
+
+        Raises:
+            ConversionError: If the measures or the result unit belong to different groups
+            ValueError: If there are no measures and no result unit
+
+        Returns:
+            ConvertibleMeasureUnit: The total
+        """
+        total, count, first_unit = _base_total(measures)
+        if not count:
+            if unit is None:
+                raise ValueError("Cannot sum an empty sequence of measures without a unit")
+            return _new_measure(unit, 0.0)
+        return _from_base(total, first_unit, unit)
+
+    def mean_units(self,
+                   measures: Iterable[ConvertibleMeasureUnit],
+                   unit: UnitsOfMeasurement | None = None) -> ConvertibleMeasureUnit:
+        """ Arithmetic mean of many measures of the same group, whatever their unit types
+
+        Args:
+            measures (Iterable[ConvertibleMeasureUnit]): The measures to be averaged
+            unit (UnitsOfMeasurement | None, optional): Unit type of the result.
+                Defaults to the unit of the first measure.
+
+        Raises:
+            ConversionError: If the measures or the result unit belong to different groups
+            ValueError: If there are no measures
+
+        Returns:
+            ConvertibleMeasureUnit: The mean
+        """
+        total, count, first_unit = _base_total(measures)
+        if not count:
+            raise ValueError("Cannot average an empty sequence of measures")
+        return _from_base(total / count, first_unit, unit)
+
+    def min_unit(self, measures: Iterable[ConvertibleMeasureUnit]) -> ConvertibleMeasureUnit:
+        """ Smallest of many measures of the same group, whatever their unit types
+
+        Args:
+            measures (Iterable[ConvertibleMeasureUnit]): The measures to be compared
+
+        Raises:
+            ConversionError: If the measures belong to different groups
+            ValueError: If there are no measures
+
+        Returns:
+            ConvertibleMeasureUnit: The smallest measure itself, in its own unit
+        """
+        return _largest(measures, -1)
+
+    def max_unit(self, measures: Iterable[ConvertibleMeasureUnit]) -> ConvertibleMeasureUnit:
+        """ Largest of many measures of the same group, whatever their unit types
+
+        Args:
+            measures (Iterable[ConvertibleMeasureUnit]): The measures to be compared
+
+        Raises:
+            ConversionError: If the measures belong to different groups
+            ValueError: If there are no measures
+
+        Returns:
+            ConvertibleMeasureUnit: The largest measure itself, in its own unit
+        """
+        return _largest(measures, 1)
+
+    def parse_unit(self, text: str) -> ConvertibleMeasureUnit:
+        """ Parse a measure written as text, such as `"12.5 km"`, `"3ft"` or `"40 mph"`
+
+        The unit may be a symbol, a common alias or the member name, in any case.
+
+        Args:
+            text (str): The number followed by the unit
+
+        Raises:
+            ValueError: If the number or the unit is invalid
+
+        Returns:
+            ConvertibleMeasureUnit: The parsed measure, with a float value
+        """
+        symbol = text.lstrip(_NUMBER_CHARACTERS)
+        unit = _parse_measure_symbol(text, symbol)
+        try:
+            value = float(text[:len(text) - len(symbol)])
+        except ValueError:
+            raise ValueError(f"Invalid measure: {text!r}") from None
+        return _new_measure(unit, value)
+
+    def parse_many(self, texts: Iterable[str]) -> tuple[Array, Array]:
+        """ Parse many measures written as text into compact arrays
+
+        Units are looked up in a precomputed alias table and numbers are parsed by
+        `float`, without regular expressions. The arrays use 1 byte per unit code and
+        8 bytes per value, and can be wrapped by NumPy without copies (`np.frombuffer`).
+
+        Args:
+            texts (Iterable[str]): The measures, each a number followed by a unit
+
+        Raises:
+            ValueError: If a number or a unit is invalid
+
+        Returns:
+            tuple[Array, Array]: Unit codes (`UnitsOfMeasurement.value`) as `array('B')`
+                and values as `array('d')`, in the same order as the texts
+        """
+        texts = texts if isinstance(texts, (list, tuple)) else list(texts)
+        symbols = [text.lstrip(_NUMBER_CHARACTERS) for text in texts]
+
+        codes = _UNIT_CODES
+        try:
+            units = Array('B', [codes[symbol] for symbol in symbols])
+        except KeyError:
+            units = Array('B', [codes[symbol] if symbol in codes
+                                else _parse_measure_symbol(text, symbol).value
+                                for text, symbol in zip(texts, symbols)])
+
+        try:
+            values = Array('d', [float(text[:len(text) - len(symbol)])
+                                 for text, symbol in zip(texts, symbols)])
+        except ValueError:
+            for text, symbol in zip(texts, symbols):
+                try:
+                    float(text[:len(text) - len(symbol)])
+                except ValueError:
+                    raise ValueError(f"Invalid measure: {text!r}") from None
+            raise
+        return units, values
+
+    def convert_stream(self,
+                       records: Iterable[tuple[UnitsOfMeasurement, float | int]],
+                       targets: UnitsOfMeasurement | Iterable[UnitsOfMeasurement] | None = None,
+                       batch_size: int = 4096) -> Iterator[tuple[UnitsOfMeasurement, float]]:
+        """ Convert a stream of `(unit, value)` records of many unit types (shortcut to
+        StreamConverter(targets, batch_size).convert(records))
+
+        Args:
+            records (Iterable[tuple[UnitsOfMeasurement, float | int]]): The records
+            targets (UnitsOfMeasurement | Iterable[UnitsOfMeasurement] | None, optional):
+                Unit type of the results, at most one per group. Defaults to the base
+                unit of each group.
+            batch_size (int, optional): Records buffered per micro-batch. Defaults to 4096.
+
+        Returns:
+            Iterator[tuple[UnitsOfMeasurement, float]]: The converted records, in order
+        """
+        return StreamConverter(targets, batch_size).convert(records)
+
+
+class StreamConverter:
+    """Converts streams of `(unit, value)` records mixing many unit types
+
+    Records are read in micro-batches of at most `batch_size` records, so memory stays
+    bounded whatever the stream length. The target unit and the factor of each source
+    unit are resolved once and reused for every later record of that unit, and results
+    come out in the same order as the records.
+    """
+
+    def __init__(self,
+                 targets: UnitsOfMeasurement | Iterable[UnitsOfMeasurement] | None = None,
+                 batch_size: int = 4096) -> None:
+        """ Create a stream converter
+
+        Args:
+            targets (UnitsOfMeasurement | Iterable[UnitsOfMeasurement] | None, optional):
+                Unit type of the results, at most one per group; records of groups without
+                a target raise ConversionError. Defaults to the base unit of each group.
+            batch_size (int, optional): Records buffered per micro-batch. Defaults to 4096.
+
+        Raises:
+            ValueError: If the batch size is not greater than zero or two targets share a group
+        """
+        if batch_size < 1:
+            raise ValueError("The batch size must be greater than zero")
+        if targets is None:
+            targets = (unit for unit, factor in _EXACT_BASE_FACTORS.items() if factor == 1)
+        elif isinstance(targets, (UnitsOfMeasurement, str, int)):
+            targets = (targets,)
+
+        self._group_targets: dict[UnitOf, UnitsOfMeasurement] = {}
+        for target in map(_resolve_unit, targets):
+            if self._group_targets.setdefault(_UNIT_GROUPS[target], target) is not target:
+                raise ValueError(f"More than one target unit for {_UNIT_GROUPS[target].name}")
+
+        self._batch_size = batch_size
+        self._targets: dict[Any, UnitsOfMeasurement] = {}
+        self._factors: dict[Any, float] = {}
+        self._records = 0
+        self._batches = 0
+        self._seconds = 0.0
+
+    def _add_unit(self, unit: UnitsOfMeasurement | str | int) -> None:
+        member = _resolve_unit(unit)
+        try:
+            target = self._group_targets[_UNIT_GROUPS[member]]
+        except KeyError:
+            raise ConversionError(f"No target unit to convert {member.name}") from None
+        self._targets[unit] = target
+        self._factors[unit] = _CONVERSION_FACTORS[member, target]
+
+    def convert_batch(self, batch: list[tuple[UnitsOfMeasurement, float | int]]
+                      ) -> list[tuple[UnitsOfMeasurement, float]]:
+        """ Convert one micro-batch of records
+
+        Args:
+            batch (list[tuple[UnitsOfMeasurement, float | int]]): The records
+
+        Raises:
+            ConversionError: If a record has no target unit in its group
+
+        Returns:
+            list[tuple[UnitsOfMeasurement, float]]: The converted records, in order
+        """
+        start = perf_counter()
+        targets, factors = self._targets, self._factors
+        try:
+            converted = [(targets[unit], value * factors[unit]) for unit, value in batch]
+        except KeyError:
+            for unit, _ in batch:
+                if unit not in factors:
+                    self._add_unit(unit)
+            converted = [(targets[unit], value * factors[unit]) for unit, value in batch]
+        self._seconds += perf_counter() - start
+        self._records += len(batch)
+        self._batches += 1
+        return converted
+
+    def convert_batches(self, records: Iterable[tuple[UnitsOfMeasurement, float | int]]
+                        ) -> Iterator[list[tuple[UnitsOfMeasurement, float]]]:
+        """ Convert a stream of records, one micro-batch at a time
+
+        Args:
+            records (Iterable[tuple[UnitsOfMeasurement, float | int]]): The records
+
+        Yields:
+            list[tuple[UnitsOfMeasurement, float]]: The converted records of each batch
+        """
+        records = iter(records)
+        while batch := list(islice(records, self._batch_size)):
+            yield self.convert_batch(batch)
+
+    def convert(self, records: Iterable[tuple[UnitsOfMeasurement, float | int]]
+                ) -> Iterator[tuple[UnitsOfMeasurement, float]]:
+        """ Convert a stream of records
+
+        Args:
+            records (Iterable[tuple[UnitsOfMeasurement, float | int]]): The records
+
+        Yields:
+            tuple[UnitsOfMeasurement, float]: Each converted record, in order
+        """
+        for batch in self.convert_batches(records):
+            yield from batch
+
+    def metrics(self) -> dict[str, float]:
+        """ Throughput counters, ready for metrics dashboards
+
+        Only the time spent converting is counted, not the time spent reading the
+        records or consuming the results.
+
+        Returns:
+            dict[str, float]: Converted records (`records`), batches (`batches`),
+                conversion time in seconds (`seconds`) and records per second
+                (`records_per_second`)
+        """
+        return {
+            "records": self._records,
+            "batches": self._batches,
+            "seconds": self._seconds,
+            "records_per_second": self._records / self._seconds if self._seconds else 0.0
+        }
+
+    def reset_metrics(self) -> None:
+        """Reset the throughput counters"""
+        self._records = 0
+        self._batches = 0
+        self._seconds = 0.0
+
+
+def _normalize_year(year: int) -> int:
+    """Scale years with less than 4 digits to 4 digits and keep the first 4 digits of longer ones"""
+    if 1000 <= year <= 9999:
+        return year
+    digits = len(str(year))
+    if digits < 4:
+        return year * 10 ** (4 - digits)
+    if digits > 4:
+        return int(str(year)[:4])
+    return year
+
+
+def _normalize_field(value: int, lowest: int, highest: int) -> int:
+    """Keep the first 2 digits of a month, day or time field and clamp it to its range"""
+    if lowest <= value <= highest:
+        return value
+    strfy_value = str(value)
+    if len(strfy_value) > 2:
+        value = int(strfy_value[:2])
+    return min(max(value, lowest), highest)
+
+
+class CalculableDate:  # pylint: disable=too-many-instance-attributes
+    """Calculable date object
+
+    Fields are normalized once, when set, and the `datetime`/`timedelta` built from them
+    are cached until a field changes.
+    """
+    __slots__ = ('_stored_year', '_stored_month', '_stored_day', '_stored_hour',
+                 '_stored_minute', '_stored_second', '_datetime', '_timedelta')
 
     def __init__(self, year: int = 1000, month: int = 1, day: int = 1, hour: int = 0,
                  minute: int = 0, second: int = 0) -> None:
         """Initialize a calculable date object"""
-        self._stored_year = year
-        self._stored_month = month
-        self._stored_day = day
-        self._stored_hour = hour
-        self._stored_minute = minute
-        self._stored_second = second
+        self._stored_year = _normalize_year(year)
+        self._stored_month = _normalize_field(month, 1, 12)
+        self._stored_day = _normalize_field(day, 1, 31)
+        self._stored_hour = _normalize_field(hour, 0, 23)
+        self._stored_minute = _normalize_field(minute, 0, 59)
+        self._stored_second = _normalize_field(second, 0, 59)
+        self._datetime: datetime | None = None
+        self._timedelta: timedelta | None = None
+
+    @classmethod
+    def _from_datetime(cls, date: datetime) -> CalculableDate:
+        """Build an instance from a datetime, reusing it as the cached datetime when equal"""
+        calculable = cls(year=date.year, month=date.month, day=date.day,
+                         hour=date.hour, minute=date.minute, second=date.second)
+        if calculable._stored_year == date.year and not date.microsecond and date.tzinfo is None:
+            calculable._datetime = date
+        return calculable
+
+    def _clear_cache(self) -> None:
+        self._datetime = None
+        self._timedelta = None
 
     def _get_year(self):
         """Get year from object"""
-        strfy_year = str(self._stored_year)
-        match len(strfy_year):
-            case 0:
-                return 1
-            case 1:
-                return self._stored_year * 1000
-            case 2:
-                return self._stored_year * 100
-            case 3:
-                return self._stored_year * 10
-            case 4:
-                return self._stored_year
-            case _ if len(strfy_year) > 4:
-                return int(strfy_year[:4])
+        return self._stored_year
 
     def _set_year(self, year: int):
         """Set year for object"""
-        self._stored_year = year
+        self._stored_year = _normalize_year(year)
+        self._clear_cache()
 
     def _get_month(self):
         """Get month from object """
-        strfy_month = str(self._stored_month)
-        safe_month = self._stored_month
-        match len(strfy_month):
-            case 0:
-                safe_month = 1
-            case _ if len(strfy_month) > 2:
-                safe_month = int(strfy_month[:2])
-
-        if safe_month < 1:
-            safe_month = 1
-        elif safe_month > 12:
-            safe_month = 12
-
-        return safe_month
+        return self._stored_month
 
     def _set_month(self, month: int):
         """Set month for object"""
-        self._stored_month = month
+        self._stored_month = _normalize_field(month, 1, 12)
+        self._clear_cache()
 
     def _get_day(self):
         """Get day from object"""
-        strfy_day = str(self._stored_day)
-        safe_day = self._stored_day
-        match len(strfy_day):
-            case 0:
-                safe_day = 1
-            case _ if len(strfy_day) > 2:
-                safe_day = int(strfy_day[:2])
-
-        if safe_day < 1:
-            safe_day = 1
-        elif safe_day > 31:
-            safe_day = 31
-
-        return safe_day
+        return self._stored_day
 
     def _set_day(self, day: int):
         """Set day for object"""
-        self._stored_day = day
+        self._stored_day = _normalize_field(day, 1, 31)
+        self._clear_cache()
 
     def _get_hour(self):
         """Get hour from object"""
-        strfy_hour = str(self._stored_hour)
-        safe_hour = self._stored_hour
-        match len(strfy_hour):
-            case 0:
-                safe_hour = 0
-            case _ if len(strfy_hour) > 2:
-                safe_hour = int(strfy_hour[:2])
-
-        if safe_hour < 0:
-            safe_hour = 0
-        elif safe_hour > 23:
-            safe_hour = 23
-
-        return safe_hour
+        return self._stored_hour
 
     def _set_hour(self, hour: int):
         """Set hour for object"""
-        self._stored_hour = hour
+        self._stored_hour = _normalize_field(hour, 0, 23)
+        self._clear_cache()
 
     def _get_minute(self):
         """Get minute from object"""
-        strfy_minute = str(self._stored_minute)
-        safe_minute = self._stored_minute
-        match len(strfy_minute):
-            case 0:
-                safe_minute = 0
-            case _ if len(strfy_minute) > 2:
-                safe_minute = int(strfy_minute[:2])
-
-        if safe_minute < 0:
-            safe_minute = 0
-        elif safe_minute > 59:
-            safe_minute = 59
-
-        return safe_minute
+        return self._stored_minute
 
     def _set_minute(self, minute: int):
         """Set minute for object"""
-        self._stored_minute = minute
+        self._stored_minute = _normalize_field(minute, 0, 59)
+        self._clear_cache()
 
     def _get_second(self):
         """Get second from object"""
-        strfy_second = str(self._stored_second)
-        safe_second = self._stored_second
-        match len(strfy_second):
-            case 0:
-                safe_second = 0
-            case _ if len(strfy_second) > 2:
-                safe_second = int(strfy_second[:2])
-
-        if safe_second < 0:
-            safe_second = 0
-        elif safe_second > 59:
-            safe_second = 59
-
-        return safe_second
+        return self._stored_second
 
     def _set_second(self, second: int):
         """Set minute from object"""
-        self._stored_second = second
+        self._stored_second = _normalize_field(second, 0, 59)
+        self._clear_cache()
 
     year = property(_get_year, _set_year)
     month = property(_get_month, _set_month)
@@ -1376,8 +1275,11 @@ class CalculableDate:
         Returns:
             datetime: datetime with current stored values
         """
-        return datetime(year=self.year, month=self.month, day=self.day, hour=self.hour,
-                        minute=self.minute, second=self.second)
+        if self._datetime is None:
+            self._datetime = datetime(year=self._stored_year, month=self._stored_month,
+                                      day=self._stored_day, hour=self._stored_hour,
+                                      minute=self._stored_minute, second=self._stored_second)
+        return self._datetime
 
     def as_timedelta(self) -> timedelta:
         """ Generates a timedelta class with stored values
@@ -1385,7 +1287,354 @@ class CalculableDate:
         Returns:
             timedelta: Stored values in a timedelta instance
         """
-        return timedelta(days=self.day, hours=self.hour, minutes=self.minute, seconds=self.second)
+        if self._timedelta is None:
+            self._timedelta = timedelta(days=self._stored_day, hours=self._stored_hour,
+                                        minutes=self._stored_minute, seconds=self._stored_second)
+        return self._timedelta
+
+
+_date_from_datetime = CalculableDate._from_datetime  # pylint: disable=protected-access
+
+
+class DateDifference(NamedTuple):
+    """Calendar difference between two dates, as computed by `relativedelta(initial, final)`"""
+    years: int
+    months: int
+    days: int
+    hours: int
+    minutes: int
+    seconds: int
+
+
+# Record layout of the batch differences, 9 bytes per pair
+_DIFFERENCE_DTYPE = None if np is None else np.dtype([
+    ('years', np.int32), ('months', np.int8), ('days', np.int8),
+    ('hours', np.int8), ('minutes', np.int8), ('seconds', np.int8)
+])
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+
+def _as_datetime(date: CalculableDate | datetime | int) -> datetime:
+    if isinstance(date, CalculableDate):
+        return date.as_datetime()
+    if isinstance(date, int):
+        return _EPOCH + timedelta(seconds=date)
+    return date
+
+
+def _as_datetime64(dates: Iterable[CalculableDate | datetime | int] | Any) -> Any:
+    """Dates as a `datetime64[s]` array, from datetime64 or epoch seconds arrays or iterables"""
+    if isinstance(dates, np.ndarray):
+        if dates.dtype.kind == 'M':
+            return dates.astype('datetime64[s]')
+        return dates.astype(np.int64).astype('datetime64[s]')
+
+    dates = dates if isinstance(dates, (list, tuple)) else list(dates)
+    types = set(map(type, dates))
+    if types <= {int}:
+        return np.array(dates, dtype=np.int64).astype('datetime64[s]')
+    if not types <= {datetime}:
+        dates = [_as_datetime(date) for date in dates]
+    # Faster than letting NumPy convert each datetime object
+    seconds = [(date.toordinal() - _EPOCH_ORDINAL) * 86400
+               + date.hour * 3600 + date.minute * 60 + date.second for date in dates]
+    return np.array(seconds, dtype=np.int64).astype('datetime64[s]')
+
+
+def _relative_differences(initial: Any, final: Any) -> Any:
+    """ Vectorized `relativedelta(initial, final)` for datetime64[s] arrays
+
+    The month difference is estimated from the calendar months and corrected by one
+    month where `final` shifted by it passes `initial`, as relativedelta does; the rest
+    is split into days, hours, minutes and seconds carrying the sign of the remainder.
+    Everything runs on int64 seconds, with the first day of each month looked up in a
+    table covering the months involved.
+    """
+    if not initial.size:
+        return np.empty(0, dtype=_DIFFERENCE_DTYPE)
+
+    initial_month = initial.astype('datetime64[M]').view(np.int64)
+    final_month = final.astype('datetime64[M]').view(np.int64)
+    initial = initial.view(np.int64)
+    final = final.view(np.int64)
+
+    lowest = min(initial_month.min(), final_month.min()) - 1
+    highest = max(initial_month.max(), final_month.max()) + 2
+    month_starts = np.arange(lowest, highest + 1).astype('datetime64[M]') \
+        .astype('datetime64[D]').view(np.int64) * 86400
+
+    final_offset = final - month_starts[final_month - lowest]
+    final_time = final_offset % 86400
+    final_day = final_offset - final_time
+
+    def shift(months: Any) -> Any:
+        # final + relativedelta(months=months), clipping the day to the end of the month
+        target = final_month + months - lowest
+        month_length = month_starts[target + 1] - month_starts[target]
+        return month_starts[target] + np.minimum(final_day, month_length - 86400) + final_time
+
+    months = initial_month - final_month
+    shifted = shift(months)
+    forward = initial >= final
+    correction = (np.where(forward & (initial < shifted), -1, 0)
+                  + np.where(~forward & (initial > shifted), 1, 0))
+    if correction.any():
+        months += correction
+        shifted = shift(months)
+
+    remainder = initial - shifted
+    time_sign = np.sign(remainder)
+    days, remainder = np.divmod(np.abs(remainder), 86400)
+    hours, remainder = np.divmod(remainder, 3600)
+    minutes, seconds = np.divmod(remainder, 60)
+    month_sign = np.sign(months)
+    years, months = np.divmod(np.abs(months), 12)
+
+    differences = np.empty(len(initial), dtype=_DIFFERENCE_DTYPE)
+    differences['years'] = years * month_sign
+    differences['months'] = months * month_sign
+    differences['days'] = days * time_sign
+    differences['hours'] = hours * time_sign
+    differences['minutes'] = minutes * time_sign
+    differences['seconds'] = seconds * time_sign
+    return differences
+
+
+def _date_difference(rdelta: relativedelta) -> DateDifference:
+    return DateDifference(rdelta.years, rdelta.months, rdelta.days,
+                          rdelta.hours, rdelta.minutes, rdelta.seconds)
+
+
+def _date_dif_text(rdelta: relativedelta | DateDifference) -> str:
+    """PT-BR text of the years, months and days of a difference"""
+    if rdelta.days > 0:
+        dia = f'{(rdelta.days)} dias' if (
+            rdelta.days) > 1 else f'{(rdelta.days)} dia'
+    elif rdelta.days < 0:
+        dia = f'{(rdelta.days)*(-1)} dias'\
+            if (rdelta.days) * (-1) > 1 else f'{(rdelta.days)*(-1)} dia'
+    else:
+        dia = ''
+
+    if rdelta.months > 0:
+        mes = f'{(rdelta.months)} meses' if (
+            rdelta.months) > 1 else f'{(rdelta.months)} mês'
+    elif rdelta.months < 0:
+        mes = f'{(rdelta.months)*(-1)} meses'\
+            if (rdelta.months) * (-1) > 1 else f'{(rdelta.months)*(-1)} mês'
+    else:
+        mes = ''
+
+    if rdelta.years > 0:
+        ano = f'{(rdelta.years)} anos' if (
+            rdelta.years) > 1 else f'{(rdelta.years)} ano'
+    elif rdelta.years < 0:
+        ano = f'{(rdelta.years)*(-1)} anos'\
+            if (rdelta.years) * (-1) > 1 else f'{(rdelta.years)*(-1)} ano'
+    else:
+        ano = ''
+
+    if ano and (mes and dia):
+        sequencia = True
+        texto = ", "
+    elif ano and ((mes and not dia) or (not mes and dia)):
+        sequencia = True
+        texto = " e "
+    else:
+        sequencia = False
+        texto = ""
+
+    # NOSONAR:python:S3358
+    return f'{f"{ano}{texto}" if sequencia else f"{ano}" if ano else ""}\
+{f"{mes} e " if mes and dia else f"{mes}" if mes else ""}{f"{dia}" if dia else ""}'
+
+
+def _date_hour_dif_text(rdelta: relativedelta | DateDifference) -> str:
+    """PT-BR text of the years, months, days, hours, minutes and seconds of a difference"""
+    if rdelta.days > 0:
+        dia = f'{(rdelta.days)} dias' if (
+            rdelta.days) > 1 else f'{(rdelta.days)} dia'
+    elif rdelta.days < 0:
+        dia = f'{(rdelta.days)*(-1)} dias'\
+            if (rdelta.days) * (-1) > 1 else f'{(rdelta.days)*(-1)} dia'
+    else:
+        dia = ''
+
+    if rdelta.months > 0:
+        mes = f'{(rdelta.months)} meses' if (
+            rdelta.months) > 1 else f'{(rdelta.months)} mês'
+    elif rdelta.months < 0:
+        mes = f'{(rdelta.months)*(-1)} meses'\
+            if (rdelta.months) * (-1) > 1 else f'{(rdelta.months)*(-1)} mês'
+    else:
+        mes = ''
+
+    if rdelta.years > 0:
+        ano = f'{(rdelta.years)} anos' if (
+            rdelta.years) > 1 else f'{(rdelta.years)} ano'
+    elif rdelta.years < 0:
+        ano = f'{(rdelta.years)*(-1)} anos'\
+            if (rdelta.years) * (-1) > 1 else f'{(rdelta.years)*(-1)} ano'
+    else:
+        ano = ''
+
+    if rdelta.hours > 0:
+        hora = f'{rdelta.hours} horas' if rdelta.hours > 1 else f'{rdelta.hours} hora'
+    elif rdelta.hours < 0:
+        hora = f'{rdelta.hours*(-1)} horas'\
+            if rdelta.hours * (-1) > 1 else f'{rdelta.hours*(-1)} hora'
+    else:
+        hora = ''
+
+    if rdelta.minutes > 0:
+        minuto = f'{rdelta.minutes} minutos' if rdelta.minutes > 1 else f'{rdelta.minutes}\
+minuto'
+    elif rdelta.minutes < 0:
+        minuto = f'{rdelta.minutes*(-1)} minutos'\
+            if rdelta.minutes * (-1) > 1 else f'{rdelta.minutes*(-1)} minuto'
+    else:
+        minuto = ''
+
+    if rdelta.seconds > 0:
+        segundo = f'{rdelta.seconds} segundos' if rdelta.seconds > 1 else f'{rdelta.seconds}\
+segundo'
+    elif rdelta.seconds < 0:
+        segundo = f'{rdelta.seconds*(-1)} segundos'\
+            if rdelta.seconds * (-1) > 1 else f'{rdelta.seconds*(-1)} segundo'
+    else:
+        segundo = ''
+
+    existentes = []
+    datas = []
+    tempos = []
+    if ano:
+        existentes.append(ano)
+        datas.append(ano)
+    if mes:
+        existentes.append(mes)
+        datas.append(mes)
+    if dia:
+        existentes.append(dia)
+        datas.append(dia)
+    if hora:
+        existentes.append(hora)
+        tempos.append(hora)
+    if minuto:
+        existentes.append(minuto)
+        tempos.append(minuto)
+    if segundo:
+        existentes.append(segundo)
+        tempos.append(segundo)
+
+    if len(tempos) == 1:
+        tempo_simples = True
+        tempo_sequencia = False
+        tempo_texto = ' e '
+    elif len(tempos) == 2:
+        tempo_simples = False
+        tempo_sequencia = True
+        tempo_texto = ' e '
+    elif len(tempos) > 2:
+        tempo_simples = False
+        tempo_sequencia = True
+        tempo_texto = ', '
+    else:
+        tempo_simples = False
+        tempo_sequencia = False
+        tempo_texto = ''
+
+    if len(datas) == 1 and tempo_simples:
+        data_simples = True
+        data_sequencia = False
+        data_texto = ' e '
+    elif len(datas) == 1 and tempo_sequencia:
+        data_simples = True
+        data_sequencia = False
+        data_texto = ', '
+    elif (len(datas) == 2 and tempo_simples) or \
+         (len(datas) > 2 and tempo_sequencia) or \
+         (len(datas) == 2 and tempo_sequencia) or \
+         (len(datas) > 2 and tempo_simples) or \
+         (len(datas) > 2 and not tempos):
+        data_simples = False
+        data_sequencia = True
+        data_texto = ', '
+    elif len(datas) == 2 and not tempos:
+        data_simples = False
+        data_sequencia = True
+        data_texto = ' e '
+    else:
+        data_simples = False
+        data_sequencia = False
+        data_texto = ''
+
+    if len(existentes) > 2:
+        sequencia = True
+        texto = ", "
+    elif len(existentes) == 2:
+        sequencia = True
+        texto = " e "
+    else:
+        sequencia = False
+        texto = ""
+
+    if len(datas) > 0 and len(tempos) > 0:
+        if data_simples and tempo_simples:
+            data = f'{f"{ano}{data_texto}" if ano else ""}\
+{f"{mes}{data_texto}" if mes else ""}\
+{f"{dia}{data_texto}" if dia else ""}'
+            tempo = f'{f"{hora}" if hora else ""}\
+{f"{minuto}" if minuto else ""}\
+{f"{segundo}" if segundo else ""}'
+        elif data_simples and tempo_sequencia:
+            data = f'{f"{ano}, " if ano else ""}\
+{f"{mes}, " if mes else ""}\
+{f"{dia}, " if dia else ""}'
+            # NOSONAR:python:S3358
+            tempo = f'{f"{hora}{tempo_texto}" if hora else ""}\
+{f"{minuto} e " if minuto and segundo else f"{minuto}" if minuto else ""}\
+{f"{segundo}" if segundo else ""}'
+        elif data_sequencia and tempo_simples:
+            # NOSONAR:python:S3358
+            data = f'{f"{ano}{data_texto}" if ano else ""}\
+{f"{mes}{data_texto}" if mes and dia else f"{mes} e " if mes else ""}\
+{f"{dia} e " if dia else ""}'
+            tempo = f'{f"{hora}" if hora else ""}\
+{f"{minuto}" if minuto else ""}\
+{f"{segundo}" if segundo else ""}'
+        elif data_sequencia and tempo_sequencia:
+            data = f'{f"{ano}{data_texto}" if ano else ""}\
+{f"{mes}{data_texto}" if mes else ""}\
+{f"{dia}{data_texto}" if dia else ""}'
+            # NOSONAR:python:S3358
+            tempo = f'{f"{hora}{tempo_texto}" if hora else ""}\
+{f"{minuto} e " if minuto and segundo else f"{minuto}" if minuto else ""}\
+{f"{segundo}" if segundo else ""}'
+        else:
+            data = ''
+            tempo = ''
+
+    elif len(datas) > 0 and len(tempos) == 0:
+        # NOSONAR:python:S3358
+        data = f'{f"{ano}{texto}" if ano and sequencia else f"{ano}" if ano else ""}\
+{f"{mes} e " if mes and dia else f"{mes}" if mes else ""}\
+{f"{dia}" if dia else ""}'
+        tempo = ''
+
+    elif len(datas) == 0 and len(tempos) > 0:
+        data = ''
+        # NOSONAR:python:S3358
+        tempo = f'{f"{hora}{texto}" if hora and sequencia else f"{hora}" if hora else ""}\
+{f"{minuto} e " if minuto and segundo else f"{minuto}" if minuto else ""}\
+{f"{segundo}" if segundo else ""}'
+
+    else:
+        data = ''
+        tempo = ''
+
+    return f'{f"{data}" if data else ""}{f"{tempo}" if tempo else ""}'
 
 
 class DatetimeTools:
@@ -1423,49 +1672,8 @@ class DatetimeTools:
         Returns:
             str: The dif string. Currently only in PT-BR
         """
-        rdelta = relativedelta(data_inicial.as_datetime(),
-                               data_final.as_datetime())
-
-        if rdelta.days > 0:
-            dia = f'{(rdelta.days)} dias' if (
-                rdelta.days) > 1 else f'{(rdelta.days)} dia'
-        elif rdelta.days < 0:
-            dia = f'{(rdelta.days)*(-1)} dias'\
-                if (rdelta.days) * (-1) > 1 else f'{(rdelta.days)*(-1)} dia'
-        else:
-            dia = ''
-
-        if rdelta.months > 0:
-            mes = f'{(rdelta.months)} meses' if (
-                rdelta.months) > 1 else f'{(rdelta.months)} mês'
-        elif rdelta.months < 0:
-            mes = f'{(rdelta.months)*(-1)} meses'\
-                if (rdelta.months) * (-1) > 1 else f'{(rdelta.months)*(-1)} mês'
-        else:
-            mes = ''
-
-        if rdelta.years > 0:
-            ano = f'{(rdelta.years)} anos' if (
-                rdelta.years) > 1 else f'{(rdelta.years)} ano'
-        elif rdelta.years < 0:
-            ano = f'{(rdelta.years)*(-1)} anos'\
-                if (rdelta.years) * (-1) > 1 else f'{(rdelta.years)*(-1)} ano'
-        else:
-            ano = ''
-
-        if ano and (mes and dia):
-            sequencia = True
-            texto = ", "
-        elif ano and ((mes and not dia) or (not mes and dia)):
-            sequencia = True
-            texto = " e "
-        else:
-            sequencia = False
-            texto = ""
-
-        # NOSONAR:python:S3358
-        return f'{f"{ano}{texto}" if sequencia else f"{ano}" if ano else ""}\
-{f"{mes} e " if mes and dia else f"{mes}" if mes else ""}{f"{dia}" if dia else ""}'
+        return _date_dif_text(relativedelta(data_inicial.as_datetime(),
+                                            data_final.as_datetime()))
 
     def calc_date_hour_dif(self, data_inicial: CalculableDate, data_final: CalculableDate) -> str:
         """ Calculates the difference between two dates considering time
@@ -1477,191 +1685,64 @@ class DatetimeTools:
         Returns:
             str: The dif string. Currently only in PT-BR
         """
-        rdelta = relativedelta(data_inicial.as_datetime(),
-                               data_final.as_datetime())
-
-        if rdelta.days > 0:
-            dia = f'{(rdelta.days)} dias' if (
-                rdelta.days) > 1 else f'{(rdelta.days)} dia'
-        elif rdelta.days < 0:
-            dia = f'{(rdelta.days)*(-1)} dias'\
-                if (rdelta.days) * (-1) > 1 else f'{(rdelta.days)*(-1)} dia'
-        else:
-            dia = ''
-
-        if rdelta.months > 0:
-            mes = f'{(rdelta.months)} meses' if (
-                rdelta.months) > 1 else f'{(rdelta.months)} mês'
-        elif rdelta.months < 0:
-            mes = f'{(rdelta.months)*(-1)} meses'\
-                if (rdelta.months) * (-1) > 1 else f'{(rdelta.months)*(-1)} mês'
-        else:
-            mes = ''
-
-        if rdelta.years > 0:
-            ano = f'{(rdelta.years)} anos' if (
-                rdelta.years) > 1 else f'{(rdelta.years)} ano'
-        elif rdelta.years < 0:
-            ano = f'{(rdelta.years)*(-1)} anos'\
-                if (rdelta.years) * (-1) > 1 else f'{(rdelta.years)*(-1)} ano'
-        else:
-            ano = ''
-
-        if rdelta.hours > 0:
-            hora = f'{rdelta.hours} horas' if rdelta.hours > 1 else f'{rdelta.hours} hora'
-        elif rdelta.hours < 0:
-            hora = f'{rdelta.hours*(-1)} horas'\
-                if rdelta.hours * (-1) > 1 else f'{rdelta.hours*(-1)} hora'
-        else:
-            hora = ''
+        return _date_hour_dif_text(relativedelta(data_inicial.as_datetime(),
+                                                 data_final.as_datetime()))
 
-        if rdelta.minutes > 0:
-            minuto = f'{rdelta.minutes} minutos' if rdelta.minutes > 1 else f'{rdelta.minutes}\
-minuto'
-        elif rdelta.minutes < 0:
-            minuto = f'{rdelta.minutes*(-1)} minutos'\
-                if rdelta.minutes * (-1) > 1 else f'{rdelta.minutes*(-1)} minuto'
-        else:
-            minuto = ''
+    def calc_date_difs(self,
+                       datas_iniciais: Iterable[CalculableDate | datetime | int] | Any,
+                       datas_finais: Iterable[CalculableDate | datetime | int] | Any) -> Any:
+        """ Calculates the differences between many pairs of dates at once
 
-        if rdelta.seconds > 0:
-            segundo = f'{rdelta.seconds} segundos' if rdelta.seconds > 1 else f'{rdelta.seconds}\
-segundo'
-        elif rdelta.seconds < 0:
-            segundo = f'{rdelta.seconds*(-1)} segundos'\
-                if rdelta.seconds * (-1) > 1 else f'{rdelta.seconds*(-1)} segundo'
-        else:
-            segundo = ''
-
-        existentes = []
-        datas = []
-        tempos = []
-        if ano:
-            existentes.append(ano)
-            datas.append(ano)
-        if mes:
-            existentes.append(mes)
-            datas.append(mes)
-        if dia:
-            existentes.append(dia)
-            datas.append(dia)
-        if hora:
-            existentes.append(hora)
-            tempos.append(hora)
-        if minuto:
-            existentes.append(minuto)
-            tempos.append(minuto)
-        if segundo:
-            existentes.append(segundo)
-            tempos.append(segundo)
-
-        if len(tempos) == 1:
-            tempo_simples = True
-            tempo_sequencia = False
-            tempo_texto = ' e '
-        elif len(tempos) == 2:
-            tempo_simples = False
-            tempo_sequencia = True
-            tempo_texto = ' e '
-        elif len(tempos) > 2:
-            tempo_simples = False
-            tempo_sequencia = True
-            tempo_texto = ', '
-        else:
-            tempo_simples = False
-            tempo_sequencia = False
-            tempo_texto = ''
-
-        if len(datas) == 1 and tempo_simples:
-            data_simples = True
-            data_sequencia = False
-            data_texto = ' e '
-        elif len(datas) == 1 and tempo_sequencia:
-            data_simples = True
-            data_sequencia = False
-            data_texto = ', '
-        elif (len(datas) == 2 and tempo_simples) or \
-             (len(datas) > 2 and tempo_sequencia) or \
-             (len(datas) == 2 and tempo_sequencia) or \
-             (len(datas) > 2 and tempo_simples) or \
-             (len(datas) > 2 and not tempos):
-            data_simples = False
-            data_sequencia = True
-            data_texto = ', '
-        elif len(datas) == 2 and not tempos:
-            data_simples = False
-            data_sequencia = True
-            data_texto = ' e '
-        else:
-            data_simples = False
-            data_sequencia = False
-            data_texto = ''
-
-        if len(existentes) > 2:
-            sequencia = True
-            texto = ", "
-        elif len(existentes) == 2:
-            sequencia = True
-            texto = " e "
-        else:
-            sequencia = False
-            texto = ""
+        With NumPy installed the differences are computed with vectorized `datetime64`
+        arithmetic instead of one `relativedelta` per pair, with the same results at
+        seconds resolution (microseconds are discarded). Texts are only built when asked
+        for, through `format_date_difs`.
 
-        if len(datas) > 0 and len(tempos) > 0:
-            if data_simples and tempo_simples:
-                data = f'{f"{ano}{data_texto}" if ano else ""}\
-{f"{mes}{data_texto}" if mes else ""}\
-{f"{dia}{data_texto}" if dia else ""}'
-                tempo = f'{f"{hora}" if hora else ""}\
-{f"{minuto}" if minuto else ""}\
-{f"{segundo}" if segundo else ""}'
-            elif data_simples and tempo_sequencia:
-                data = f'{f"{ano}, " if ano else ""}\
-{f"{mes}, " if mes else ""}\
-{f"{dia}, " if dia else ""}'
-                # NOSONAR:python:S3358
-                tempo = f'{f"{hora}{tempo_texto}" if hora else ""}\
-{f"{minuto} e " if minuto and segundo else f"{minuto}" if minuto else ""}\
-{f"{segundo}" if segundo else ""}'
-            elif data_sequencia and tempo_simples:
-                # NOSONAR:python:S3358
-                data = f'{f"{ano}{data_texto}" if ano else ""}\
-{f"{mes}{data_texto}" if mes and dia else f"{mes} e " if mes else ""}\
-{f"{dia} e " if dia else ""}'
-                tempo = f'{f"{hora}" if hora else ""}\
-{f"{minuto}" if minuto else ""}\
-{f"{segundo}" if segundo else ""}'
-            elif data_sequencia and tempo_sequencia:
-                data = f'{f"{ano}{data_texto}" if ano else ""}\
-{f"{mes}{data_texto}" if mes else ""}\
-{f"{dia}{data_texto}" if dia else ""}'
-                # NOSONAR:python:S3358
-                tempo = f'{f"{hora}{tempo_texto}" if hora else ""}\
-{f"{minuto} e " if minuto and segundo else f"{minuto}" if minuto else ""}\
-{f"{segundo}" if segundo else ""}'
-            else:
-                data = ''
-                tempo = ''
+        Args:
+            datas_iniciais (Iterable[CalculableDate | datetime | int] | Any): Initial dates,
+                as a `datetime64` array, an integer array of epoch seconds or an iterable of
+                CalculableDate, naive datetime or epoch seconds
+            datas_finais (Iterable[CalculableDate | datetime | int] | Any): End dates, in
+                any of the same forms
 
-        elif len(datas) > 0 and len(tempos) == 0:
-            # NOSONAR:python:S3358
-            data = f'{f"{ano}{texto}" if ano and sequencia else f"{ano}" if ano else ""}\
-{f"{mes} e " if mes and dia else f"{mes}" if mes else ""}\
-{f"{dia}" if dia else ""}'
-            tempo = ''
+        Raises:
+            ValueError: If there are not as many initial dates as end dates
 
-        elif len(datas) == 0 and len(tempos) > 0:
-            data = ''
-            # NOSONAR:python:S3358
-            tempo = f'{f"{hora}{texto}" if hora and sequencia else f"{hora}" if hora else ""}\
-{f"{minuto} e " if minuto and segundo else f"{minuto}" if minuto else ""}\
-{f"{segundo}" if segundo else ""}'
+        Returns:
+            Any: A structured array with `years`, `months`, `days`, `hours`, `minutes` and
+                `seconds` fields, or a list of DateDifference when NumPy is not installed
+        """
+        if np is None:
+            iniciais = [_as_datetime(data) for data in datas_iniciais]
+            finais = [_as_datetime(data) for data in datas_finais]
+            if len(iniciais) != len(finais):
+                raise ValueError("The number of initial and end dates must be the same")
+            return [_date_difference(relativedelta(inicial.replace(microsecond=0),
+                                                   final.replace(microsecond=0)))
+                    for inicial, final in zip(iniciais, finais)]
+
+        iniciais = _as_datetime64(datas_iniciais)
+        finais = _as_datetime64(datas_finais)
+        if iniciais.shape != finais.shape:
+            raise ValueError("The number of initial and end dates must be the same")
+        return _relative_differences(iniciais.ravel(), finais.ravel())
+
+    def format_date_difs(self,
+                         diferencas: Iterable[Any],
+                         com_horario: bool = False) -> Iterator[str]:
+        """ Builds the texts of differences calculated by `calc_date_difs`, one at a time
 
-        else:
-            data = ''
-            tempo = ''
+        Args:
+            diferencas (Iterable[Any]): Structured array or DateDifference list
+            com_horario (bool, optional): Includes hours, minutes and seconds, as
+                `calc_date_hour_dif` does. Defaults to False, as `calc_date_dif` does.
 
-        return f'{f"{data}" if data else ""}{f"{tempo}" if tempo else ""}'
+        Yields:
+            str: The dif strings. Currently only in PT-BR
+        """
+        texto = _date_hour_dif_text if com_horario else _date_dif_text
+        for diferenca in diferencas:
+            yield texto(DateDifference(*map(int, diferenca)))
 
     def remove_from_date(self,
                          data_inicial: CalculableDate,
@@ -1675,9 +1756,7 @@ segundo'
         Returns:
             CalculableDate: A new CalculableDate with the calculated date
         """
-        date = data_inicial.as_datetime() - data_final.as_timedelta()
-        return CalculableDate(year=date.year, month=date.month, day=date.day,
-                              hour=date.hour, minute=date.minute, second=date.second)
+        return _date_from_datetime(data_inicial.as_datetime() - data_final.as_timedelta())
 
     def add_to_date(self,
                     data_inicial: CalculableDate,
@@ -1691,9 +1770,7 @@ segundo'
         Returns:
             CalculableDate: A new CalculableDate with the calculated date
         """
-        date = data_inicial.as_datetime() + data_final.as_timedelta()
-        return CalculableDate(year=date.year, month=date.month, day=date.day,
-                              hour=date.hour, minute=date.minute, second=date.second)
+        return _date_from_datetime(data_inicial.as_datetime() + data_final.as_timedelta())
 
 
 class ConversionError(Exception):
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+
+from typing import Any, Iterable, List, Optional
+
+
+class _TabelaDigitos(dict):
+    """Tabela do `str.translate` que mantém apenas dígitos decimais.
+
+    Equivale ao `re.sub(r'\\D', '', texto)`: cada caractere é classificado uma única
+    vez e o resultado fica armazenado para as próximas chamadas.
+    """
+
+    def __missing__(self, codigo: int) -> Optional[str]:
+        caractere = chr(codigo)
+        valor = caractere if caractere.isdecimal() else None
+        self[codigo] = valor
+        return valor
+
+
+_TABELA_DIGITOS = _TabelaDigitos({codigo: chr(codigo) for codigo in range(48, 58)})
+
+# Letras ASCII são mantidas em maiúsculas, como no CNPJ alfanumérico
+_TABELA_ALFANUMERICOS = _TabelaDigitos({
+    **_TABELA_DIGITOS,
+    **{codigo: chr(codigo) for codigo in range(65, 91)},
+    **{codigo: chr(codigo - 32) for codigo in range(97, 123)},
+})
+
+
+def apenas_numeros(valor: Any) -> str:
+    """ Remove todos os caracteres que não são dígitos
+
+    Textos que já contêm apenas dígitos são retornados sem nenhuma cópia.
+
+    Args:
+        valor (Any): Valor a ser normalizado, convertido para texto se necessário
+
+    Returns:
+        str: Apenas os dígitos do valor, na mesma ordem
+    """
+    if not isinstance(valor, str):
+        valor = str(valor)
+    if valor.isdecimal():
+        return valor
+    return valor.translate(_TABELA_DIGITOS)
+
+
+def apenas_numeros_lote(valores: Iterable[Any]) -> List[str]:
+    """ Remove os caracteres que não são dígitos de vários valores de uma só vez
+
+    Args:
+        valores (Iterable[Any]): Valores a serem normalizados
+
+    Returns:
+        List[str]: Os valores normalizados, na mesma ordem da entrada
+    """
+    tabela = _TABELA_DIGITOS
+    normalizados = []
+    adicionar = normalizados.append
+
+    for valor in valores:
+        if not isinstance(valor, str):
+            valor = str(valor)
+        adicionar(valor if valor.isdecimal() else valor.translate(tabela))
+
+    return normalizados
+
+
+def apenas_alfanumericos(valor: Any) -> str:
+    """ Remove todos os caracteres que não são dígitos ou letras ASCII
+
+    As letras são convertidas para maiúsculas. Textos que já contêm apenas dígitos
+    são retornados sem nenhuma cópia.
+
+    Args:
+        valor (Any): Valor a ser normalizado, convertido para texto se necessário
+
+    Returns:
+        str: Apenas os dígitos e as letras maiúsculas do valor, na mesma ordem
+    """
+    if not isinstance(valor, str):
+        valor = str(valor)
+    if valor.isdecimal():
+        return valor
+    return valor.translate(_TABELA_ALFANUMERICOS)
+
+
+def apenas_alfanumericos_lote(valores: Iterable[Any]) -> List[str]:
+    """ Remove os caracteres que não são dígitos ou letras ASCII de vários valores
+
+    Args:
+        valores (Iterable[Any]): Valores a serem normalizados
+
+    Returns:
+        List[str]: Os valores normalizados, na mesma ordem da entrada
+    """
+    tabela = _TABELA_ALFANUMERICOS
+    normalizados = []
+    adicionar = normalizados.append
+
+    for valor in valores:
+        if not isinstance(valor, str):
+            valor = str(valor)
+        adicionar(valor if valor.isdecimal() else valor.translate(tabela))
+
+    return normalizados
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import chain, islice
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Sequence
+
+from .cnpj import CNPJ
+from .cpf import CPF
+from .documento import Documento
+
+TIPOS_DOCUMENTO = ('cpf', 'cnpj', 'auto')
+
+
+def _validar_bloco(tipo: str, valores: Sequence[str]) -> List[bool]:
+    """Valida um bloco dentro do processo trabalhador com o kernel vetorizado"""
+    if tipo == 'auto':
+        return Documento().validar_lote(valores)[0]
+    if tipo == 'cnpj':
+        return CNPJ().validar_lote(valores)[0]
+    return CPF().validar_lote(valores)
+
+
+class ValidadorParalelo:
+    """Valida grandes volumes de CPFs ou CNPJs distribuindo blocos entre processos"""
+    tipo: str
+    processos: int
+    tamanho_bloco: int
+
+    def __init__(self, tipo: str = 'cpf', processos: Optional[int] = None,
+                 tamanho_bloco: int = 100000) -> None:
+        """ Cria um validador paralelo
+
+        Args:
+            tipo (str, optional): Tipo de documento, `cpf`, `cnpj` ou
+                `auto` para documentos dos dois tipos misturados. Defaults to 'cpf'.
+            processos (int, optional): Quantidade de processos. Defaults to os.cpu_count().
+            tamanho_bloco (int, optional): Quantidade de documentos enviada a cada processo
+                por vez. Defaults to 100000.
+
+        Raises:
+            ValueError: Se o tipo, os processos ou o tamanho do bloco forem inválidos
+        """
+        if tipo not in TIPOS_DOCUMENTO:
+            raise ValueError(f'Tipo de documento inválido: {tipo}')
+        if processos is not None and processos < 1:
+            raise ValueError('A quantidade de processos deve ser maior que zero.')
+        if tamanho_bloco < 1:
+            raise ValueError('O tamanho do bloco deve ser maior que zero.')
+
+        self.tipo = tipo
+        self.processos = processos or os.cpu_count() or 1
+        self.tamanho_bloco = tamanho_bloco
+
+    def validar_blocos(self,
+                       valores: Iterable[str],
+                       progresso: Optional[Callable[[int, Optional[int]], None]] = None,
+                       executor: Optional[Executor] = None) -> Iterator[List[bool]]:
+        """ Valida os documentos em paralelo, entregando os resultados de cada bloco em ordem
+
+        A entrada é consumida aos poucos e apenas `2 * processos` blocos ficam em
+        processamento ao mesmo tempo, mantendo a memória limitada mesmo para bilhões
+        de documentos.
+
+        Args:
+            valores (Iterable[str]): Documentos a serem validados
+            progresso (Callable[[int, Optional[int]], None], optional): Função chamada
+                após cada bloco com a quantidade já validada e o total, quando conhecido.
+                Defaults to None.
+            executor (Executor, optional): Executor utilizado no lugar de um
+                ProcessPoolExecutor próprio. Defaults to None.
+
+        Yields:
+            List[bool]: Os resultados de cada bloco, na ordem da entrada
+        """
+        total = len(valores) if isinstance(valores, Sequence) else None
+        iterador = iter(valores)
+        contexto = nullcontext(executor) if executor is not None else \
+            ProcessPoolExecutor(max_workers=self.processos)
+
+        with contexto as executor_ativo:
+            pendentes: Deque = deque()
+            processados = 0
+            esgotado = False
+
+            while True:
+                while not esgotado and len(pendentes) < 2 * self.processos:
+                    bloco = list(islice(iterador, self.tamanho_bloco))
+                    if bloco:
+                        pendentes.append(executor_ativo.submit(_validar_bloco, self.tipo, bloco))
+                    else:
+                        esgotado = True
+
+                if not pendentes:
+                    return
+
+                resultado = pendentes.popleft().result()
+                processados += len(resultado)
+                if progresso is not None:
+                    progresso(processados, total)
+                yield resultado
+
+    def validar(self,
+                valores: Iterable[str],
+                progresso: Optional[Callable[[int, Optional[int]], None]] = None,
+                executor: Optional[Executor] = None) -> List[bool]:
+        """ Valida os documentos em paralelo e reúne todos os resultados em ordem
+
+        Args:
+            valores (Iterable[str]): Documentos a serem validados
+            progresso (Callable[[int, Optional[int]], None], optional): Função chamada
+                após cada bloco com a quantidade já validada e o total, quando conhecido.
+                Defaults to None.
+            executor (Executor, optional): Executor utilizado no lugar de um
+                ProcessPoolExecutor próprio. Defaults to None.
+
+        Returns:
+            List[bool]: `True` para cada documento válido, na mesma ordem da entrada
+        """
+        return list(chain.from_iterable(self.validar_blocos(valores, progresso, executor)))
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2020 Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+Created by: Gabriel Menezes de Antonio (TR0NZ0D)
+"""
+
+import argparse
+import codecs
+import csv
+import mmap
+from contextlib import contextmanager
+from itertools import islice
+from os import PathLike
+from typing import Iterator, List, Optional, Sequence
+
+from .cnpj import CNPJ
+from .cpf import CPF
+from .documento import Documento
+
+TIPOS_DOCUMENTO = ('cpf', 'cnpj', 'auto')
+FORMATOS_ARQUIVO = ('csv', 'linhas')
+
+
+@contextmanager
+def _linhas_binarias(caminho) -> Iterator[Iterator[bytes]]:
+    """Itera as linhas do arquivo mapeado em memória, ou em buffer quando não for possível"""
+    with open(caminho, 'rb') as arquivo:
+        try:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Arquivos vazios, pipes e dispositivos não podem ser mapeados
+            yield iter(arquivo)
+            return
+
+        with mapa:
+            yield iter(mapa.readline, b'')
+
+
+@contextmanager
+def _abrir_saida(caminho, encoding: str):
+    if caminho is None:
+        yield None
+        return
+
+    with open(caminho, 'w', encoding=encoding, newline='') as arquivo:
+        yield arquivo
+
+
+class ResumoValidacao:
+    """Contadores de uma validação de arquivo"""
+    total: int
+    validos: int
+    invalidos: int
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.validos = 0
+        self.invalidos = 0
+
+    def __repr__(self) -> str:
+        return f'ResumoValidacao(total={self.total}, validos={self.validos}, \
+invalidos={self.invalidos})'
+
+
+class ValidadorArquivo:
+    """Valida em fluxo os CPFs ou CNPJs de uma coluna de arquivos CSV ou de linhas"""
+    tipo: str
+    coluna: int | str
+    formato: str
+    tamanho_lote: int
+    delimitador: str
+    cabecalho: bool
+    encoding: str
+
+    def __init__(self,
+                 tipo: str = 'cpf',
+                 coluna: int | str = 0,
+                 *,
+                 formato: str = 'csv',
+                 tamanho_lote: int = 50000,
+                 delimitador: str = ',',
+                 cabecalho: bool = True,
+                 encoding: str = 'utf-8') -> None:
+        """ Cria um validador de arquivos
+
+        Args:
+            tipo (str, optional): Tipo de documento, `cpf`, `cnpj` ou
+                `auto` para colunas com os dois tipos misturados. Defaults to 'cpf'.
+            coluna (int | str, optional): Índice ou nome da coluna com o documento.
+                Defaults to 0.
+            formato (str, optional): `csv` ou `linhas` (um documento por linha).
+                Defaults to 'csv'.
+            tamanho_lote (int, optional): Quantidade de linhas validadas por vez, limita
+                a memória utilizada. Defaults to 50000.
+            delimitador (str, optional): Delimitador do CSV. Defaults to ','.
+            cabecalho (bool, optional): Se a primeira linha do CSV é o cabeçalho.
+                Defaults to True.
+            encoding (str, optional): Codificação do arquivo. Defaults to 'utf-8'.
+
+        Raises:
+            ValueError: Se o tipo, o formato, o tamanho do lote ou a coluna forem inválidos
+        """
+        if tipo not in TIPOS_DOCUMENTO:
+            raise ValueError(f'Tipo de documento inválido: {tipo}')
+        if formato not in FORMATOS_ARQUIVO:
+            raise ValueError(f'Formato de arquivo inválido: {formato}')
+        if tamanho_lote < 1:
+            raise ValueError('O tamanho do lote deve ser maior que zero.')
+        if isinstance(coluna, str) and (formato != 'csv' or not cabecalho):
+            raise ValueError('Colunas por nome exigem um CSV com cabeçalho.')
+
+        self.tipo = tipo
+        self.coluna = coluna
+        self.formato = formato
+        self.tamanho_lote = tamanho_lote
+        self.delimitador = delimitador
+        self.cabecalho = cabecalho
+        self.encoding = encoding
+
+    def _validar_lote(self, documentos: List[str]) -> List[bool]:
+        if self.tipo == 'auto':
+            return Documento().validar_lote(documentos)[0]
+        if self.tipo == 'cnpj':
+            return CNPJ().validar_lote(documentos)[0]
+        return CPF().validar_lote(documentos)
+
+    def _linhas(self, linhas: Iterator[str]) -> Iterator[List[str]]:
+        if self.formato == 'linhas':
+            return ([linha.rstrip('\r\n')] for linha in linhas)
+        return csv.reader(linhas, delimiter=self.delimitador)
+
+    def validar(self,
+                entrada: str | PathLike,
+                saida_validos: Optional[str | PathLike] = None,
+                saida_invalidos: Optional[str | PathLike] = None) -> ResumoValidacao:
+        """ Valida o arquivo em lotes, separando as linhas válidas e inválidas
+
+        O arquivo é lido em fluxo, mapeado em memória quando possível, de modo que
+        a memória utilizada depende apenas do tamanho do lote.
+
+        Args:
+            entrada (str | PathLike): Caminho do arquivo a ser validado
+            saida_validos (str | PathLike, optional): Arquivo que recebe as linhas válidas.
+                Defaults to None.
+            saida_invalidos (str | PathLike, optional): Arquivo que recebe as linhas
+                inválidas. Defaults to None.
+
+        Raises:
+            ValueError: Se a coluna informada não existir no cabeçalho
+
+        Returns:
+            ResumoValidacao: Contadores de linhas totais, válidas e inválidas
+        """
+        resumo = ResumoValidacao()
+
+        with _linhas_binarias(entrada) as linhas_binarias, \
+                _abrir_saida(saida_validos, self.encoding) as arquivo_validos, \
+                _abrir_saida(saida_invalidos, self.encoding) as arquivo_invalidos:
+            linhas = self._linhas(codecs.iterdecode(linhas_binarias, self.encoding))
+            escritor_validos = self._escritor(arquivo_validos)
+            escritor_invalidos = self._escritor(arquivo_invalidos)
+
+            indice = self.coluna
+            if self.formato == 'csv' and self.cabecalho:
+                cabecalho = next(linhas, None)
+                if cabecalho is not None:
+                    indice = self._indice_coluna(cabecalho)
+                    for escritor in (escritor_validos, escritor_invalidos):
+                        if escritor is not None:
+                            escritor.writerow(cabecalho)
+
+            while lote := list(islice(linhas, self.tamanho_lote)):
+                documentos = [linha[indice] if len(linha) > indice else '' for linha in lote]
+                resultados = self._validar_lote(documentos)
+
+                for linha, valido in zip(lote, resultados):
+                    escritor = escritor_validos if valido else escritor_invalidos
+                    if escritor is not None:
+                        escritor.writerow(linha)
+
+                validos = sum(resultados)
+                resumo.total += len(lote)
+                resumo.validos += validos
+                resumo.invalidos += len(lote) - validos
+
+        return resumo
+
+    def _indice_coluna(self, cabecalho: List[str]) -> int:
+        if isinstance(self.coluna, int):
+            return self.coluna
+        try:
+            return cabecalho.index(self.coluna)
+        except ValueError as error:
+            raise ValueError(f'Coluna não encontrada no cabeçalho: {self.coluna}') from error
+
+    def _escritor(self, arquivo):
+        if arquivo is None:
+            return None
+        if self.formato == 'linhas':
+            return _EscritorLinhas(arquivo)
+        return csv.writer(arquivo, delimiter=self.delimitador)
+
+
+class _EscritorLinhas:
+    """Escritor com a mesma interface do csv.writer para arquivos de um documento por linha"""
+
+    def __init__(self, arquivo) -> None:
+        self.arquivo = arquivo
+
+    def writerow(self, linha: List[str]) -> None:
+        """Escreve a linha seguida de uma quebra de linha"""
+        self.arquivo.write(f'{linha[0]}\n')
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Ponto de entrada da linha de comando do validador de arquivos"""
+    parser = argparse.ArgumentParser(
+        prog='tr0nz0d-validar',
+        description='Valida em fluxo os CPFs ou CNPJs de um arquivo CSV ou de linhas.')
+    parser.add_argument('entrada', help='Arquivo a ser validado')
+    parser.add_argument('--tipo', choices=TIPOS_DOCUMENTO, default='cpf',
+                        help='Tipo de documento da coluna')
+    parser.add_argument('--coluna', default='0',
+                        help='Índice ou nome da coluna com o documento')
+    parser.add_argument('--formato', choices=FORMATOS_ARQUIVO, default='csv',
+                        help='Formato do arquivo de entrada')
+    parser.add_argument('--validos', help='Arquivo de saída para as linhas válidas')
+    parser.add_argument('--invalidos', help='Arquivo de saída para as linhas inválidas')
+    parser.add_argument('--lote', type=int, default=50000,
+                        help='Quantidade de linhas validadas por vez')
+    parser.add_argument('--delimitador', default=',', help='Delimitador do CSV')
+    parser.add_argument('--sem-cabecalho', action='store_true',
+                        help='Indica que o CSV não possui cabeçalho')
+    parser.add_argument('--encoding', default='utf-8', help='Codificação do arquivo')
+    args = parser.parse_args(argv)
+
+    coluna: int | str = int(args.coluna) if args.coluna.isdigit() else args.coluna
+
+    try:
+        validador = ValidadorArquivo(tipo=args.tipo,
+                                     coluna=coluna,
+                                     formato=args.formato,
+                                     tamanho_lote=args.lote,
+                                     delimitador=args.delimitador,
+                                     cabecalho=not args.sem_cabecalho,
+                                     encoding=args.encoding)
+        resumo = validador.validar(args.entrada, args.validos, args.invalidos)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    print(f'Total: {resumo.total} | Válidos: {resumo.validos} | Inválidos: {resumo.invalidos}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())